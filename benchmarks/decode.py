@@ -0,0 +1,78 @@
+"""Decode time of the installed JSON backends on representative response bodies.
+
+    python benchmarks/decode.py [--repeat 5] [--output results.json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ensembl.decode import Decoder, msgspec, orjson  # noqa: E402
+from fixtures import GENERATORS, load  # noqa: E402
+
+
+def _backends():
+    backends = {"json": Decoder("json")}
+    if orjson is not None:
+        backends["orjson"] = Decoder("orjson")
+    if msgspec is not None:
+        backends["msgspec"] = Decoder("msgspec")
+        backends["msgspec typed"] = Decoder("msgspec", types={"": _vep_type()})
+    return backends
+
+
+def _vep_type():
+    class Consequence(msgspec.Struct):
+        transcript_id: str
+        gene_id: str
+        biotype: str
+        consequence_terms: list[str]
+        impact: str
+        sift_score: float | None = None
+        polyphen_score: float | None = None
+
+    class VEPResult(msgspec.Struct):
+        input: str
+        seq_region_name: str
+        start: int
+        end: int
+        most_severe_consequence: str
+        transcript_consequences: list[Consequence] = []
+
+    return list[VEPResult]
+
+
+def best(call, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+    results = []
+    for fixture in GENERATORS:
+        body = load(fixture)
+        for name, decoder in _backends().items():
+            if name == "msgspec typed" and fixture != "vep":
+                continue
+            seconds = best(lambda: decoder.decode(body), args.repeat)
+            results.append({"fixture": fixture, "backend": name, "bytes": len(body), "seconds": seconds, "mb_per_s": len(body) / seconds / 1e6})
+            print(f"{fixture:18} {name:14} {len(body) / 1e6:7.2f} MB {seconds * 1e3:9.2f} ms {len(body) / seconds / 1e6:9.1f} MB/s")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=1)
+
+
+if __name__ == "__main__":
+    main()
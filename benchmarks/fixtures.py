@@ -0,0 +1,107 @@
+"""Synthetic responses with the shape, key set and value mix of real Ensembl REST responses, for offline benchmarks.
+They are generated rather than recorded so the repository carries no large data files; a real recorded response can be
+dropped into benchmarks/recorded/<name>.json and is used instead of the generated one."""
+import json
+import os
+import random
+
+RECORDED = os.path.join(os.path.dirname(__file__), "recorded")
+
+CONSEQUENCES = ["missense_variant", "synonymous_variant", "intron_variant", "upstream_gene_variant", "downstream_gene_variant",
+                "splice_region_variant", "3_prime_UTR_variant", "5_prime_UTR_variant", "stop_gained", "frameshift_variant"]
+BIOTYPES = ["protein_coding", "lncRNA", "processed_pseudogene", "nonsense_mediated_decay", "retained_intron", "miRNA"]
+
+
+def vep(count, seed=0):
+    """vep/:species/id POST response for `count` variants"""
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        start = rng.randint(1, 248_000_000)
+        results.append({
+            "input": f"rs{1000 + i}", "id": f"rs{1000 + i}", "seq_region_name": str(rng.randint(1, 22)), "start": start, "end": start,
+            "strand": 1, "allele_string": "C/T", "assembly_name": "GRCh38", "most_severe_consequence": rng.choice(CONSEQUENCES),
+            "transcript_consequences": [{
+                "transcript_id": f"ENST{rng.randint(0, 10 ** 11):011d}", "gene_id": f"ENSG{rng.randint(0, 10 ** 11):011d}",
+                "gene_symbol": f"GENE{rng.randint(1, 20000)}", "gene_symbol_source": "HGNC", "hgnc_id": f"HGNC:{rng.randint(1, 50000)}",
+                "biotype": rng.choice(BIOTYPES), "consequence_terms": rng.sample(CONSEQUENCES, rng.randint(1, 2)),
+                "impact": rng.choice(["HIGH", "MODERATE", "LOW", "MODIFIER"]), "variant_allele": "T", "strand": rng.choice([1, -1]),
+                "cdna_start": rng.randint(1, 5000), "cdna_end": rng.randint(1, 5000), "cds_start": rng.randint(1, 3000),
+                "cds_end": rng.randint(1, 3000), "protein_start": rng.randint(1, 1000), "protein_end": rng.randint(1, 1000),
+                "amino_acids": "R/W", "codons": "Cgg/Tgg", "sift_prediction": "deleterious", "sift_score": round(rng.random(), 3),
+                "polyphen_prediction": "probably_damaging", "polyphen_score": round(rng.random(), 3), "distance": rng.randint(0, 5000),
+            } for _ in range(rng.randint(1, 12))],
+            "colocated_variants": [{
+                "id": f"rs{1000 + i}", "start": start, "end": start, "strand": 1, "allele_string": "C/T", "seq_region_name": "1",
+                "minor_allele": "T", "minor_allele_freq": round(rng.random() / 2, 4), "clin_sig": ["benign"],
+                "frequencies": {"T": {"afr": rng.random(), "amr": rng.random(), "eas": rng.random(), "eur": rng.random(), "sas": rng.random()}},
+            }],
+        })
+    return results
+
+
+def genomes_division(count, seed=0):
+    """info/genomes/division/:division response listing `count` genomes"""
+    rng = random.Random(seed)
+    return [{
+        "name": f"species_{i}", "display_name": f"Species {i}", "division": "EnsemblBacteria", "taxonomy_id": rng.randint(1, 10 ** 7),
+        "species_taxonomy_id": rng.randint(1, 10 ** 7), "assembly_name": f"ASM{rng.randint(1, 10 ** 6)}v1",
+        "assembly_accession": f"GCA_{rng.randint(0, 10 ** 9):09d}.1", "assembly_level": rng.choice(["chromosome", "contig", "scaffold"]),
+        "base_count": rng.randint(10 ** 5, 10 ** 7), "genebuild": "2021-02-EnsemblBacteria", "dbname": f"bacteria_{i % 300}_collection_core_56_109_1",
+        "strain": None, "serotype": None, "has_variations": 0, "has_peptide_compara": 0, "has_genome_alignments": 0, "has_other_alignments": 1,
+        "is_reference": 0, "url_name": f"Species_{i}", "data_release": "2023-04-21", "release_date": "2023-04-21",
+    } for i in range(count)]
+
+
+def lookup(count, seed=0):
+    """lookup/id POST response with expand=1 for `count` genes"""
+    rng = random.Random(seed)
+    genes = {}
+    for i in range(count):
+        gene_id, start, strand = f"ENSG{i:011d}", rng.randint(1, 10 ** 8), rng.choice([1, -1])
+        transcripts = []
+        for t in range(rng.randint(1, 8)):
+            exons, position = [], start
+            for e in range(rng.randint(1, 12)):
+                position += rng.randint(100, 5000)
+                exons.append({"id": f"ENSE{i:06d}{t:02d}{e:03d}", "object_type": "Exon", "species": "homo_sapiens", "db_type": "core",
+                              "assembly_name": "GRCh38", "seq_region_name": "7", "start": position, "end": position + rng.randint(50, 400),
+                              "strand": strand, "version": 1})
+            transcripts.append({"id": f"ENST{i:06d}{t:05d}", "object_type": "Transcript", "Parent": gene_id, "biotype": rng.choice(BIOTYPES),
+                                "display_name": f"GENE{i}-{200 + t}", "species": "homo_sapiens", "db_type": "core", "assembly_name": "GRCh38",
+                                "seq_region_name": "7", "start": start, "end": position + 400, "strand": strand, "version": 2,
+                                "is_canonical": int(t == 0), "logic_name": "ensembl_havana_transcript_homo_sapiens", "source": "ensembl_havana",
+                                "Exon": exons})
+        genes[gene_id] = {"id": gene_id, "object_type": "Gene", "species": "homo_sapiens", "db_type": "core", "assembly_name": "GRCh38",
+                          "biotype": "protein_coding", "display_name": f"GENE{i}", "description": f"gene {i} [Source:HGNC Symbol;Acc:HGNC:{i}]",
+                          "seq_region_name": "7", "start": start, "end": max(t["end"] for t in transcripts), "strand": strand, "version": 14,
+                          "canonical_transcript": f"{transcripts[0]['id']}.2", "logic_name": "ensembl_havana_gene_homo_sapiens",
+                          "source": "ensembl_havana", "Transcript": transcripts}
+    return genes
+
+
+def overlap(count, seed=0):
+    """overlap/region response with `count` gene features"""
+    rng = random.Random(seed)
+    return [{"id": f"ENSG{i:011d}", "gene_id": f"ENSG{i:011d}", "feature_type": "gene", "biotype": rng.choice(BIOTYPES),
+             "seq_region_name": "7", "start": (start := rng.randint(1, 10 ** 8)), "end": start + rng.randint(500, 200_000),
+             "strand": rng.choice([1, -1]), "version": 3, "assembly_name": "GRCh38", "source": "ensembl_havana",
+             "logic_name": "ensembl_havana_gene_homo_sapiens", "external_name": f"GENE{i}", "description": f"gene {i}",
+             "canonical_transcript": f"ENST{i:011d}.1"} for i in range(count)]
+
+
+GENERATORS = {
+    "vep": lambda: vep(1000),
+    "genomes_division": lambda: genomes_division(20000),
+    "lookup": lambda: lookup(500),
+    "overlap": lambda: overlap(5000),
+}
+
+
+def load(name):
+    """Body of fixture `name` as bytes: the recorded response if there is one, else the generated one"""
+    path = os.path.join(RECORDED, f"{name}.json")
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            return file.read()
+    return json.dumps(GENERATORS[name]()).encode()
@@ -0,0 +1,210 @@
+"""Local stand-in for the Ensembl REST server, serving benchmark fixtures with configurable latency, rate limiting and
+injected 429 / 5xx errors.
+
+    python benchmarks/mock_server.py --port 8000 --latency 0.05 --rate 15 --error-rate 0.01
+
+or in-process:
+
+    with MockServer(latency=0.01) as server:
+        ensembl = Ensembl(); ensembl.server = server.url
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixtures import genomes_division, lookup, overlap, vep  # noqa: E402
+
+
+# Sequence lengths info/assembly/:species/:region_name reports
+LENGTHS = {"7": 159_345_973, "X": 156_040_895}
+
+
+class Fixtures:
+    """Pools of generated records the handlers draw responses from"""
+
+    def __init__(self, seed=0):
+        self.vep = vep(500, seed)
+        self.genes = list(lookup(200, seed).values())
+        self.overlap = overlap(20000, seed)
+        self.genomes = genomes_division(20000, seed)
+
+    def variant(self, item):
+        record = dict(self.vep[hash(item) % len(self.vep)])
+        record["input"] = record["id"] = item
+        return record
+
+    def gene(self, item):
+        return {**self.genes[hash(item) % len(self.genes)], "id": item}
+
+
+class BadRequest(Exception):
+    """Answered with a 400 and the server's {"error": ...} body"""
+
+
+def _route(fixtures, method, path, body):
+    """Return the decoded response of one request, or None for an unknown endpoint.
+    Raises BadRequest for a vep/:species/id POST listing an ID that does not start with "rs", as the server rejects the whole body."""
+    parts = path.strip("/").split("/")
+    match method, parts:
+        case "GET", ["info", "ping"]:
+            return {"ping": 1}
+        case "GET", ["info", "data"]:
+            return {"releases": [110]}
+        case "GET", ["info", "rest"]:
+            return {"release": "15.6"}
+        case "GET", ["info", "assembly", _, name] if name in LENGTHS:
+            return {"length": LENGTHS[name], "coordinate_system": "chromosome", "assembly_name": "GRCh38", "is_chromosome": 1}
+        case "GET", ["info", "genomes", "division", _]:
+            return fixtures.genomes
+        case "GET", ["lookup", "id", id]:
+            return fixtures.gene(id)
+        case "POST", ["lookup", "id"]:
+            return {id: fixtures.gene(id) for id in body["ids"]}
+        case "GET", ["overlap", "region", _, _]:
+            return fixtures.overlap
+        case "GET", ["vep", _, "id", id]:
+            return [fixtures.variant(id)]
+        case "POST", ["vep", _, "id"]:
+            invalid = [id for id in body["ids"] if not id.startswith("rs")]
+            if invalid:
+                raise BadRequest(f"No variant found with ID '{invalid[0]}'")
+            return [fixtures.variant(id) for id in body["ids"]]
+        case "POST", ["vep", _, "hgvs" | "region"]:
+            return [fixtures.variant(item) for item in next(iter(body.values()))]
+    return None
+
+
+class MockServer:
+    """Threaded HTTP server answering the main endpoints from generated fixtures.
+    Every response waits `latency` seconds (plus up to `jitter`); beyond `rate` requests per second, requests get a 429
+    with a Retry-After of `retry_after` seconds; and a fraction `error_rate` of requests fails with a 429, 500, 502, 503
+    or 504 picked at random. The next requests get the statuses queued in `failures` first.
+    `requests` and `bytes` count what was served."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, rate=None, error_rate=0.0, seed=0, retry_after=1):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate = rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.failures = deque()
+        self.fixtures = Fixtures(seed)
+        self.requests = 0
+        self.bytes = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = (0, 0)  # (second, requests in it)
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _admit(self):
+        """Return the error status the current request gets, if any, and the requests left in this second"""
+        with self._lock:
+            self.requests += 1
+            second = int(time.time())
+            count = self._window[1] + 1 if self._window[0] == second else 1
+            self._window = (second, count)
+            if self.failures:
+                return self.failures.popleft(), None
+            if self.rate is not None and count > self.rate:
+                return 429, 0
+            if self._random.random() < self.error_rate:
+                return self._random.choice([429, 500, 502, 503, 504]), None
+            return None, None if self.rate is None else self.rate - count
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                time.sleep(server.latency + server.jitter * server._random.random())
+                status, remaining = server._admit()
+                headers = {}
+                if remaining is not None:
+                    headers = {"X-RateLimit-Limit": str(server.rate), "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": "1"}
+                if status == 429:
+                    headers["Retry-After"] = str(server.retry_after)
+                result = None
+                if status is None:
+                    try:
+                        result = _route(server.fixtures, method, self.path.split("?")[0], body)
+                        status = 200 if result is not None else 404
+                    except BadRequest as error:
+                        result, status = {"error": str(error)}, 400
+                payload = json.dumps(result if result is not None else {"error": f"status {status}"}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+                with server._lock:
+                    server.bytes += len(payload)
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.requests = self.bytes = 0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the Ensembl REST server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate", type=float)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    server = MockServer(args.host, args.port, args.latency, args.jitter, args.rate, args.error_rate)
+    print(f"Serving on {server.url}")
+    server._httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
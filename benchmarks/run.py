@@ -0,0 +1,182 @@
+"""Offline benchmarks of the client against the local mock server: requests/s, p50/p99 call latency, bytes decoded/s and
+peak RSS for the sync, batched, concurrent, streaming, throttled and async modes. Each scenario runs in a fresh process
+so its peak RSS is its own. Results are written as JSON, by default to benchmarks/results/<commit>.json.
+
+    python benchmarks/run.py [--latency 0.002] [--scenario sync --scenario batched] [--compare benchmarks/results/<old>.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+sys.path.insert(0, HERE)
+
+from ensembl import AsyncEnsembl, Ensembl, aiohttp  # noqa: E402
+from ensembl.ratelimit import RateLimiter  # noqa: E402
+from ensembl.retry import RetryPolicy  # noqa: E402
+from mock_server import MockServer  # noqa: E402
+
+IDS = [f"ENSG{i:011d}" for i in range(2000)]
+VARIANTS = [f"rs{i}" for i in range(2000)]
+
+
+def _client(server, cls=Ensembl, **options):
+    client = cls(rate_limiter=RateLimiter(rate=100_000), **options)
+    client.server = server.url
+    return client
+
+
+def _timed(calls):
+    """Run the calls one after another, returning their latencies"""
+    latencies = []
+    for call in calls:
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def sync(server):
+    client = _client(server)
+    return _timed(lambda id=id: client.lookup_id(id) for id in IDS[:200])
+
+
+def batched(server):
+    client = _client(server)
+    return _timed(lambda: client.lookup_id(IDS) for _ in range(5))
+
+
+def concurrent(server):
+    client = _client(server, max_workers=8)
+    latencies = _timed(lambda: client.vep_id(VARIANTS) for _ in range(5))
+    with ThreadPoolExecutor(8) as executor:
+        latencies += list(executor.map(lambda id: _timed([lambda: client.lookup_id(id)])[0], IDS[:400]))
+    client.close()
+    return latencies
+
+
+def streaming(server):
+    client = _client(server)
+    return _timed(lambda: sum(1 for _ in client.iter_overlap_region("human", "7:1-100000000")) for _ in range(5))
+
+
+def throttled(server):
+    server.rate, server.error_rate = 50, 0.02
+    client = _client(server, max_workers=4, retry=RetryPolicy(backoff=0.05, max_backoff=1.0))
+    client.rate_limiter = RateLimiter(rate=100)
+    return _timed(lambda id=id: client.lookup_id(id) for id in IDS[:150])
+
+
+def concurrent_async(server):
+    async def run():
+        async with _client(server, AsyncEnsembl, max_workers=8) as client:
+            async def timed(id):
+                started = time.perf_counter()
+                await client.lookup_id(id)
+                return time.perf_counter() - started
+            latencies = list(await asyncio.gather(*(timed(id) for id in IDS[:400])))
+            started = time.perf_counter()
+            await client.vep_id(VARIANTS)
+            return latencies + [time.perf_counter() - started]
+    return asyncio.run(run())
+
+
+SCENARIOS = {
+    "sync": sync,
+    "batched": batched,
+    "concurrent": concurrent,
+    "streaming": streaming,
+    "throttled": throttled,
+    "async": concurrent_async,
+}
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def measure(name, latency):
+    """Run one scenario against a fresh mock server in this process and return its metrics"""
+    with MockServer(latency=latency) as server:
+        server.reset()
+        started = time.perf_counter()
+        latencies = SCENARIOS[name](server)
+        seconds = time.perf_counter() - started
+    return {
+        "calls": len(latencies),
+        "requests": server.requests,
+        "seconds": seconds,
+        "requests_per_s": server.requests / seconds,
+        "p50_ms": percentile(latencies, 0.5) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "bytes": server.bytes,
+        "mb_decoded_per_s": server.bytes / seconds / 1e6,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1e6 if sys.platform == "darwin" else 1e3),
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results, baseline):
+    """Print the relative change of every metric against a previous results file"""
+    for name, metrics in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        changes = ", ".join(f"{metric} {(value - old[metric]) / old[metric]:+.1%}" for metric, value in metrics.items()
+                            if metric in ("requests_per_s", "p50_ms", "p99_ms", "mb_decoded_per_s", "peak_rss_mb") and old.get(metric))
+        print(f"{name:12} vs {baseline['commit']}: {changes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds the mock server waits before every response")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS))
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(measure(args.child, args.latency)))
+        return
+    results = {}
+    for name in args.scenario or list(SCENARIOS):
+        if name == "async" and aiohttp is None:
+            print("async      skipped: aiohttp is not installed")
+            continue
+        child = subprocess.run([sys.executable, __file__, "--child", name, "--latency", str(args.latency)], capture_output=True, text=True)
+        if child.returncode:
+            print(f"{name:12} failed:\n{child.stderr}")
+            continue
+        results[name] = metrics = json.loads(child.stdout)
+        print(f"{name:12} {metrics['requests_per_s']:9.1f} req/s  p50 {metrics['p50_ms']:8.2f} ms  p99 {metrics['p99_ms']:8.2f} ms  "
+              f"{metrics['mb_decoded_per_s']:7.2f} MB/s  peak RSS {metrics['peak_rss_mb']:7.1f} MB")
+    commit = _commit()
+    report = {"commit": commit, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+              "platform": platform.platform(), "latency": args.latency, "results": results}
+    output = args.output or os.path.join(HERE, "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(report, file, indent=1)
+    print(f"Results written to {output}")
+    if args.compare:
+        with open(args.compare) as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
-from collections import defaultdict
 from functools import singledispatch
 from urllib.parse import urljoin
 
 import requests
 import pprint
+from requests.adapters import HTTPAdapter
 
-headers = defaultdict(str)
+from retries import retry
+
+# Request headers of each response format; never modified, so concurrent calls cannot race on them
+headers = {
+    "json": {"Content-Type": "application/json"},
+    "xml": {"Content-Type": "text/xml"},
+}
 assembly="GRCh38"
 scheme="http"
 match assembly, scheme:
@@ -18,28 +24,42 @@ match assembly, scheme:
     case "GRCh37", "https":
         server = "https://grch37.rest.ensembl.org"
 
-def get(endpoint, params, format):
+# (connect, read) timeout in seconds of every request
+timeout = (3.05, 60)
+
+def _session(pool_connections=10, pool_maxsize=10, pool_block=False):
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# One keep-alive session shared by every call, so connections are reused instead of being set up for each request
+session = _session()
+
+def configure(pool_connections=10, pool_maxsize=10, pool_block=False, connect_timeout=3.05, read_timeout=60):
+    """Replace the shared session with one using the given pool sizes and timeouts"""
+    global session, timeout
+    session.close()
+    session = _session(pool_connections, pool_maxsize, pool_block)
+    timeout = (connect_timeout, read_timeout)
+
+def get(endpoint, params, format):
     match format:
         case "json":
-            headers["Content-Type"] = "application/json"
-            response =session.get(urljoin(server, endpoint), headers=headers, params=params)
+            response =session.get(urljoin(server, endpoint), headers=headers["json"], params=params, timeout=timeout)
             return response.json()
         case "xml":
-            headers["Content-Type"] = "text/xml"
-            response =session.get(urljoin(server, endpoint), headers=headers, params=params)
+            response =session.get(urljoin(server, endpoint), headers=headers["xml"], params=params, timeout=timeout)
             return response.text
 
 def post(endpoint, params, json, format):
-    session = requests.Session()
     match format:
         case "json":
-            headers["Content-Type"] = "application/json"
-            response = session.post(urljoin(server, endpoint), headers=headers, params=params, json=json)
+            response = session.post(urljoin(server, endpoint), headers=headers["json"], params=params, json=json, timeout=timeout)
             return response.json()
         case "xml":
-            headers["Content-Type"] = "text/xml"
-            response =session.post(urljoin(server, endpoint), headers=headers, params=params, json=json)
+            response =session.post(urljoin(server, endpoint), headers=headers["xml"], params=params, json=json, timeout=timeout)
             return response.text
 @singledispatch
 def archive(id: str, format="json", **kwargs):
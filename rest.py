@@ -3,42 +3,47 @@ import pprint
 from functools import singledispatch
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from retries import retry
+
+session = requests.Session()
+session.mount("https://", HTTPAdapter(max_retries=retry))
 
 @singledispatch
 def _variant_recoder(id: str, species='human', fields=None, var_synonyms=None, vcf_string=None, format='json'):
-    response = requests.get(
+    response = session.get(
         f"https://rest.ensembl.org/variant_recoder/{species}/{id}", headers={"Content-Type": "application/json"}, params=dict(fields=fields, var_synonyms=var_synonyms, vcf_string=vcf_string, format=format))
     return response.json()
 
 
 @_variant_recoder.register
 def _(id: list, species='human', fields=None, var_synonyms=None, vcf_string=None, format='json'):
-    response = requests.post(
+    response = session.post(
         f"https://rest.ensembl.org/variant_recoder/{species}", headers={"Content-Type": "application/json"}, params=dict(fields=fields, var_synonyms=var_synonyms, vcf_string=vcf_string, format=format), json={"ids": id})
     return response.json()
 
 
 @singledispatch
 def _variation(id: str, species='human', pops=None, genotypes=None, genotyping_chips=None, phenotypes=None, population_genotypes=None, format='json'):
-    response = requests.get(
+    response = session.get(
         f"https://rest.ensembl.org/variation/{species}/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format, pops=pops, genotypes=genotypes, genotyping_chips=genotyping_chips, phenotypes=phenotypes, population_genotypes=population_genotypes))
     return response.json()
 
 
 @_variation.register
 def _(id: list, species='human', pops=None, genotypes=None, genotyping_chips=None, phenotypes=None, population_genotypes=None, format='json'):
-    response = requests.post(
+    response = session.post(
         f"https://rest.ensembl.org/variation/{species}", headers={"Content-Type": "application/json"}, params=dict(format=format, pops=pops, genotypes=genotypes, genotyping_chips=genotyping_chips, phenotypes=phenotypes, population_genotypes=population_genotypes), json={"ids": id})
     return response.json()
 
 def _variation_pmcid(pmcid: str, species='human',format='json'):
-    response = requests.get(
+    response = session.get(
         f"https://rest.ensembl.org/variation/{species}/pmcid/{pmcid}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _variation_pmid(pmid: str, species='human',format='json'):
-    response = requests.get(
+    response = session.get(
         f"https://rest.ensembl.org/variation/{species}/pmid/{pmid}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
@@ -46,7 +51,7 @@ def _variation_pmid(pmid: str, species='human',format='json'):
 @singledispatch
 def _archive(id: str, format='json'):
     """Uses the given identifier to return its latest version"""
-    response = requests.get(
+    response = session.get(
         f"https://rest.ensembl.org/archive/id/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
@@ -54,29 +59,29 @@ def _archive(id: str, format='json'):
 @_archive.register
 def _(id: list, format='json'):
     """Retrieve the latest version for a set of identifiers"""
-    response = requests.post(f"https://rest.ensembl.org/archive/id",
+    response = session.post(f"https://rest.ensembl.org/archive/id",
                              headers={"Content-Type": "application/json"}, json={"id": id}, params=dict(format=format))
     return response.json()
 
 def _cafe_genetree_id(id:str, compara=None, nh_format=None,format='json'):
     """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-    response =requests.get(f"https://rest.ensembl.org/cafe/genetree/id/{id}", headers={"Content-Type": "application/json"}, params=dict(compara=compara, nh_format=nh_format,format=format))
+    response =session.get(f"https://rest.ensembl.org/cafe/genetree/id/{id}", headers={"Content-Type": "application/json"}, params=dict(compara=compara, nh_format=nh_format,format=format))
     return response.json()
 
 def _cafe_genetree_member(id: str, compara=None, db_type=None, nh_format=None, object_type=None, species=None,format='json'):
     """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-    response = requests.get(f"https://rest.ensembl.org/cafe/genetree/member/id/{id}", headers={"Content-Type": "application/json"}, params=dict(
+    response = session.get(f"https://rest.ensembl.org/cafe/genetree/member/id/{id}", headers={"Content-Type": "application/json"}, params=dict(
         compara=compara, db_type=db_type, nh_format=nh_format, object_type=object_type, species=species,format=format))
     return response.json()
 
 def _cafe_genetree_member_symbol(symbol:str,species='human', compara=None, db_type=None,external_db=None,nh_format=None,object_type=None,format='json'):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-        response =requests.get(f"https://rest.ensembl.org/cafe/genetree/member/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
+        response =session.get(f"https://rest.ensembl.org/cafe/genetree/member/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
                                params=dict(compara=compara, db_type=db_type,external_db=external_db,nh_format=nh_format,object_type=object_type,format=format))
         return response.json()
 def _genetree_id(id:str, aligned=None,cigar_line=None,clusterset_id=None,compara=None,nh_format=None,prune_species=None,prune_taxon=None,sequence=None,format="json"):
     """Retrieves a gene tree for a gene tree stable identifier"""
-    response =requests.get(f"https://rest.ensembl.org/genetree/id/{id}",headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/genetree/id/{id}",headers={"Content-Type": "application/json"}, 
                             params=dict(aligned=aligned,cigar_line=cigar_line,clusterset_id=clusterset_id,compara=compara,nh_format=nh_format,
                                         prune_species=prune_species,prune_taxon=prune_taxon,sequence=sequence,format=format))
     return response.json()
@@ -84,7 +89,7 @@ def _genetree_id(id:str, aligned=None,cigar_line=None,clusterset_id=None,compara
 def _genetree_member_id(id:str, aligned=None,cigar_line=None,clusterset_id=None,compara=None,db_type=None,nh_format=None,object_type=None,
                         prune_species=None,prune_taxon=None,sequence=None,species=None,format="json"):
     """Retrieves a gene tree for a gene tree stable identifier"""
-    response =requests.get(f"https://rest.ensembl.org/genetree/member/id/{id}",headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/genetree/member/id/{id}",headers={"Content-Type": "application/json"}, 
                             params=dict(aligned=aligned,cigar_line=cigar_line,clusterset_id=clusterset_id,compara=compara,db_type=db_type,nh_format=nh_format,
                                         object_type=object_type,prune_species=prune_species,prune_taxon=prune_taxon,sequence=sequence,species=species,format=format))
     return response.json()
@@ -93,14 +98,14 @@ def _genetree_member_id(id:str, aligned=None,cigar_line=None,clusterset_id=None,
 def _genetree_member_symbol(symbol:str,species='homo_sapiens',aligned=None,cigar_line=None,clusterset_id=None,compara=None,db_type=None,external_db=None,nh_format=None,object_type=None,
                         prune_species=None,prune_taxon=None,sequence=None,format="json"):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-        response =requests.get(f"https://rest.ensembl.org/genetree/member/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
+        response =session.get(f"https://rest.ensembl.org/genetree/member/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
                                params=dict(aligned=aligned,cigar_line=cigar_line,clusterset_id=clusterset_id,compara=compara,db_type=db_type,nh_format=nh_format,
                                         object_type=object_type,external_db=external_db,prune_species=prune_species,prune_taxon=prune_taxon,sequence=sequence,format=format))
         return response.json()
 
 def _alignment_region(region:str,species='homo_sapiens',aligned=None,compact=None,compara=None,display_species_set=None,mask=None,method=None,species_set=None,species_set_group=None,format="json"):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-        response =requests.get(f"https://rest.ensembl.org/alignment/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
+        response =session.get(f"https://rest.ensembl.org/alignment/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(aligned=aligned,compact=compact,compara=compara,display_species_set=display_species_set,mask=mask,method=method,species_set=species_set,
                                            species_set_group=species_set_group,format=format))
         return response.json()
@@ -108,7 +113,7 @@ def _alignment_region(region:str,species='homo_sapiens',aligned=None,compact=Non
 
 def _homology_id(id:str, aligned=None,cigar_line=None,compara=None,sequence=None,target_species=None,target_taxon=None,type=None,format=None):
     """Retrieves a gene tree for a gene tree stable identifier"""
-    response =requests.get(f"https://rest.ensembl.org/homology/id/{id}",headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/homology/id/{id}",headers={"Content-Type": "application/json"}, 
                             params=dict(aligned=aligned,cigar_line=cigar_line,compara=compara,sequence=sequence,target_species=target_species,target_taxon=target_taxon,
                                         type=type,format=format))
     return response.json()
@@ -116,185 +121,185 @@ def _homology_id(id:str, aligned=None,cigar_line=None,compara=None,sequence=None
 def _homology_symbol(symbol:str,species='homo_sapiens',aligned=None,cigar_line=None,compara=None,external_db=None,format=None,sequence=None,
                    target_species=None,target_taxon=None,type=None):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-        response =requests.get(f"https://rest.ensembl.org/homology/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
+        response =session.get(f"https://rest.ensembl.org/homology/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
                                params=dict(aligned=aligned,cigar_line=cigar_line,compara=compara,external_db=external_db,
                                            format=format,sequence=sequence,target_species=target_species,target_taxon=target_taxon,type=type))
         return response.json()
 
 def _xrefs_symbol(symbol:str,species='homo_sapiens',db_type=None,external_db=None,object_type=None,format="json"):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-        response =requests.get(f"https://rest.ensembl.org/xrefs/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
+        response =session.get(f"https://rest.ensembl.org/xrefs/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
                                params=dict(db_type=db_type,external_db=external_db,object_type=object_type,format=format))
         return response.json()
     
 
 def _xrefs_id(id:str,all_levels=None,db_type=None,external_db=None,object_type=None,species=None,format="json"):
     """Retrieves a gene tree for a gene tree stable identifier"""
-    response =requests.get(f"https://rest.ensembl.org/xrefs/id/{id}",headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/xrefs/id/{id}",headers={"Content-Type": "application/json"}, 
                             params=dict(all_levels=all_levels,db_type=db_type,external_db=external_db,object_type=object_type,species=species,format=format))
     return response.json()
 def _xrefs_name(name:str,species='homo_sapiens',db_type=None,external_db=None,format="json"):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-        response =requests.get(f"https://rest.ensembl.org/xrefs/name/{species}/{name}", headers={"Content-Type": "application/json"}, 
+        response =session.get(f"https://rest.ensembl.org/xrefs/name/{species}/{name}", headers={"Content-Type": "application/json"}, 
                                params=dict(db_type=db_type,external_db=external_db,format=format))
         return response.json()
 
 def _info_analysis(species='homo_sapiens',format="json"):
-    response =requests.get(f"https://rest.ensembl.org/info/analysis/{species}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/analysis/{species}", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_assembly(species='homo_sapiens',bands=None,synonyms=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/assembly/{species}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/assembly/{species}", headers={"Content-Type": "application/json"}, 
                                params=dict(bands=bands,synonyms=synonyms,format=format))
     return response.json()
 
 def _info_assembly_region_name(region_name:str,species='homo_sapiens',bands=None,synonyms=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/assembly/{species}/{region_name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/assembly/{species}/{region_name}", headers={"Content-Type": "application/json"}, 
                                params=dict(bands=bands,synonyms=synonyms,format=format))
     return response.json()
 
 
 def _info_biotypes(species='homo_sapiens',format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/biotypes/{species}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/biotypes/{species}", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 
 def _info_biotypes_group(group=None,object_type=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org//info/biotypes/groups", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org//info/biotypes/groups", headers={"Content-Type": "application/json"}, 
                                params=dict(group=group,object_type=object_type,format=format))
     return response.json()
 
 def _info_biotypes_name(name:str,object_type=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/biotypes/name/{name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/biotypes/name/{name}", headers={"Content-Type": "application/json"}, 
                                params=dict(object_type=object_type,format=format))
     return response.json()
 
 def _info_compara_methods(cla=None,compara=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/compara/methods", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/compara/methods", headers={"Content-Type": "application/json"}, 
                                params=dict(cla=cla,compara=compara,format=format))
     return response.json()
 
 def _info_compara_species_sets(method:str,compara=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/compara/species_sets/{method}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/compara/species_sets/{method}", headers={"Content-Type": "application/json"}, 
                                params=dict(compara=compara,format=format))
     return response.json()
 
 def _info_comparas(format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/comparas", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/comparas", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_data(format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/data", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/data", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_eg_version(format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/eg_version", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/eg_version", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_external_dbs(species='homo_sapiens',feature=None,filter=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/external_dbs/{species}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/external_dbs/{species}", headers={"Content-Type": "application/json"}, 
                                params=dict(feature=feature,filter=filter,format=format))
     return response.json()
 
 def _info_divisions(format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/divisions", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/divisions", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_genomes(name:str,expand=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org//info/genomes/{name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org//info/genomes/{name}", headers={"Content-Type": "application/json"}, 
                                params=dict(expand=expand,format=format))
     return response.json()
 
 def _info_genomes_accession(accession:str,expand=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/genomes/accession/{accession}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/genomes/accession/{accession}", headers={"Content-Type": "application/json"}, 
                                params=dict(expand=expand,format=format))
     return response.json()
 
 def _info_genomes_assembly(assembly_id:str,expand=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/genomes/assembly/{assembly_id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/genomes/assembly/{assembly_id}", headers={"Content-Type": "application/json"}, 
                                params=dict(expand=expand,format=format))
     return response.json()
 
 def _info_genomes_division(division:str,expand=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/genomes/division/{division}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/genomes/division/{division}", headers={"Content-Type": "application/json"}, 
                                params=dict(expand=expand,format=format))
     return response.json()
 # Homo sapiens引用时空格替换为'_'
 def _info_genomes_taxonomy(taxon_name:str,expand=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/genomes/taxonomy/{taxon_name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/genomes/taxonomy/{taxon_name}", headers={"Content-Type": "application/json"}, 
                                params=dict(expand=expand,format=format))
     return response.json()
 
 def _info_ping(format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/ping", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/ping", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_rest(format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/rest", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/rest", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_software(format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/software", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/software", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _info_species(division=None,hide_strain_info=None,strain_collection=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/species", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/species", headers={"Content-Type": "application/json"}, 
                                params=dict(division=division,hide_strain_info=hide_strain_info,strain_collection=strain_collection,format=format))
     return response.json()
 
 def _info_variation(species='human',filter=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/species", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/species", headers={"Content-Type": "application/json"}, 
                                params=dict(filter=filter,hformat=format))
     return response.json()
 
 def _info_variation_consequence_types(rank=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/variation/consequence_types", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/variation/consequence_types", headers={"Content-Type": "application/json"}, 
                                params=dict(rank=rank,format=format))
     return response.json()
 
 def _info_variation_populations(population_name:str,species='human',format='json'):
-    response =requests.get(f"https://rest.ensembl.org/info/variation/populations/{species}/{population_name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/variation/populations/{species}/{population_name}", headers={"Content-Type": "application/json"}, 
                                params=dict(species=species,format=format))
     return response.json()
 
 def _info_variation_species(species='homo_sapiens',format='json',filter=None):
-    response =requests.get(f"https://rest.ensembl.org/info/variation/populations/{species}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/info/variation/populations/{species}", headers={"Content-Type": "application/json"}, 
                                params=dict(species='homo_sapiens',filter=filter,format=format))
     return response.json()
 
 def _ld(id:str,population_name:str,species='human',format='json',attribs=None,callback=None,d_prime=None,r2=None,window_size=None):
-    response =requests.get(f"https://rest.ensembl.org/ld/{species}/{id}/{population_name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ld/{species}/{id}/{population_name}", headers={"Content-Type": "application/json"}, 
                                params=dict(species='homo_sapiens',attribs=attribs,callback=callback,d_prime=d_prime,r2=r2,window_size=window_size,format=format))
     return response.json()
 
 def _ld_pairwise(id1:str,id2:str,species='human',d_prime=None,population_name=None,r2=None,format='json',):
-    response =requests.get(f"https://rest.ensembl.org/ld/{species}/pairwise/{id1}/{id2}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ld/{species}/pairwise/{id1}/{id2}", headers={"Content-Type": "application/json"}, 
                                params=dict(d_prime=d_prime,population_name=population_name,r2=r2,format=format))
     return response.json()
 
 def _ld_region(population_name:str,region:str,species='human',d_prime=None,r2=None,format='json',):
-    response =requests.get(f"https://rest.ensembl.org/ld/{species}/region/{population_name}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ld/{species}/region/{population_name}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(d_prime=d_prime,r2=r2,format=format))
     return response.json()
 
 @singledispatch
 def _lookup_id(id:str,db_type=None,expand=None,mane=None,phenotypes=None,species=None,utr=None,format=None):
-    response =requests.get(f"https://rest.ensembl.org//lookup/id/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org//lookup/id/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(db_type=db_type,expand=expand,mane=mane,phenotypes=phenotypes,
                                species=species,utr=utr,format=format))
     return response.json()
 @ _lookup_id.register
 def _(id: list,db_type=None,expand=None,mane=None,phenotypes=None,species=None,utr=None,format=None):
-    response = requests.post(
+    response = session.post(
         f"https://rest.ensembl.org/lookup/id", headers={"Content-Type": "application/json"}, json={"ids": id},
         params=dict(db_type=db_type,expand=expand,mane=mane,phenotypes=phenotypes,
                                species=species,utr=utr,format=format))
@@ -302,182 +307,182 @@ def _(id: list,db_type=None,expand=None,mane=None,phenotypes=None,species=None,u
 
 @singledispatch
 def _lookup_symbol(symbol:str,species='human',expand=None,format=None):
-    response =requests.get(f"https://rest.ensembl.org//lookup/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org//lookup/symbol/{species}/{symbol}", headers={"Content-Type": "application/json"}, 
                                params=dict(expand=expand,format=format))
     return response.json()
 @ _lookup_symbol.register
 def _(symbol: list,species='human',expand=None,format=None):
-    response = requests.post(
+    response = session.post(
         f"https://rest.ensembl.org/lookup/symbol", headers={"Content-Type": "application/json"}, json={"symbol": symbol},
         params=dict(expand=expand,format=format))
     return response.json()
 
 def _map_cdna(id:str,region:str,include_original_region=None,species=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/map/cdna/{id}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/map/cdna/{id}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(include_original_region=include_original_region,species=species,format=format))
     return response.json()
 
 def _map_cds(id:str,region:str,include_original_region=None,species=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/map/cds/{id}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/map/cds/{id}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(include_original_region=include_original_region,species=species,format=format))
     return response.json()
 
 def _map_assembly(asm_one:str,asm_two:str,region:str,species='human',coord_system=None,target_coord_system=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/map/{species}/{asm_one}/{asm_two}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/map/{species}/{asm_one}/{asm_two}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(coord_system=coord_system,target_coord_system=target_coord_system,format=format))
     return response.json()
 
 def _map_translation(id:str,region:str,species=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/map/translation/{id}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/map/translation/{id}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(species=species,format=format))
     return response.json()
 
 def _ontology_ancestors(id:str,ontology=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ontology/ancestors/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ontology/ancestors/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(ontology=ontology,format=format))
     return response.json()
 
 def _ontology_ancestors_chart(id:str,ontology=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ontology/ancestors/chart/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ontology/ancestors/chart/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(ontology=ontology,format=format))
     return response.json()
 
 def _ontology_descendants(id:str,closest_term=None,ontology=None,subset=None,zero_distance=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ontology/descendants/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ontology/descendants/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(closest_term=closest_term,ontology=ontology,subset=subset,zero_distance=zero_distance,format=format))
     return response.json()
 
 def _ontology_id(id:str,relation=None,simple=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ontology/id/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ontology/id/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(relation=relation,simple=simple,format=format))
     return response.json()
 
 def _ontology_name(name:str,ontology=None,relation=None,simple=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ontology/name/{name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ontology/name/{name}", headers={"Content-Type": "application/json"}, 
                                params=dict(ontology=ontology,relation=relation,simple=simple,format=format))
     return response.json()
 
 def _taxonomy_classification(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/taxonomy/classification/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/taxonomy/classification/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _taxonomy_id(id:str,simple=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/taxonomy/id/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/taxonomy/id/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(simple=simple,format=format))
     return response.json()
 
 def _taxonomy_name(name:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/taxonomy/name/{name}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/taxonomy/name/{name}", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _overlap_id(id:str,feature,biotype=None,db_type=None,logic_name=None,misc_set=None,object_type=None,so_term=None,species=None,
                         species_set=None,variant_set=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/overlap/id/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/overlap/id/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(feature=feature,biotype=biotype,db_type=db_type,logic_name=logic_name,misc_set=misc_set,object_type=object_type,so_term=so_term,species=species,
                                            species_set=species_set,variant_set=variant_set,format=format))
     return response.json()
 
 def _overlap_region(region:str,feature,species='homo_sapiens',biotype=None,db_type=None,logic_name=None,misc_set=None,so_term=None,species_set=None,
                     trim_downstream=None,trim_upstream=None,variant_set=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org//overlap/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org//overlap/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(feature=feature,biotype=biotype,db_type=db_type,logic_name=logic_name,misc_set=misc_set,so_term=so_term,
                                            species_set=species_set,trim_downstream=trim_downstream,trim_upstream=trim_upstream,variant_set=variant_set,format=format))
     return response.json()
     
 def _overlap_translation(id:str,db_type=None,feature=None,so_term=None,species=None,type=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/overlap/translation/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/overlap/translation/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(db_type=db_type,feature=feature,so_term=so_term,species=species,type=type,format=format))
     return response.json()
 
 def _phenotype_accession(accession:str,species='homo_sapiens',include_children=None,include_pubmed_id=None,include_review_status=None,source=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/phenotype/accession/homo_sapiens/{accession}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/phenotype/accession/homo_sapiens/{accession}", headers={"Content-Type": "application/json"}, 
                                params=dict(species=species,include_children=include_children,include_pubmed_id=include_pubmed_id,include_review_status=include_review_status,source=source,format=format))
     return response.json()
 
 def _phenotype_gene(gene:str,species='homo_sapiens',include_associated=None,include_overlap=None,include_pubmed_id=None,include_review_status=None,include_submitter=None,non_specified=None,trait=None,tumour=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/phenotype/gene/{gene}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/phenotype/gene/{gene}", headers={"Content-Type": "application/json"}, 
                                params=dict(species=species,include_associated=include_associated,include_overlap=include_overlap,include_pubmed_id=include_pubmed_id,include_review_status=include_review_status,include_submitter=include_submitter,non_specified=non_specified,
                                            trait=trait,tumour=tumour,format=format))
     return response.json()
 
 def _phenotype_region(region:str,species='homo_sapiens',feature_type=None,include_pubmed_id=None,include_review_status=None,include_submitter=None,non_specified=None,only_phenotypes=None,trait=None,tumour=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/phenotype/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/phenotype/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(species=species,feature_type=feature_type,include_pubmed_id=include_pubmed_id,include_review_status=include_review_status,include_submitter=include_submitter,non_specified=non_specified,only_phenotypes=only_phenotypes,trait=trait,tumour=tumour,format=format))
     return response.json()
 
 def _phenotype_term(term:str,species='homo_sapiens',include_children=None,include_pubmed_id=None,include_review_status=None,source=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/phenotype/term/{species}/{term}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/phenotype/term/{species}/{term}", headers={"Content-Type": "application/json"}, 
                                params=dict(include_children=include_children,include_pubmed_id=include_pubmed_id,include_review_status=include_review_status,source=source,format=format))
     return response.json()
 
 def _regulatory_microarray_vendor(microarray:str,vendor:str,species='homo_sapiens',format='json'):
-    response =requests.get(f"https://rest.ensembl.org/regulatory/species/{species}/microarray/{microarray}/vendor/{vendor}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/regulatory/species/{species}/microarray/{microarray}/vendor/{vendor}", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _regulatory_species(species='homo_sapiens',format='json'):
-    response =requests.get(f"https://rest.ensembl.org/regulatory/species/{species}/epigenome", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/regulatory/species/{species}/epigenome", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _species_binding_matrix(binding_matrix:str,species='homo_sapiens',unit=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/species/{species}/binding_matrix/{binding_matrix}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/species/{species}/binding_matrix/{binding_matrix}", headers={"Content-Type": "application/json"}, 
                                params=dict(unit=unit,format=format))
     return response.json()
 
 def _regulatory_microarray(species='homo_sapiens',format='json'):
-    response =requests.get(f"https://rest.ensembl.org//regulatory/species/{species}/microarray", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org//regulatory/species/{species}/microarray", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _regulatory_probe(microarray:str,probe:str,species='homo_sapiens',gene=None,transcripts=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/regulatory/species/{species}/microarray/{microarray}/probe/{probe}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/regulatory/species/{species}/microarray/{microarray}/probe/{probe}", headers={"Content-Type": "application/json"}, 
                                params=dict(gene=gene,transcripts=transcripts,format=format))
     return response.json()
 
 def _regulatory_probe_set(microarray:str,probe_set:str,species='homo_sapiens',gene=None,transcripts=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/regulatory/species/{species}/microarray/{microarray}/probe_set/{probe_set}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/regulatory/species/{species}/microarray/{microarray}/probe_set/{probe_set}", headers={"Content-Type": "application/json"}, 
                                params=dict(gene=gene,transcripts=transcripts,format=format))
     return response.json()
 
 def _regulatory_id(id:str,species='homo_sapiens',activity=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/regulatory/species/{species}/id/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/regulatory/species/{species}/id/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(activity=activity,format=format))
     return response.json()
 
 @singledispatch
 def _sequence_id(id:str,db_type=None,end=None,expand_3prime=None,expand_5prime=None,mask=None,mask_feature=None,multiple_sequences=None,object_type=None,species=None,start=None,type=None,format=None):
-    response =requests.get(f"https://rest.ensembl.org/sequence/id/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/sequence/id/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(db_type=db_type,end=end,expand_3prime=expand_3prime,expand_5prime=expand_5prime,mask=mask,mask_feature=mask_feature,multiple_sequences=multiple_sequences,object_type=object_type,species=species,start=start,type=type,format=format))
     return response.json()
 
 @_sequence_id.register
 def _(id:list,db_type=None,end=None,expand_3prime=None,expand_5prime=None,mask=None,mask_feature=None,multiple_sequences=None,object_type=None,species=None,start=None,type=None,format=None):
-    response =requests.post(f"https://rest.ensembl.org/sequence/id/", headers={"Content-Type": "application/json"}, json={'ids': id},
+    response =session.post(f"https://rest.ensembl.org/sequence/id/", headers={"Content-Type": "application/json"}, json={'ids': id},
                                params=dict(db_type=db_type,end=end,expand_3prime=expand_3prime,expand_5prime=expand_5prime,mask=mask,mask_feature=mask_feature,multiple_sequences=multiple_sequences,object_type=object_type,species=species,start=start,type=type,format=format))
     return response.json()
 
 @singledispatch
 def _sequence_region(region:str,species='human',coord_system=None,coord_system_version=None,expand_3prime=None,expand_5prime=None,mask=None,mask_feature=None,format=None):
-    response =requests.get(f"https://rest.ensembl.org/sequence/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/sequence/region/{species}/{region}", headers={"Content-Type": "application/json"}, 
                                params=dict(coord_system=coord_system,coord_system_version=coord_system_version,expand_3prime=expand_3prime,expand_5prime=expand_5prime,mask=mask,mask_feature=mask_feature,format=format))
     return response.json()
 
 @_sequence_region.register
 def _(region:list,species='human',coord_system=None,coord_system_version=None,expand_3prime=None,expand_5prime=None,mask=None,mask_feature=None,format=None):
-    response =requests.post(f"https://rest.ensembl.org/sequence/region/{species}/", headers={"Content-Type": "application/json"}, json={'regions': region},
+    response =session.post(f"https://rest.ensembl.org/sequence/region/{species}/", headers={"Content-Type": "application/json"}, json={'regions': region},
                                params=dict(coord_system=coord_system,coord_system_version=coord_system_version,expand_3prime=expand_3prime,expand_5prime=expand_5prime,mask=mask,mask_feature=mask_feature,format=format))
     return response.json()
 
 def _transcript_haplotypes(id:str,species='homo_sapiens',aligned_sequences=None,samples=None,sequence=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/transcript_haplotypes/{species}/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/transcript_haplotypes/{species}/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(aligned_sequences=aligned_sequences,samples=samples,sequence=sequence,format=format))
     return response.json()
 
 def _transcript_haplotypes(hgvs_notation:str,species='homo_sapiens',aligned_sequences=None,samples=None,sequence=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/transcript_haplotypes/{species}/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/transcript_haplotypes/{species}/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(aligned_sequences=aligned_sequences,samples=samples,sequence=sequence,format=format))
     return response.json()
 
@@ -485,7 +490,7 @@ def _transcript_haplotypes(hgvs_notation:str,species='homo_sapiens',aligned_sequ
 def _vep_hgvs(hgvs_notation:str,species='human',AncestralAllele=None,Blosum62=None,CADD=None,Conservation=None,DisGeNET=None,EVE=None,GO=None,GeneSplicer=None,IntAct=None,LoF=None,Mastermind=None,MaxEntScan=None,
 NMD=None,Phenotypes=None,SpliceAI=None,UTRAnnotator=None,ambiguous_hgvs=None,appris=None,canonical=None,ccds=None,dbNSFP=None,dbscSNV=None,distance=None,domains=None,failed=None,hgvs=None,mane=None,merged=None,minimal=None,
 mirna=None,mutfunc=None,numbers=None,protein=None,refseq=None,shift_3prime=None,shift_genomic=None,transcript_id=None,transcript_version=None,tsl=None,uniprot=None,variant_class=None,vcf_string=None,xref_refseq=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/vep/{species}/hgvs/{hgvs_notation}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/vep/{species}/hgvs/{hgvs_notation}", headers={"Content-Type": "application/json"}, 
                                params=dict(AncestralAllele=AncestralAllele,Blosum62=Blosum62,CADD=CADD,Conservation=Conservation,DisGeNET=DisGeNET,EVE=EVE,GO=GO,GeneSplicer=GeneSplicer,IntAct=IntAct,LoF=LoF,Mastermind=Mastermind,MaxEntScan=MaxEntScan,
 NMD=NMD,Phenotypes=Phenotypes,SpliceAI=SpliceAI,UTRAnnotator=UTRAnnotator,ambiguous_hgvs=ambiguous_hgvs,appris=appris,canonical=canonical,ccds=ccds,dbNSFP=dbNSFP,dbscSNV=dbscSNV,distance=distance,domains=domains,failed=failed,hgvs=hgvs,mane=mane,merged=merged,minimal=minimal,
 mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_3prime=shift_3prime,shift_genomic=shift_genomic,transcript_id=transcript_id,transcript_version=transcript_version,tsl=tsl,uniprot=uniprot,variant_class=variant_class,vcf_string=vcf_string,xref_refseq=xref_refseq,format=format))
@@ -495,7 +500,7 @@ mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_
 def _(hgvs_notation:list,species='human',AncestralAllele=None,Blosum62=None,CADD=None,Conservation=None,DisGeNET=None,EVE=None,GO=None,GeneSplicer=None,IntAct=None,LoF=None,Mastermind=None,MaxEntScan=None,
 NMD=None,Phenotypes=None,SpliceAI=None,UTRAnnotator=None,ambiguous_hgvs=None,appris=None,canonical=None,ccds=None,dbNSFP=None,dbscSNV=None,distance=None,domains=None,failed=None,hgvs=None,mane=None,merged=None,minimal=None,
 mirna=None,mutfunc=None,numbers=None,protein=None,refseq=None,shift_3prime=None,shift_genomic=None,transcript_id=None,transcript_version=None,tsl=None,uniprot=None,variant_class=None,vcf_string=None,xref_refseq=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/vep/{species}/hgvs/", headers={"Content-Type": "application/json"}, json={'hgvs_notations': hgvs_notation},
+    response =session.post(f"https://rest.ensembl.org/vep/{species}/hgvs/", headers={"Content-Type": "application/json"}, json={'hgvs_notations': hgvs_notation},
                                params=dict(AncestralAllele=AncestralAllele,Blosum62=Blosum62,CADD=CADD,Conservation=Conservation,DisGeNET=DisGeNET,EVE=EVE,GO=GO,GeneSplicer=GeneSplicer,IntAct=IntAct,LoF=LoF,Mastermind=Mastermind,MaxEntScan=MaxEntScan,
 NMD=NMD,Phenotypes=Phenotypes,SpliceAI=SpliceAI,UTRAnnotator=UTRAnnotator,ambiguous_hgvs=ambiguous_hgvs,appris=appris,canonical=canonical,ccds=ccds,dbNSFP=dbNSFP,dbscSNV=dbscSNV,distance=distance,domains=domains,failed=failed,hgvs=hgvs,mane=mane,merged=merged,minimal=minimal,
 mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_3prime=shift_3prime,shift_genomic=shift_genomic,transcript_id=transcript_id,transcript_version=transcript_version,tsl=tsl,uniprot=uniprot,variant_class=variant_class,vcf_string=vcf_string,xref_refseq=xref_refseq,format=format))
@@ -505,7 +510,7 @@ mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_
 def _vep_id(id:str,species='human',AncestralAllele=None,Blosum62=None,CADD=None,Conservation=None,DisGeNET=None,EVE=None,GO=None,GeneSplicer=None,IntAct=None,LoF=None,Mastermind=None,MaxEntScan=None,
 NMD=None,Phenotypes=None,SpliceAI=None,UTRAnnotator=None,ambiguous_hgvs=None,appris=None,canonical=None,ccds=None,dbNSFP=None,dbscSNV=None,distance=None,domains=None,failed=None,hgvs=None,mane=None,merged=None,minimal=None,
 mirna=None,mutfunc=None,numbers=None,protein=None,refseq=None,shift_3prime=None,shift_genomic=None,transcript_id=None,transcript_version=None,tsl=None,uniprot=None,variant_class=None,vcf_string=None,xref_refseq=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/vep/{species}/id/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/vep/{species}/id/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(AncestralAllele=AncestralAllele,Blosum62=Blosum62,CADD=CADD,Conservation=Conservation,DisGeNET=DisGeNET,EVE=EVE,GO=GO,GeneSplicer=GeneSplicer,IntAct=IntAct,LoF=LoF,Mastermind=Mastermind,MaxEntScan=MaxEntScan,
 NMD=NMD,Phenotypes=Phenotypes,SpliceAI=SpliceAI,UTRAnnotator=UTRAnnotator,appris=appris,canonical=canonical,ccds=ccds,dbNSFP=dbNSFP,dbscSNV=dbscSNV,distance=distance,domains=domains,failed=failed,hgvs=hgvs,mane=mane,merged=merged,minimal=minimal,
 mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_3prime=shift_3prime,shift_genomic=shift_genomic,transcript_id=transcript_id,transcript_version=transcript_version,tsl=tsl,uniprot=uniprot,variant_class=variant_class,vcf_string=vcf_string,xref_refseq=xref_refseq,format=format))
@@ -515,7 +520,7 @@ mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_
 def _(id:list,species='human',AncestralAllele=None,Blosum62=None,CADD=None,Conservation=None,DisGeNET=None,EVE=None,GO=None,GeneSplicer=None,IntAct=None,LoF=None,Mastermind=None,MaxEntScan=None,
 NMD=None,Phenotypes=None,SpliceAI=None,UTRAnnotator=None,ambiguous_hgvs=None,appris=None,canonical=None,ccds=None,dbNSFP=None,dbscSNV=None,distance=None,domains=None,failed=None,hgvs=None,mane=None,merged=None,minimal=None,
 mirna=None,mutfunc=None,numbers=None,protein=None,refseq=None,shift_3prime=None,shift_genomic=None,transcript_id=None,transcript_version=None,tsl=None,uniprot=None,variant_class=None,vcf_string=None,xref_refseq=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/vep/{species}/id/", headers={"Content-Type": "application/json"}, json={'ids':id},
+    response =session.post(f"https://rest.ensembl.org/vep/{species}/id/", headers={"Content-Type": "application/json"}, json={'ids':id},
                                params=dict(AncestralAllele=AncestralAllele,Blosum62=Blosum62,CADD=CADD,Conservation=Conservation,DisGeNET=DisGeNET,EVE=EVE,GO=GO,GeneSplicer=GeneSplicer,IntAct=IntAct,LoF=LoF,Mastermind=Mastermind,MaxEntScan=MaxEntScan,
 NMD=NMD,Phenotypes=Phenotypes,SpliceAI=SpliceAI,UTRAnnotator=UTRAnnotator,appris=appris,canonical=canonical,ccds=ccds,dbNSFP=dbNSFP,dbscSNV=dbscSNV,distance=distance,domains=domains,failed=failed,hgvs=hgvs,mane=mane,merged=merged,minimal=minimal,
 mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_3prime=shift_3prime,shift_genomic=shift_genomic,transcript_id=transcript_id,transcript_version=transcript_version,tsl=tsl,uniprot=uniprot,variant_class=variant_class,vcf_string=vcf_string,xref_refseq=xref_refseq,format=format))
@@ -525,7 +530,7 @@ mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_
 def _vep_region_get(allele:str,region:str,species='human',AncestralAllele=None,Blosum62=None,CADD=None,Conservation=None,DisGeNET=None,EVE=None,GO=None,GeneSplicer=None,IntAct=None,LoF=None,Mastermind=None,MaxEntScan=None,
 NMD=None,Phenotypes=None,SpliceAI=None,UTRAnnotator=None,ambiguous_hgvs=None,appris=None,canonical=None,ccds=None,dbNSFP=None,dbscSNV=None,distance=None,domains=None,failed=None,hgvs=None,mane=None,merged=None,minimal=None,
 mirna=None,mutfunc=None,numbers=None,protein=None,refseq=None,shift_3prime=None,shift_genomic=None,transcript_id=None,transcript_version=None,tsl=None,uniprot=None,variant_class=None,vcf_string=None,xref_refseq=None,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/vep/{species}/region/{region}/{allele}/", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/vep/{species}/region/{region}/{allele}/", headers={"Content-Type": "application/json"}, 
                                params=dict(AncestralAllele=AncestralAllele,Blosum62=Blosum62,CADD=CADD,Conservation=Conservation,DisGeNET=DisGeNET,EVE=EVE,GO=GO,GeneSplicer=GeneSplicer,IntAct=IntAct,LoF=LoF,Mastermind=Mastermind,MaxEntScan=MaxEntScan,
 NMD=NMD,Phenotypes=Phenotypes,SpliceAI=SpliceAI,UTRAnnotator=UTRAnnotator,appris=appris,canonical=canonical,ccds=ccds,dbNSFP=dbNSFP,dbscSNV=dbscSNV,distance=distance,domains=domains,failed=failed,hgvs=hgvs,mane=mane,merged=merged,minimal=minimal,
 mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_3prime=shift_3prime,shift_genomic=shift_genomic,transcript_id=transcript_id,transcript_version=transcript_version,tsl=tsl,uniprot=uniprot,variant_class=variant_class,vcf_string=vcf_string,xref_refseq=xref_refseq,format=format))
@@ -535,105 +540,105 @@ mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_
 # def _vep_region_post(variants:list,species='human',AncestralAllele=None,Blosum62=None,CADD=None,Conservation=None,DisGeNET=None,EVE=None,GO=None,GeneSplicer=None,IntAct=None,LoF=None,Mastermind=None,MaxEntScan=None,
 # NMD=None,Phenotypes=None,SpliceAI=None,UTRAnnotator=None,ambiguous_hgvs=None,appris=None,canonical=None,ccds=None,dbNSFP=None,dbscSNV=None,distance=None,domains=None,failed=None,hgvs=None,mane=None,merged=None,minimal=None,
 # mirna=None,mutfunc=None,numbers=None,protein=None,refseq=None,shift_3prime=None,shift_genomic=None,transcript_id=None,transcript_version=None,tsl=None,uniprot=None,variant_class=None,vcf_string=None,xref_refseq=None,format='json'):
-#     response =requests.post(f"https://rest.ensembl.org/vep/{species}/region/", headers={"Content-Type": "application/json"}, json={"variants":variants},
+#     response =session.post(f"https://rest.ensembl.org/vep/{species}/region/", headers={"Content-Type": "application/json"}, json={"variants":variants},
 #                                params=dict(AncestralAllele=AncestralAllele,Blosum62=Blosum62,CADD=CADD,Conservation=Conservation,DisGeNET=DisGeNET,EVE=EVE,GO=GO,GeneSplicer=GeneSplicer,IntAct=IntAct,LoF=LoF,Mastermind=Mastermind,MaxEntScan=MaxEntScan,
 # NMD=NMD,Phenotypes=Phenotypes,SpliceAI=SpliceAI,UTRAnnotator=UTRAnnotator,appris=appris,canonical=canonical,ccds=ccds,dbNSFP=dbNSFP,dbscSNV=dbscSNV,distance=distance,domains=domains,failed=failed,hgvs=hgvs,mane=mane,merged=merged,minimal=minimal,
 # mirna=mirna,mutfunc=mutfunc,numbers=numbers,protein=protein,refseq=refseq,shift_3prime=shift_3prime,shift_genomic=shift_genomic,transcript_id=transcript_id,transcript_version=transcript_version,tsl=tsl,uniprot=uniprot,variant_class=variant_class,vcf_string=vcf_string,xref_refseq=xref_refseq,format=format))
 #     return response.json()
 
 def _vep_region_post(region:list,species='homo_sapiens',format='json'):
-    response =requests.post(f"https://rest.ensembl.org/vep/{species}/region/", headers={"Content-Type": "application/json"}, json={"variants":region},
+    response =session.post(f"https://rest.ensembl.org/vep/{species}/region/", headers={"Content-Type": "application/json"}, json={"variants":region},
                                params=dict(format=format))
     return response.json()
 
 def _ga4gh_beacon(format="json"):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
-        response =requests.get(f"https://rest.ensembl.org/ga4gh/beacon", headers={"Content-Type": "application/json"}, 
+        response =session.get(f"https://rest.ensembl.org/ga4gh/beacon", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
         return response.json()
 
 def _ga4gh_beacon_query(alternateBases:str,assemblyId:str,referenceBases:str,referenceName:str,start:int,end=None,endMax=None,endMin=None,startMax=None,startMin=None,variantType=None,
                         datasetIds=None,includeDatasetResponses=None,format="json"):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/beacon/query", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ga4gh/beacon/query", headers={"Content-Type": "application/json"}, 
                                params=dict(alternateBases=alternateBases,assemblyId=assemblyId,referenceBases=referenceBases,referenceName=referenceName,start=start,datasetIds=datasetIds,end=end,endMax=endMax,endMin=endMin,startMax=startMax,startMin=startMin,variantType=variantType,includeDatasetResponses=includeDatasetResponses))
     return response.json()
 
 def _ga4gh_features(id:str,format="json"):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/features/{id}", headers={"Content-Type": "application/json"}, 
+    response =session.get(f"https://rest.ensembl.org/ga4gh/features/{id}", headers={"Content-Type": "application/json"}, 
                                params=dict(format=format))
     return response.json()
 
 def _ga4gh_features_search(end=None,referenceName=None,start=None,featureTypes=None,featureSetId=None,pageSize=None,pageToken=None,parentId=None,format="json"):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/features/search", headers={"Content-Type": "application/json"},json=dict(end=end,referenceName=referenceName,start=start,featureTypes=featureTypes,featureSetId=featureSetId,pageSize=pageSize,pageToken=pageToken,parentId=parentId,format=format),
+    response =session.post(f"https://rest.ensembl.org/ga4gh/features/search", headers={"Content-Type": "application/json"},json=dict(end=end,referenceName=referenceName,start=start,featureTypes=featureTypes,featureSetId=featureSetId,pageSize=pageSize,pageToken=pageToken,parentId=parentId,format=format),
                                params={})
     return response.json()
 
 def _ga4gh_callsets(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/callsets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org/ga4gh/callsets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _ga4gh_datasets_search(pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/datasets/search", headers={"Content-Type": "application/json"}, json=dict(pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/datasets/search", headers={"Content-Type": "application/json"}, json=dict(pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_callsets_search(variantSetId=None,name=None,pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/callsets/search", headers={"Content-Type": "application/json"}, json=dict(variantSetId=variantSetId,name=name,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/callsets/search", headers={"Content-Type": "application/json"}, json=dict(variantSetId=variantSetId,name=name,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_datasets(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/datasets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org/ga4gh/datasets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _ga4gh_featuresets_search(datasetId=None,pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/featuresets/search", headers={"Content-Type": "application/json"}, json=dict(datasetId=datasetId,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/featuresets/search", headers={"Content-Type": "application/json"}, json=dict(datasetId=datasetId,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_featuresets(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org//ga4gh/featuresets/Ensembl/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org//ga4gh/featuresets/Ensembl/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _ga4gh_variants(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/variants/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org/ga4gh/variants/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _ga4gh_variants_search(variantSetId=None,referenceName=None,start=None,end=None,callSetIds=None,pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/variants/search", headers={"Content-Type": "application/json"}, json=dict(variantSetId=variantSetId,referenceName=referenceName,start=start,end=end,callSetIds=callSetIds,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/variants/search", headers={"Content-Type": "application/json"}, json=dict(variantSetId=variantSetId,referenceName=referenceName,start=start,end=end,callSetIds=callSetIds,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_variantannotations_search(variantAnnotationSetId=None,effects=None,end=None,pageSize=None,pageToken=None,referenceId=None,referenceName=None,start=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/variantannotations/search", headers={"Content-Type": "application/json"}, json=dict(variantAnnotationSetId=variantAnnotationSetId,effects=effects,end=end,pageSize=pageSize,pageToken=pageToken,referenceId=referenceId,referenceName=referenceName,start=start),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/variantannotations/search", headers={"Content-Type": "application/json"}, json=dict(variantAnnotationSetId=variantAnnotationSetId,effects=effects,end=end,pageSize=pageSize,pageToken=pageToken,referenceId=referenceId,referenceName=referenceName,start=start),params=dict(format=format))
     return response.json()
 
 def _ga4gh_variantsets_search(datasetId=None,pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/variantsets/search", headers={"Content-Type": "application/json"}, json=dict(datasetId=datasetId,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/variantsets/search", headers={"Content-Type": "application/json"}, json=dict(datasetId=datasetId,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_variantsets(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/variantsets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org/ga4gh/variantsets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _ga4gh_references_search(referenceSetId=None,accession=None,md5checksum=None,pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/references/search", headers={"Content-Type": "application/json"}, json=dict(referenceSetId=referenceSetId,accession=accession,md5checksum=md5checksum,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/references/search", headers={"Content-Type": "application/json"}, json=dict(referenceSetId=referenceSetId,accession=accession,md5checksum=md5checksum,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_references(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/references/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org/ga4gh/references/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _ga4gh_referencesets_search(accession=None,pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/referencesets/search", headers={"Content-Type": "application/json"}, json=dict(accession=accession,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/referencesets/search", headers={"Content-Type": "application/json"}, json=dict(accession=accession,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_referencesets(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/referencesets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org/ga4gh/referencesets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 def _ga4gh_variantannotationsets_search(variantSetId=None,pageSize=None,pageToken=None,format='json'):
-    response =requests.post(f"https://rest.ensembl.org/ga4gh/variantannotationsets/search", headers={"Content-Type": "application/json"}, json=dict(variantSetId=variantSetId,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
+    response =session.post(f"https://rest.ensembl.org/ga4gh/variantannotationsets/search", headers={"Content-Type": "application/json"}, json=dict(variantSetId=variantSetId,pageSize=pageSize,pageToken=pageToken),params=dict(format=format))
     return response.json()
 
 def _ga4gh_variantannotationsets(id:str,format='json'):
-    response =requests.get(f"https://rest.ensembl.org/ga4gh/variantannotationsets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
+    response =session.get(f"https://rest.ensembl.org/ga4gh/variantannotationsets/{id}", headers={"Content-Type": "application/json"}, params=dict(format=format))
     return response.json()
 
 parser = argparse.ArgumentParser()
@@ -0,0 +1,9 @@
+import urllib3
+from urllib3.util.retry import Retry
+
+# Transient failures (throttling, gateway errors, dropped connections) are retried up to 5 times with exponential backoff
+# plus up to 0.5 s of random jitter, each wait capped at 30 s; urllib3 has no overall deadline.
+# urllib3 1.x has neither backoff_jitter nor backoff_max, so it retries without jitter, capped at its fixed 120 s.
+_backoff = dict(backoff_jitter=0.5, backoff_max=30) if int(urllib3.__version__.split(".")[0]) >= 2 else {}
+retry = Retry(total=5, backoff_factor=0.5, **_backoff, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=None,
+              respect_retry_after_header=True)
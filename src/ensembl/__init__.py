@@ -1,46 +1,498 @@
-from collections import defaultdict
-from functools import singledispatchmethod
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import singledispatchmethod, wraps
+from types import MappingProxyType
 from urllib.parse import urljoin
 
 import requests
 
+from .cache import MISSING, LRUMemo
+from .coalesce import SingleFlight
+from .decode import Decoder
+from .metrics import Metrics, new_span
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .stream import JSONItemStream, iter_items
+from .tiling import MAX_REGION_SIZE, format_region, merge_features, merge_ld, stitch_sequences, tile_region
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Request headers of each response format. They are read-only so every client and thread can share them.
+FORMAT_HEADERS = MappingProxyType({
+    "json": MappingProxyType({"Content-Type": "application/json"}),
+    "xml": MappingProxyType({"Content-Type": "text/xml"}),
+})
+
+# Maximum number of items the REST server accepts in one POST body, keyed by endpoint prefix.
+MAX_POST_SIZE = {
+    "archive/id": 1000,
+    "lookup/id": 1000,
+    "lookup/symbol": 1000,
+    "sequence/id": 50,
+    "sequence/region": 50,
+    "variant_recoder": 200,
+    "variation": 200,
+    "vep": 200,
+}
+
+
+# How the records of a batched POST response map back to the requested items, keyed by endpoint prefix:
+# None when the response is a dict keyed by item, otherwise a function returning the item a record answers.
+BATCH_ITEM_KEYS = {
+    "archive/id": lambda record: record.get("id"),
+    "lookup/id": None,
+    "lookup/symbol": None,
+    "sequence/id": lambda record: record.get("query"),
+    "variant_recoder": lambda record: next((allele["input"] for allele in record.values() if isinstance(allele, dict) and "input" in allele), None),
+    "variation": None,
+    "vep": lambda record: record.get("input"),
+}
+
+
+def endpoint_prefix(table, endpoint):
+    """Return the longest key of table that is a path prefix of endpoint, or None"""
+    for prefix in sorted(table, key=len, reverse=True):
+        if endpoint == prefix or endpoint.startswith(prefix + "/"):
+            return prefix
+    return None
+
+
+def max_post_size(endpoint):
+    """Return the batch size limit of a POST endpoint, or None if it has no known limit"""
+    prefix = endpoint_prefix(MAX_POST_SIZE, endpoint)
+    return MAX_POST_SIZE[prefix] if prefix else None
+
+
+def merge_batches(results):
+    """Merge the decoded responses of several chunks into the shape of a single call"""
+    if all(isinstance(result, dict) for result in results):
+        merged = {}
+        for result in results:
+            merged.update(result)
+        return merged
+    if all(isinstance(result, list) for result in results):
+        return [item for result in results for item in result]
+    return results
+
+
+def split_batch(endpoint, result):
+    """Break a merged batch response into {item: part}, plus the records of a list response that answer no item"""
+    item_key = BATCH_ITEM_KEYS[endpoint_prefix(BATCH_ITEM_KEYS, endpoint)]
+    if item_key is None:
+        return dict(result), []
+    parts, unclaimed = {}, []
+    for record in result:
+        item = item_key(record) if isinstance(record, dict) else None
+        if item is None:
+            unclaimed.append(record)
+        else:
+            parts.setdefault(item, []).append(record)
+    return parts, unclaimed
+
+
+def assemble_batch(endpoint, items, parts, unclaimed=()):
+    """Inverse of split_batch: rebuild the response of a batch call for items, in item order"""
+    order = list(dict.fromkeys([*items, *parts]))
+    if BATCH_ITEM_KEYS[endpoint_prefix(BATCH_ITEM_KEYS, endpoint)] is None:
+        return {item: parts[item] for item in order if item in parts}
+    return [record for item in order if item in parts for record in parts[item]] + list(unclaimed)
+
+
+def failed(result):
+    """Whether a decoded response is the {"error": ...} body the server sends with a 4xx status"""
+    return isinstance(result, dict) and set(result) == {"error"}
+
+
+def checked(result):
+    """Return the decoded response of a batch chunk, raising ChunkError if the server rejected the chunk"""
+    if failed(result):
+        raise ChunkError(result)
+    return result
+
+
+def memoized(method):
+    """Memoize an endpoint method in its client's in-memory LRU; for metadata that only changes between releases.
+    Error responses are not memoized."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        return self._memoized(key, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+
+def server_url(assembly, scheme):
+    """Return the REST server serving the given assembly over the given scheme"""
+    match assembly, scheme:
+        case "GRCh38", "http":
+            return "http://rest.ensembl.org"
+        case "GRCh37", "http":
+            return "http://grch37.rest.ensembl.org"
+        case "GRCh38", "https":
+            return "https://rest.ensembl.org"
+        case "GRCh37", "https":
+            return "https://grch37.rest.ensembl.org"
+
+
+class BatchError(Exception):
+    """Raised when some chunks of a batched POST failed.
+    `results` holds the merged responses of the chunks that succeeded and `errors` a list of (items, exception) for those that did not."""
+
+    def __init__(self, results, errors):
+        super().__init__(f"{len(errors)} batch chunk(s) failed: {errors[0][1]!r}")
+        self.results = results
+        self.errors = errors
+
+
+class ChunkError(Exception):
+    """The {"error": ...} body of a batch chunk the server rejected, as reported in BatchError.errors"""
+
+    def __init__(self, body):
+        super().__init__(body["error"])
+        self.body = body
 
-class Ensembl:
-    headers = defaultdict(str)
 
-    def __init__(self, assembly="GRCh38", scheme="http"):
+class Ensembl:
+    """Client of the Ensembl REST API.
+    Connections are kept alive (unless keep_alive=False) in per-host pools of pool_maxsize connections (default: at least
+    max_workers), one pool for each of up to pool_connections hosts; pool_block makes callers wait for a free connection
+    instead of opening throwaway ones. timeout is the (connect, read) timeout in seconds of every request.
+    JSON bodies are decoded by `decoder` (default: a Decoder using orjson or msgspec when installed, see ensembl.decode).
+    Every request is timed in a span (see ensembl.metrics) recorded per endpoint template into `metrics`; `hooks` maps
+    "request" and "response" to callables receiving each span when its request starts and once it finished."""
+
+    def __init__(self, assembly="GRCh38", scheme="http", max_workers=1, rate_limiter=None, retry=None, cache=None, memo_size=256,
+                 coalesce=True, headers=None, pool_connections=10, pool_maxsize=None, pool_block=False, timeout=(3.05, 60),
+                 keep_alive=True, decoder=None, metrics=None, hooks=None):
+        self._setup(assembly, scheme, max_workers, rate_limiter, retry, cache, memo_size, coalesce, headers, decoder, metrics, hooks)
+        self._release_lock = threading.Lock()
         self.session = requests.Session()
-        match assembly, scheme:
-            case "GRCh38", "http":
-                self.server = "http://rest.ensembl.org"
-            case "GRCh37", "http":
-                self.server = "http://grch37.rest.ensembl.org"
-            case "GRCh38", "https":
-                self.server = "https://rest.ensembl.org"
-            case "GRCh37", "https":
-                self.server = "https://grch37.rest.ensembl.org"
-
-    def get(self, endpoint, params, format):
-        match format:
-            case "json":
-                self.headers["Content-Type"] = "application/json"
-                response = self.session.get(urljoin(self.server, endpoint), headers=self.headers, params=params)
-                return response.json()
-            case "xml":
-                self.headers["Content-Type"] = "text/xml"
-                response = self.session.get(urljoin(self.server, endpoint), headers=self.headers, params=params)
-                return response.text
-
-    def post(self, endpoint, params, json, format):
-        match format:
-            case "json":
-                self.headers["Content-Type"] = "application/json"
-                response = self.session.post(urljoin(self.server, endpoint), headers=self.headers, params=params, json=json)
-                return response.json()
-            case "xml":
-                self.headers["Content-Type"] = "text/xml"
-                response = self.session.post(urljoin(self.server, endpoint), headers=self.headers, params=params, json=json)
-                return response.text
+        self.timeout = timeout
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._pool_maxsize = pool_maxsize or max(max_workers, requests.adapters.DEFAULT_POOLSIZE)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=self._pool_maxsize, pool_block=pool_block)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def _setup(self, assembly, scheme, max_workers, rate_limiter, retry, cache, memo_size, coalesce, headers, decoder, metrics, hooks):
+        """Set the attributes Ensembl and AsyncEnsembl share, whatever their transport"""
+        self.server = server_url(assembly, scheme)
+        self.headers = MappingProxyType(dict(headers or {}))
+        self._memo = LRUMemo(memo_size)
+        self._inflight = SingleFlight() if coalesce else None
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry = retry or RetryPolicy()
+        self.cache = cache
+        self.decoder = decoder or Decoder()
+        self.metrics = metrics or Metrics()
+        self.hooks = {event: list((hooks or {}).get(event, ())) for event in ("request", "response")}
+        self._release_checked = False
+
+    def _check_release(self):
+        """Drop the cached responses of this server once per client if it now serves another data release"""
+        if not self._release_checked:
+            with self._release_lock:
+                if not self._release_checked:
+                    release = [self._request("GET", "info/data", {}, None, "json", cache=False),
+                               self._request("GET", "info/rest", {}, None, "json", cache=False)]
+                    self.cache.set_release(self.server, release)
+                    self._release_checked = True
+
+    def _headers(self, format, headers=None):
+        """Build the headers of one request: the format's, then the client's, then the call's own"""
+        if format not in FORMAT_HEADERS:
+            raise ValueError(f"Unsupported format: {format!r}")
+        return {**FORMAT_HEADERS[format], **self.headers, **(headers or {})}
+
+    def _request(self, method, endpoint, params, json, format, cache=True, headers=None):
+        headers = self._headers(format, headers)
+        key = None
+        if cache and self.cache is not None and not self.decoder.typed(endpoint):
+            self._check_release()
+            key = self.cache.key(self.server, method, endpoint, params, json, format)
+            result = self.cache.get(key)
+            if result is not MISSING:
+                return result
+        if self._inflight is None:
+            return self._fetch(method, endpoint, params, json, format, headers, key)
+        return self._inflight.do(SingleFlight.key(method, endpoint, params, json, format, headers),
+                                 lambda: self._fetch(method, endpoint, params, json, format, headers, key))
+
+    def _fetch(self, method, endpoint, params, json, format, headers, key=None):
+        """Send one request, decode it and, given a cache key, store it in the cache"""
+        span = self._start_span(method, endpoint)
+        try:
+            response = self._send(method, endpoint, params, json, headers, span=span)
+            decoding = time.perf_counter()
+            result = self.decoder.decode(response.content, endpoint) if format == "json" else response.text
+            span["decode"] = time.perf_counter() - decoding
+        except Exception as error:
+            span["error"] = repr(error)
+            raise
+        finally:
+            self._finish_span(span)
+        if key is not None and response.ok:
+            self.cache.set(key, self.server, endpoint, result)
+        return result
+
+    def _start_span(self, method, endpoint):
+        span = new_span(method, endpoint)
+        for hook in self.hooks["request"]:
+            hook(span)
+        return span
+
+    def _finish_span(self, span):
+        span["duration"] = time.perf_counter() - span["started"]
+        self.metrics.record(span)
+        for hook in self.hooks["response"]:
+            hook(span)
+
+    def _send(self, method, endpoint, params, json, headers, stream=False, span=None):
+        """Send one request with rate limiting and retries and return its response, timing it into span"""
+        span = span if span is not None else new_span(method, endpoint)
+        retryable = self.retry.exceptions or (requests.ConnectionError, requests.Timeout)
+        attempt, started = 0, time.monotonic()
+        while True:
+            attempt += 1
+            span["attempts"] = attempt
+            span["rate_limit_wait"] += self.rate_limiter.acquire()
+            sent = time.perf_counter()
+            try:
+                response = self.session.request(method, urljoin(self.server, endpoint), headers=headers, params=params, json=json,
+                                                timeout=self.timeout, stream=stream)
+            except retryable:
+                delay = self.retry.delay(attempt)
+                if not self.retry.allows(attempt, started, delay):
+                    raise
+                span["retry_wait"] += delay
+                time.sleep(delay)
+                continue
+            # elapsed runs until the headers were parsed; without stream the body has been read by now
+            span["status"], span["ttfb"] = response.status_code, response.elapsed.total_seconds()
+            if not stream:
+                span["download"], span["bytes"] = max(0.0, time.perf_counter() - sent - span["ttfb"]), len(response.content)
+            self.rate_limiter.update(response.status_code, response.headers)
+            if response.status_code not in self.retry.statuses:
+                return response
+            # a Retry-After pause is already enforced by the rate limiter
+            delay = 0.0 if "Retry-After" in response.headers else self.retry.delay(attempt)
+            if not self.retry.allows(attempt, started, delay):
+                if not response.ok:
+                    response.close()
+                    response.raise_for_status()
+                return response
+            response.close()
+            span["retry_wait"] += delay
+            time.sleep(delay)
+
+    def iter_get(self, endpoint, params, key=None, headers=None):
+        """Stream a JSON GET response, yielding its records while the body arrives instead of decoding it whole.
+        Yields the elements of the top-level array, or of the array under `key`; see JSONItemStream.
+        Streamed responses bypass the cache and request coalescing."""
+        span = self._start_span("GET", endpoint)
+        try:
+            with self._send("GET", endpoint, params, None, self._headers("json", headers), stream=True, span=span) as response:
+                response.raise_for_status()
+                yield from iter_items(self._counted(response.iter_content(chunk_size=1 << 16), span), key)
+        except Exception as error:
+            span["error"] = repr(error)
+            raise
+        finally:
+            self._finish_span(span)
+
+    @staticmethod
+    def _counted(chunks, span):
+        """Pass chunks of a streamed body through, adding up their size in span"""
+        span["bytes"] = 0
+        for chunk in chunks:
+            span["bytes"] += len(chunk)
+            yield chunk
+
+    def get(self, endpoint, params, format, headers=None):
+        return self._request("GET", endpoint, params, None, format, headers=headers)
+
+    def post(self, endpoint, params, json, format, headers=None):
+        return self._request("POST", endpoint, params, json, format, headers=headers)
+
+    def micro_batcher(self, window=0.005, max_items=None):
+        """Return a MicroBatcher that merges single-item calls from many threads into batched POST requests"""
+        from .batcher import MicroBatcher
+        return MicroBatcher(self, window=window, max_items=max_items)
+
+    def typed(self):
+        """Return a view of this client whose gene, transcript, VEP and homology endpoints return slotted models, see ensembl.models"""
+        from .models import TypedClient
+        return TypedClient(self)
+
+    def _memoized(self, key, call):
+        result = self._memo.get(key)
+        if result is MISSING:
+            result = call()
+            if not failed(result):
+                self._memo.set(key, result)
+        return result
+
+    def cache_info(self):
+        """Hit/miss statistics of the in-memory metadata memo"""
+        return self._memo.info()
+
+    def clear_cache(self):
+        """Forget the memoized info_* responses"""
+        self._memo.clear()
+
+    def close(self):
+        """Release the worker pool and the pooled connections"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        self.session.close()
+
+    def _map(self, fn, chunks, concurrency=None):
+        """Apply fn to every chunk, in parallel when concurrency (or max_workers) allows, keeping input order.
+        Returns the list of results (None for failed chunks) and the list of (chunk, exception) failures.
+        A concurrency beyond pool_maxsize is capped to it, as further threads would have no pooled connection to use."""
+        workers = min(concurrency or self.max_workers, len(chunks), self._pool_maxsize)
+        results, errors = [None] * len(chunks), []
+        if workers <= 1:
+            for i, chunk in enumerate(chunks):
+                try:
+                    results[i] = fn(chunk)
+                except Exception as error:
+                    errors.append((chunk, error))
+            return results, errors
+        if concurrency:
+            executor = ThreadPoolExecutor(workers)
+        else:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(min(self.max_workers, self._pool_maxsize))
+                executor = self._executor
+        try:
+            futures = [executor.submit(fn, chunk) for chunk in chunks]
+            for i, future in enumerate(futures):
+                try:
+                    results[i] = future.result()
+                except Exception as error:
+                    errors.append((chunks[i], error))
+        finally:
+            if concurrency:
+                executor.shutdown()
+        return results, errors
+
+    def _splits(self, endpoint, format):
+        """Whether batch results of endpoint are cached per item rather than per request body"""
+        return (self.cache is not None and format == "json" and endpoint_prefix(BATCH_ITEM_KEYS, endpoint) is not None
+                and not self.decoder.typed(endpoint))
+
+    def _item_key(self, endpoint, key, item, params):
+        return self.cache.key(self.server, "ITEM", endpoint, params, {key: item}, "json")
+
+    def _cached_items(self, endpoint, key, items, params):
+        """Return the cached {item: part} of a batch and the items that still have to be fetched"""
+        keys = {item: self._item_key(endpoint, key, item, params) for item in dict.fromkeys(items)}
+        cached = self.cache.get_many(keys.values())
+        parts = {item: cached[item_key] for item, item_key in keys.items() if item_key in cached}
+        return parts, [item for item in keys if item not in parts]
+
+    def _store_items(self, endpoint, key, items, params, parts, fetched):
+        """Cache the per-item parts of a fresh batch response and reassemble the full response"""
+        fresh, unclaimed = split_batch(endpoint, fetched) if fetched is not None else ({}, [])
+        self.cache.set_many((self._item_key(endpoint, key, item, params), self.server, endpoint, part) for item, part in fresh.items())
+        return assemble_batch(endpoint, items, {**parts, **fresh}, unclaimed)
+
+    def _gather(self, fn, items, concurrency=None):
+        """Call fn on every item like post_batch sends chunks and return the results in order.
+        BatchError if some fail, with a ChunkError for each one the server answered with an error body."""
+        results, errors = self._map(lambda item: checked(fn(item)), items, concurrency)
+        if errors:
+            raise BatchError([result for result in results if result is not None], errors)
+        return results
+
+    def _then(self, result, fn):
+        """Apply fn to a result; AsyncEnsembl applies it once the awaitable result is done"""
+        return fn(result)
+
+    def _whole_region(self, species, region, fn):
+        """Call fn with region, resolving a bare sequence name such as "7" into the whole sequence with the memoized
+        info_assembly_region_name"""
+        if ":" in region:
+            return fn(region)
+
+        def resolved(info):
+            if failed(info):
+                raise ValueError(f"Unknown sequence region {region!r}: {info['error']}")
+            return fn(format_region(region, 1, info["length"]))
+        return self._then(self.info_assembly_region_name(species, region), resolved)
+
+    def post_batch(self, endpoint, key, items, params, format, batch_size=None, concurrency=None):
+        """POST a list of items split into chunks the server accepts, merging the JSON responses into one result.
+        Chunks are sent over `concurrency` (default: max_workers, at most pool_maxsize) threads; if some fail or are rejected with
+        an error body (ChunkError), BatchError carries the rest.
+        With a cache, results are stored per item and only the items missing from the cache are sent; an error body the
+        server answers them with is returned as is, not cached.
+        Non-JSON formats are not merged; a list with one response per chunk is returned instead."""
+        if not self._splits(endpoint, format):
+            return self._post_chunks(endpoint, key, items, params, format, batch_size, concurrency)
+        self._check_release()
+        parts, missing = self._cached_items(endpoint, key, items, params)
+        fetched, failure = None, None
+        if missing:
+            try:
+                fetched = self._post_chunks(endpoint, key, missing, params, format, batch_size, concurrency, cache=False)
+            except BatchError as error:
+                fetched, failure = error.results, error
+            if failed(fetched):
+                return fetched
+        result = self._store_items(endpoint, key, items, params, parts, fetched)
+        if failure:
+            raise BatchError(result, failure.errors)
+        return result
+
+    def _post_chunks(self, endpoint, key, items, params, format, batch_size=None, concurrency=None, cache=True):
+        batch_size = batch_size or max_post_size(endpoint) or len(items) or 1
+        if len(items) <= batch_size:
+            return self._request("POST", endpoint, params, {key: items}, format, cache=cache)
+        chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        results, errors = self._map(lambda chunk: checked(self._request("POST", endpoint, params, {key: chunk}, format, cache=cache)),
+                                    chunks, concurrency)
+        done = [result for result in results if result is not None]
+        merged = merge_batches(done) if format == "json" else done
+        if errors:
+            raise BatchError(merged, errors)
+        return merged
+
+    def paginate(self, search, key, *args, **kwargs):
+        """Yield the records under `key` of every page of a GA4GH search method, following nextPageToken lazily.
+        The next page is fetched in the background while the records of the current one are consumed."""
+        def fetch(token):
+            return search(*args, **kwargs, **({"pageToken": token} if token else {}))
+
+        executor = ThreadPoolExecutor(1)
+        try:
+            page = fetch(kwargs.pop("pageToken", None))
+            while True:
+                token = page.get("nextPageToken")
+                following = executor.submit(fetch, token) if token else None
+                yield from page.get(key) or []
+                if following is None:
+                    return
+                page = following.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     @singledispatchmethod
     def archive(self, id: str, format="json", **kwargs):
@@ -48,9 +500,9 @@ class Ensembl:
         return self.get(endpoint=f"archive/id/{id}", params=kwargs, format=format)
 
     @archive.register
-    def _(self, id: list, format="json", **kwargs):
+    def _(self, id: list, format="json", concurrency=None, **kwargs):
         """Retrieve the latest version for a set of identifiers"""
-        return self.post(endpoint=f"archive/id", json={"id": id}, params=kwargs, format=format)
+        return self.post_batch(endpoint=f"archive/id", key="id", items=id, params=kwargs, format=format, concurrency=concurrency)
 
     def cafe_genetree_id(self, id, format="json", **kwargs):
         """Retrieves a cafe tree of the gene tree using the gene tree stable identifier"""
@@ -80,6 +532,10 @@ class Ensembl:
         """Retrieves genomic alignments as separate blocks based on a region and species"""
         return self.get(endpoint=f"alignment/region/{species}/{region}", params=kwargs, format=format)
 
+    def iter_alignment_region(self, species, region, **kwargs):
+        """Streaming alignment_region: yields the alignment blocks one at a time as they arrive"""
+        return self.iter_get(f"alignment/region/{species}/{region}", params=kwargs)
+
     def homology_id(self, id, format="json", **kwargs):
         """Retrieves homology information (orthologs) by Ensembl gene id"""
         return self.get(endpoint=f"homology/id/{id}", params=kwargs, format=format)
@@ -102,69 +558,85 @@ class Ensembl:
         """Performs a lookup based upon the primary accession or display label of an external reference and returning the information we hold about the entry"""
         return self.get(f"xrefs/name/{species}/{name}", params=kwargs, format=format)
 
+    @memoized
     def info_analysis(self, species, format="json", **kwargs):
         """List the names of analyses involved in generating Ensembl data."""
         return self.get(f"info/analysis/{species}", params=kwargs, format=format)
 
+    @memoized
     def info_assembly(self, species, format="json", **kwargs):
         """List the currently available assemblies for a species, along with toplevel sequences, chromosomes and cytogenetic bands."""
         return self.get(f"info/assembly/{species}", params=kwargs, format=format)
 
+    @memoized
     def info_assembly_region_name(self, species, region_name, format="json", **kwargs):
         """Returns information about the specified toplevel sequence region for the given species."""
         return self.get(f"info/assembly/{species}/{region_name}", params=kwargs, format=format)
 
+    @memoized
     def info_biotypes(self, species, format="json", **kwargs):
         """List the functional classifications of gene models that Ensembl associates with a particular species.
         Useful for restricting the type of genes/transcripts retrieved by other endpoints."""
         return self.get(f"info/biotypes/{species}", params=kwargs, format=format)
 
+    @memoized
     def info_biotypes_groups(self, format="json", **kwargs):
         """Without argument the list of available biotype groups is returned.
         With :group argument provided, list the properties of biotypes within that group.
         Object type (gene or transcript) can be provided for filtering."""
         return self.get(f"info/biotypes/groups", params=kwargs, format=format)
 
+    @memoized
     def info_biotypes_name(self, name, format="json", **kwargs):
         """List the properties of biotypes with a given name. Object type (gene or transcript) can be provided for filtering."""
         return self.get(f"info/biotypes/name/{name}", params=kwargs, format=format)
 
+    @memoized
     def info_compara_methods(self, format="json", **kwargs):
         """List all compara analyses available (an analysis defines the type of comparative data)."""
         return self.get(f"info/compara/methods", params=kwargs, format=format)
 
+    @memoized
     def info_compara_species_sets(self, method, format="json", **kwargs):
         """List all collections of species analysed with the specified compara method."""
         return self.get(f"info/compara/species_sets/{method}", params=kwargs, format=format)
 
+    @memoized
     def info_comparas(self, format="json", **kwargs):
         """Lists all available comparative genomics databases and their data release."""
         return self.get(f"info/comparas", params=kwargs, format=format)
 
+    @memoized
     def info_data(self, format="json", **kwargs):
         """Shows the data releases available on this REST server."""
         return self.get(f"info/data", params=kwargs, format=format)
 
+    @memoized
     def info_eg_version(self, format="json", **kwargs):
         """Returns the Ensembl Genomes version of the databases backing this service"""
         return self.get(f"info/eg_version", params=kwargs, format=format)
 
+    @memoized
     def info_external_dbs(self, species, format="json", **kwargs):
         """Lists all available external sources for a species."""
         return self.get(f"info/external_dbs/{species}", params=kwargs, format=format)
 
+    @memoized
     def info_divisions(self, format="json", **kwargs):
         """Get list of all Ensembl divisions for which information is available"""
         return self.get(f"info/divisions", params=kwargs, format=format)
 
+    @memoized
     def info_genomes(self, name, format="json", **kwargs):
         """Find information about a given genome"""
         return self.get(f"info/genomes/{name}", params=kwargs, format=format)
 
+    @memoized
     def info_genomes_accession(self, accession, format="json", **kwargs):
         """Find information about genomes containing a specified INSDC accession"""
         return self.get(f"info/genomes/accession/{accession}", params=kwargs, format=format)
 
+    @memoized
     def info_genomes_assembly(self, assembly_id, format="json", **kwargs):
         """Find information about a genome with a specified assembly"""
         return self.get(f"info/genomes/assembly/{assembly_id}", params=kwargs, format=format)
@@ -173,6 +645,11 @@ class Ensembl:
         """Find information about all genomes in a given division. May be large for Ensembl Bacteria."""
         return self.get(f"info/genomes/division/{division}", params=kwargs, format=format)
 
+    def iter_info_genomes_division(self, division, **kwargs):
+        """Streaming info_genomes_division: yields the genomes one at a time as they arrive"""
+        return self.iter_get(f"info/genomes/division/{division}", params=kwargs)
+
+    @memoized
     def info_genomes_taxonomy(self, taxon_name, format="json", **kwargs):
         """Find information about all genomes beneath a given node of the taxonomy"""
         return self.get(f"info/genomes/taxonomy/{taxon_name}", params=kwargs, format=format)
@@ -181,30 +658,41 @@ class Ensembl:
         """Checks if the service is alive."""
         return self.get(f"info/ping", params=kwargs, format=format)
 
+    @memoized
     def info_rest(self, format="json", **kwargs):
         """Shows the current version of the Ensembl REST API."""
         return self.get(f"info/rest", params=kwargs, format=format)
 
+    @memoized
     def info_software(self, format="json", **kwargs):
         """Shows the current version of the Ensembl API used by the REST server."""
         return self.get(f"info/software", params=kwargs, format=format)
 
+    @memoized
     def info_species(self, format="json", **kwargs):
         """Lists all available species, their aliases, available adaptor groups and data release."""
         return self.get(f"info/species", params=kwargs, format=format)
 
+    def iter_info_species(self, **kwargs):
+        """Streaming info_species: yields the species one at a time as they arrive"""
+        return self.iter_get(f"info/species", params=kwargs, key="species")
+
+    @memoized
     def info_variation(self, species, format="json", **kwargs):
         """List the variation sources used in Ensembl for a species."""
         return self.get(f"info/variation/{species}", params=kwargs, format=format)
 
+    @memoized
     def info_variation_consequence_types(self, format="json", **kwargs):
         """Lists all variant consequence types."""
         return self.get(f"info/variation/consequence_types", params=kwargs, format=format)
 
+    @memoized
     def info_variation_populations(self, species, population_name, format="json", **kwargs):
         """List all individuals for a population from a species"""
         return self.get(f"info/variation/populations/{species}/{population_name}", params=kwargs, format=format)
 
+    @memoized
     def info_variation_species(self, species, format="json", **kwargs):
         """List all populations for a species"""
         return self.get(f"info/variation/populations/{species}", params=kwargs, format=format)
@@ -222,15 +710,28 @@ class Ensembl:
         """Computes and returns LD values between all pairs of variants in the defined region."""
         return self.get(f"ld/{species}/region/{region}/{population_name}", params=kwargs, format=format)
 
+    def iter_ld_region(self, species, region, population_name, **kwargs):
+        """Streaming ld_region: yields the variant pairs one at a time as they arrive"""
+        return self.iter_get(f"ld/{species}/region/{region}/{population_name}", params=kwargs)
+
+    def ld_region_tiled(self, species, region, population_name, tile_size=None, overlap=None, concurrency=None, **kwargs):
+        """ld_region for regions larger than the server's window: fetched in overlapping tiles concurrently, each pair returned once.
+        Pairs of variants further apart than `overlap` (default: half a tile) are only found if they share a tile.
+        A bare sequence name such as "7" covers the whole sequence."""
+        tile_size = tile_size or MAX_REGION_SIZE["ld"]
+        return self._whole_region(species, region, lambda region: self._then(
+            self._gather(lambda tile: self.ld_region(species, tile, population_name, **kwargs),
+                         tile_region(region, tile_size, tile_size // 2 if overlap is None else overlap), concurrency), merge_ld))
+
     @singledispatchmethod
     def lookup_id(self, id: str, format="json", **kwargs):
         """Find the species and database for a single identifier e.g. gene, transcript, protein"""
         return self.get(endpoint=f"lookup/id/{id}", params=kwargs, format=format)
 
     @lookup_id.register
-    def _(self, id: list, format="json", **kwargs):
+    def _(self, id: list, format="json", concurrency=None, **kwargs):
         """Find the species and database for several identifiers. IDs that are not found are returned with no data."""
-        return self.post(endpoint=f"lookup/id", params=kwargs, json={"ids": id}, format=format)
+        return self.post_batch(endpoint=f"lookup/id", params=kwargs, key="ids", items=id, format=format, concurrency=concurrency)
 
     @singledispatchmethod
     def lookup_symbol(self, symbol: str, format="json", species="human", **kwargs):
@@ -238,9 +739,9 @@ class Ensembl:
         return self.get(f"lookup/symbol/{species}/{symbol}", params=kwargs, format=format)
 
     @lookup_symbol.register
-    def _(self, symbol: list, species="human", format="json", **kwargs):
+    def _(self, symbol: list, species="human", format="json", concurrency=None, **kwargs):
         """Find the species and database for a set of symbols in a linked external database. Unknown symbols are omitted from the response."""
-        return self.post(f"lookup/symbol/{species}", params=kwargs, json={"symbols": symbol}, format=format)
+        return self.post_batch(f"lookup/symbol/{species}", params=kwargs, key="symbols", items=symbol, format=format, concurrency=concurrency)
 
     def map_cdna(self, id, region, format="json", **kwargs):
         """Convert from cDNA coordinates to genomic coordinates. Output reflects forward orientation coordinates as returned from the Ensembl API."""
@@ -298,6 +799,17 @@ class Ensembl:
         """Retrieves features (e.g. genes, transcripts, variants and more) that overlap a given region."""
         return self.get(f"overlap/region/{species}/{region}", params=kwargs, format=format)
 
+    def iter_overlap_region(self, species, region, **kwargs):
+        """Streaming overlap_region: yields the features one at a time as they arrive"""
+        return self.iter_get(f"overlap/region/{species}/{region}", params=kwargs)
+
+    def overlap_region_tiled(self, species, region, tile_size=None, concurrency=None, **kwargs):
+        """overlap_region for regions of any size: fetched in server-sized tiles concurrently, features spanning tiles returned once.
+        A bare sequence name such as "7" covers the whole sequence."""
+        return self._whole_region(species, region, lambda region: self._then(
+            self._gather(lambda tile: self.overlap_region(species, tile, **kwargs), tile_region(region, tile_size or MAX_REGION_SIZE["overlap"]),
+                         concurrency), merge_features))
+
     def overlap_translation(self, id, format="json", **kwargs):
         """Retrieve features related to a specific Translation as described by its stable ID (e.g. domains, variants)."""
         return self.get(f"overlap/translation/{id}", params=kwargs, format=format)
@@ -352,9 +864,9 @@ class Ensembl:
         return self.get(f"sequence/id/{id}", params=kwargs, format=format)
 
     @sequence_id.register
-    def _(self, id: list, format="json", **kwargs):
+    def _(self, id: list, format="json", concurrency=None, **kwargs):
         """Request multiple types of sequence by a stable identifier list."""
-        return self.post(f"sequence/id", json={'ids': id}, params=kwargs, format=format)
+        return self.post_batch(f"sequence/id", key='ids', items=id, params=kwargs, format=format, concurrency=concurrency)
 
     @singledispatchmethod
     def sequence_region(self, region: str, species, format="json", **kwargs):
@@ -362,9 +874,16 @@ class Ensembl:
         return self.get(f"sequence/region/{species}/{region}", params=kwargs, format=format)
 
     @sequence_region.register
-    def _(self, region: list, species, format="json", **kwargs):
+    def _(self, region: list, species, format="json", concurrency=None, **kwargs):
         """Request multiple types of sequence by a list of regions."""
-        return self.post(f"sequence/region/{species}", json={'region': region}, params=kwargs, format=format)
+        return self.post_batch(f"sequence/region/{species}", key='regions', items=region, params=kwargs, format=format, concurrency=concurrency)
+
+    def sequence_region_tiled(self, region, species, tile_size=None, concurrency=None, **kwargs):
+        """sequence_region for regions of any size: fetched in server-sized tiles concurrently and stitched into one sequence.
+        A bare sequence name such as "7" covers the whole sequence."""
+        return self._whole_region(species, region, lambda region: self._then(
+            self._gather(lambda tile: self.sequence_region(tile, species, **kwargs), tile_region(region, tile_size or MAX_REGION_SIZE["sequence"]),
+                         concurrency), lambda sequences: stitch_sequences(region, sequences)))
 
     def transcript_haplotypes(self, species, id, format="json", **kwargs):
         """Computes observed transcript haplotype sequences based on phased genotype data"""
@@ -392,10 +911,18 @@ class Ensembl:
         """Return a list of sequence annotation features in GA4GH format"""
         return self.post(f"ga4gh/features/search", json=dict(end=end, referenceName=referenceName, start=start, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_features_search(self, end, referenceName, start, **kwargs):
+        """Iterate over all the features of ga4gh_features_search, following page tokens"""
+        return self.paginate(self.ga4gh_features_search, "features", end, referenceName, start, **kwargs)
+
     def ga4gh_callsets_search(self, variantSetId, format="json", **kwargs):
         """Return a list of sets of genotype calls for specific samples in GA4GH format"""
         return self.post(f"ga4gh/callsets/search", json=dict(variantSetId=variantSetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_callsets_search(self, variantSetId, **kwargs):
+        """Iterate over all the callSets of ga4gh_callsets_search, following page tokens"""
+        return self.paginate(self.ga4gh_callsets_search, "callSets", variantSetId, **kwargs)
+
     def ga4gh_callsets(self, id, format="json", **kwargs):
         """Return the GA4GH record for a specific CallSet given its identifier"""
         return self.get(f"ga4gh/callsets/{id}", params=kwargs, format=format)
@@ -404,6 +931,10 @@ class Ensembl:
         """Return a list of datasets in GA4GH format"""
         return self.post(f"ga4gh/datasets/search", json=kwargs, params={}, format=format)
 
+    def iter_ga4gh_datasets_search(self, **kwargs):
+        """Iterate over all the datasets of ga4gh_datasets_search, following page tokens"""
+        return self.paginate(self.ga4gh_datasets_search, "datasets", **kwargs)
+
     def ga4gh_datasets(self, id, format="json", **kwargs):
         """Return the GA4GH record for a specific dataset given its identifier"""
         return self.get(f"ga4gh/datasets/{id}", params=kwargs, format=format)
@@ -412,6 +943,10 @@ class Ensembl:
         """Return a list of feature sets in GA4GH format"""
         return self.post(f"ga4gh/featuresets/search", json=dict(datasetId=datasetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_featuresets_search(self, datasetId, **kwargs):
+        """Iterate over all the featureSets of ga4gh_featuresets_search, following page tokens"""
+        return self.paginate(self.ga4gh_featuresets_search, "featureSets", datasetId, **kwargs)
+
     def ga4gh_featuresets(self, id, format="json", **kwargs):
         """Return the GA4GH record for a specific featureSet given its identifier"""
         return self.get(f"ga4gh_featuresets/{id}", params=kwargs, format=format)
@@ -424,14 +959,26 @@ class Ensembl:
         """Return variant call information in GA4GH format for a region on a reference sequence"""
         return self.post(f"ga4gh/variants/search", json=dict(end=end, referenceName=referenceName, start=start, variantSetId=variantSetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_variants_search(self, end, referenceName, start, variantSetId, **kwargs):
+        """Iterate over all the variants of ga4gh_variants_search, following page tokens"""
+        return self.paginate(self.ga4gh_variants_search, "variants", end, referenceName, start, variantSetId, **kwargs)
+
     def ga4gh_variantannotations_search(self, variantAnnotationSetId, format="json", **kwargs):
         """Return variant annotation information in GA4GH format for a region on a reference sequence"""
         return self.post(f"ga4gh/variantannotations/search", json=dict(variantAnnotationSetId=variantAnnotationSetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_variantannotations_search(self, variantAnnotationSetId, **kwargs):
+        """Iterate over all the variantAnnotations of ga4gh_variantannotations_search, following page tokens"""
+        return self.paginate(self.ga4gh_variantannotations_search, "variantAnnotations", variantAnnotationSetId, **kwargs)
+
     def ga4gh_variantsets_search(self, datasetId, format="json", **kwargs):
         """Return a list of variant sets in GA4GH format"""
         return self.post(f"ga4gh/variantsets/search", json=dict(datasetId=datasetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_variantsets_search(self, datasetId, **kwargs):
+        """Iterate over all the variantSets of ga4gh_variantsets_search, following page tokens"""
+        return self.paginate(self.ga4gh_variantsets_search, "variantSets", datasetId, **kwargs)
+
     def ga4gh_variantsets(self, id, format="json", **kwargs):
         """Return the GA4GH record for a specific VariantSet given its identifier"""
         return self.get(f"ga4gh/variantsets/{id}", params=kwargs, format=format)
@@ -440,6 +987,10 @@ class Ensembl:
         """Return a list of reference sequences in GA4GH format"""
         return self.post(f"ga4gh/references/search", json=dict(referenceSetId=referenceSetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_references_search(self, referenceSetId, **kwargs):
+        """Iterate over all the references of ga4gh_references_search, following page tokens"""
+        return self.paginate(self.ga4gh_references_search, "references", referenceSetId, **kwargs)
+
     def ga4gh_references(self, id, format="json", **kwargs):
         """Return data for a specific reference in GA4GH format by id"""
         return self.get(f"ga4gh/references/{id}", params=kwargs, format=format)
@@ -448,6 +999,10 @@ class Ensembl:
         """Return a list of reference sets in GA4GH format"""
         return self.post(f"ga4gh/referencesets/search", json=dict(referenceSetId=referenceSetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_referencesets_search(self, referenceSetId, **kwargs):
+        """Iterate over all the referenceSets of ga4gh_referencesets_search, following page tokens"""
+        return self.paginate(self.ga4gh_referencesets_search, "referenceSets", referenceSetId, **kwargs)
+
     def ga4gh_referencesets(self, id, format="json", **kwargs):
         """Return data for a specific reference set in GA4GH format"""
         return self.get(f"ga4gh/referencesets/{id}", params=kwargs, format=format)
@@ -456,6 +1011,10 @@ class Ensembl:
         """Return a list of annotation sets in GA4GH format"""
         return self.post(f"ga4gh/variantannotationsets/search", json=dict(variantSetId=variantSetId, **kwargs), params={}, format=format)
 
+    def iter_ga4gh_variantannotationsets_search(self, variantSetId, **kwargs):
+        """Iterate over all the variantAnnotationSets of ga4gh_variantannotationsets_search, following page tokens"""
+        return self.paginate(self.ga4gh_variantannotationsets_search, "variantAnnotationSets", variantSetId, **kwargs)
+
     def ga4gh_variantannotationsets(self, id, format="json", **kwargs):
         """Return meta data for a specific annotation set in GA4GH format"""
         return self.get(f"ga4gh/variantannotationsets/{id}", params=kwargs, format=format)
@@ -466,9 +1025,9 @@ class Ensembl:
         return self.get(endpoint=f"variant_recoder/{species}/{id}", params=kwargs, format=format)
 
     @variant_recoder.register
-    def _(self, id: list, species='human', format="json", **kwargs):
+    def _(self, id: list, species='human', format="json", concurrency=None, **kwargs):
         """Translate a list of variant identifiers, HGVS notations or genomic SPDI notations to all possible variant IDs, HGVS and genomic SPDI"""
-        return self.post(endpoint=f"variant_recoder/{species}", params=kwargs, json={"ids": id}, format=format)
+        return self.post_batch(endpoint=f"variant_recoder/{species}", params=kwargs, key="ids", items=id, format=format, concurrency=concurrency)
 
     @singledispatchmethod
     def variation(self, id: str, species='human', format="json", **kwargs):
@@ -476,9 +1035,9 @@ class Ensembl:
         return self.get(endpoint=f"variation/{species}/{id}", params=kwargs, format=format)
 
     @variation.register
-    def _(self, id: list, species='human', format="json", **kwargs):
+    def _(self, id: list, species='human', format="json", concurrency=None, **kwargs):
         """Uses a list of variant identifiers (e.g. rsID) to return the variation features including optional genotype, phenotype and population data"""
-        return self.post(endpoint=f"variation/{species}", params=kwargs, json={"ids": id}, format=format)
+        return self.post_batch(endpoint=f"variation/{species}", params=kwargs, key="ids", items=id, format=format, concurrency=concurrency)
 
     def variation_pmcid(self, pmcid, species='human', format="json", **kwargs):
         """Fetch variants by publication using PubMed Central reference number (PMCID)"""
@@ -494,9 +1053,9 @@ class Ensembl:
         return self.get(endpoint=f"vep/{species}/hgvs/{hgvs}", params=kwargs, format=format)
 
     @vep_hgvs.register
-    def _(self, hgvs: list, species='human', format="json", **kwargs):
+    def _(self, hgvs: list, species='human', format="json", concurrency=None, **kwargs):
         """Fetch variant consequences for multiple HGVS notations"""
-        return self.post(endpoint=f"vep/{species}/hgvs", params=kwargs, json={"hgvs_notations": hgvs}, format=format)
+        return self.post_batch(endpoint=f"vep/{species}/hgvs", params=kwargs, key="hgvs_notations", items=hgvs, format=format, concurrency=concurrency)
 
     @singledispatchmethod
     def vep_id(self, id: str, species='human', format="json", **kwargs):
@@ -504,9 +1063,9 @@ class Ensembl:
         return self.get(endpoint=f"vep/{species}/id/{id}", params=kwargs, format=format)
 
     @vep_id.register
-    def _(self, id: list, species='human', format="json", **kwargs):
+    def _(self, id: list, species='human', format="json", concurrency=None, **kwargs):
         """Fetch variant consequences for multiple ids"""
-        return self.post(endpoint=f"vep/{species}/id", params=kwargs, json={"ids": id}, format=format)
+        return self.post_batch(endpoint=f"vep/{species}/id", params=kwargs, key="ids", items=id, format=format, concurrency=concurrency)
 
     @singledispatchmethod
     def vep_region(self, region: str, allele, species='human', format="json", **kwargs):
@@ -514,6 +1073,262 @@ class Ensembl:
         return self.get(endpoint=f"vep/{species}/region/{region}/{allele}", params=kwargs, format=format)
 
     @vep_region.register
-    def _(self, region: list, species='human', format="json", **kwargs):
+    def _(self, region: list, species='human', format="json", concurrency=None, **kwargs):
         """Fetch variant consequences for multiple regions"""
-        return self.post(endpoint=f"vep/{species}/region", params=kwargs, json={"variants": region}, format=format)
+        return self.post_batch(endpoint=f"vep/{species}/region", params=kwargs, key="variants", items=region, format=format, concurrency=concurrency)
+
+
+class AsyncEnsembl(Ensembl):
+    """asyncio flavour of Ensembl built on a keep-alive aiohttp connection pool.
+    The pool holds up to limit connections, limit_per_host per host; timeout and keep_alive work as for Ensembl.
+    Every endpoint method, including the str/list overloads, returns an awaitable:
+
+        async with AsyncEnsembl() as ensembl:
+            gene = await ensembl.lookup_id("ENSG00000157764")
+    """
+
+    def __init__(self, assembly="GRCh38", scheme="http", max_workers=1, rate_limiter=None, retry=None, cache=None, memo_size=256,
+                 coalesce=True, headers=None, limit=100, limit_per_host=0, timeout=(3.05, 60), keep_alive=True, keepalive_timeout=15,
+                 decoder=None, metrics=None, hooks=None):
+        if aiohttp is None:
+            raise ImportError("AsyncEnsembl requires aiohttp")
+        self._setup(assembly, scheme, max_workers, rate_limiter, retry, cache, memo_size, coalesce, headers, decoder, metrics, hooks)
+        self._release_lock = asyncio.Lock()
+        self._connector_options = dict(limit=limit, limit_per_host=limit_per_host, force_close=not keep_alive)
+        if keep_alive:
+            self._connector_options["keepalive_timeout"] = keepalive_timeout
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def micro_batcher(self, window=0.005, max_items=None):
+        """Not available: MicroBatcher blocks threads on futures, which would stall the event loop"""
+        raise TypeError("AsyncEnsembl has no micro-batcher; gather the calls or use the list overloads instead")
+
+    async def _memoized(self, key, call):
+        result = self._memo.get(key)
+        if result is MISSING:
+            result = await call()
+            if not failed(result):
+                self._memo.set(key, result)
+        return result
+
+    def _session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(**self._connector_options), timeout=self.timeout,
+                                                 trace_configs=[self._trace_config()])
+        return self.session
+
+    @staticmethod
+    def _trace_config():
+        """aiohttp trace hooks adding the DNS lookup and connection set-up times of a request to its span"""
+        trace = aiohttp.TraceConfig()
+        for timing, on_start, on_end in (("dns", trace.on_dns_resolvehost_start, trace.on_dns_resolvehost_end),
+                                         ("connect", trace.on_connection_create_start, trace.on_connection_create_end)):
+            async def start(session, context, params, timing=timing):
+                setattr(context, timing, time.perf_counter())
+
+            async def end(session, context, params, timing=timing):
+                span = context.trace_request_ctx
+                if span is not None:
+                    span[timing] = (span[timing] or 0.0) + time.perf_counter() - getattr(context, timing)
+
+            on_start.append(start)
+            on_end.append(end)
+        return trace
+
+    @staticmethod
+    def _query(params):
+        """aiohttp only takes str/int/float query values, so drop None like requests does and send booleans as 0/1"""
+        return {key: int(value) if isinstance(value, bool) else value for key, value in params.items() if value is not None}
+
+    async def _check_release(self):
+        if not self._release_checked:
+            async with self._release_lock:
+                if not self._release_checked:
+                    release = [await self._request("GET", "info/data", {}, None, "json", cache=False),
+                               await self._request("GET", "info/rest", {}, None, "json", cache=False)]
+                    self.cache.set_release(self.server, release)
+                    self._release_checked = True
+
+    async def _request(self, method, endpoint, params, json, format, cache=True, headers=None):
+        headers = self._headers(format, headers)
+        key = None
+        if cache and self.cache is not None and not self.decoder.typed(endpoint):
+            await self._check_release()
+            key = self.cache.key(self.server, method, endpoint, params, json, format)
+            result = self.cache.get(key)
+            if result is not MISSING:
+                return result
+        if self._inflight is None:
+            return await self._fetch(method, endpoint, params, json, format, headers, key)
+        return await self._inflight.do_async(SingleFlight.key(method, endpoint, params, json, format, headers),
+                                             lambda: self._fetch(method, endpoint, params, json, format, headers, key))
+
+    async def _fetch(self, method, endpoint, params, json, format, headers, key=None):
+        span = self._start_span(method, endpoint)
+        try:
+            response = await self._send(method, endpoint, params, json, headers, span=span)
+            try:
+                reading = time.perf_counter()
+                body = await response.read()
+                span["download"], span["bytes"] = time.perf_counter() - reading, len(body)
+                decoding = time.perf_counter()
+                result = self.decoder.decode(body, endpoint) if format == "json" else body.decode(response.get_encoding())
+                span["decode"] = time.perf_counter() - decoding
+            finally:
+                response.release()
+        except Exception as error:
+            span["error"] = repr(error)
+            raise
+        finally:
+            self._finish_span(span)
+        if key is not None and response.ok:
+            self.cache.set(key, self.server, endpoint, result)
+        return result
+
+    async def _send(self, method, endpoint, params, json, headers, span=None):
+        """Send one request with rate limiting and retries and return its response, which the caller releases"""
+        span = span if span is not None else new_span(method, endpoint)
+        retryable = self.retry.exceptions or (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        attempt, started = 0, time.monotonic()
+        while True:
+            attempt += 1
+            span["attempts"] = attempt
+            span["rate_limit_wait"] += await self.rate_limiter.acquire_async()
+            sent = time.perf_counter()
+            try:
+                response = await self._session().request(method, urljoin(self.server, endpoint), headers=headers, params=self._query(params), json=json,
+                                                          trace_request_ctx=span)
+            except retryable:
+                delay = self.retry.delay(attempt)
+                if not self.retry.allows(attempt, started, delay):
+                    raise
+                span["retry_wait"] += delay
+                await asyncio.sleep(delay)
+                continue
+            span["status"], span["ttfb"] = response.status, time.perf_counter() - sent
+            self.rate_limiter.update(response.status, response.headers)
+            if response.status not in self.retry.statuses:
+                return response
+            delay = 0.0 if "Retry-After" in response.headers else self.retry.delay(attempt)
+            if not self.retry.allows(attempt, started, delay):
+                if not response.ok:
+                    response.release()
+                    response.raise_for_status()
+                return response
+            response.release()
+            span["retry_wait"] += delay
+            await asyncio.sleep(delay)
+
+    async def paginate(self, search, key, *args, **kwargs):
+        """Async generator flavour of Ensembl.paginate; the next page is fetched by a background task"""
+        def fetch(token):
+            return asyncio.ensure_future(search(*args, **kwargs, **({"pageToken": token} if token else {})))
+
+        following = fetch(kwargs.pop("pageToken", None))
+        try:
+            while following is not None:
+                page = await following
+                token = page.get("nextPageToken")
+                following = fetch(token) if token else None
+                for record in page.get(key) or []:
+                    yield record
+        finally:
+            if following is not None:
+                following.cancel()
+
+    async def iter_get(self, endpoint, params, key=None, headers=None):
+        """Async generator flavour of Ensembl.iter_get"""
+        span = self._start_span("GET", endpoint)
+        try:
+            response = await self._send("GET", endpoint, params, None, self._headers("json", headers), span=span)
+            try:
+                response.raise_for_status()
+                stream, span["bytes"] = JSONItemStream(key), 0
+                async for chunk in response.content.iter_chunked(1 << 16):
+                    span["bytes"] += len(chunk)
+                    for record in stream.feed(chunk):
+                        yield record
+                for record in stream.close():
+                    yield record
+            finally:
+                response.release()
+        except Exception as error:
+            span["error"] = repr(error)
+            raise
+        finally:
+            self._finish_span(span)
+
+    async def get(self, endpoint, params, format, headers=None):
+        return await self._request("GET", endpoint, params, None, format, headers=headers)
+
+    async def post(self, endpoint, params, json, format, headers=None):
+        return await self._request("POST", endpoint, params, json, format, headers=headers)
+
+    async def post_batch(self, endpoint, key, items, params, format, batch_size=None, concurrency=None):
+        """Awaitable Ensembl.post_batch; at most `concurrency` (default: max_workers) chunks are in flight at once"""
+        if not self._splits(endpoint, format):
+            return await self._post_chunks(endpoint, key, items, params, format, batch_size, concurrency)
+        await self._check_release()
+        parts, missing = self._cached_items(endpoint, key, items, params)
+        fetched, failure = None, None
+        if missing:
+            try:
+                fetched = await self._post_chunks(endpoint, key, missing, params, format, batch_size, concurrency, cache=False)
+            except BatchError as error:
+                fetched, failure = error.results, error
+            if failed(fetched):
+                return fetched
+        result = self._store_items(endpoint, key, items, params, parts, fetched)
+        if failure:
+            raise BatchError(result, failure.errors)
+        return result
+
+    async def _gather(self, fn, items, concurrency=None):
+        semaphore = asyncio.Semaphore(concurrency or self.max_workers)
+
+        async def call(item):
+            async with semaphore:
+                return checked(await fn(item))
+
+        outcomes = await asyncio.gather(*(call(item) for item in items), return_exceptions=True)
+        errors = [(item, outcome) for item, outcome in zip(items, outcomes) if isinstance(outcome, BaseException)]
+        if errors:
+            raise BatchError([outcome for outcome in outcomes if not isinstance(outcome, BaseException)], errors)
+        return outcomes
+
+    async def _then(self, result, fn):
+        result = fn(await result)
+        return await result if inspect.isawaitable(result) else result
+
+    async def _post_chunks(self, endpoint, key, items, params, format, batch_size=None, concurrency=None, cache=True):
+        batch_size = batch_size or max_post_size(endpoint) or len(items) or 1
+        if len(items) <= batch_size:
+            return await self._request("POST", endpoint, params, {key: items}, format, cache=cache)
+        chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        semaphore = asyncio.Semaphore(concurrency or self.max_workers)
+
+        async def post(chunk):
+            async with semaphore:
+                return checked(await self._request("POST", endpoint, params, {key: chunk}, format, cache=cache))
+
+        outcomes = await asyncio.gather(*(post(chunk) for chunk in chunks), return_exceptions=True)
+        done = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+        errors = [(chunk, outcome) for chunk, outcome in zip(chunks, outcomes) if isinstance(outcome, BaseException)]
+        merged = merge_batches(done) if format == "json" else done
+        if errors:
+            raise BatchError(merged, errors)
+        return merged
@@ -0,0 +1,141 @@
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+def _schemas():
+    string, integer, number, strings = pa.string(), pa.int64(), pa.float64(), pa.list_(pa.string())
+    return {
+        "vep": {
+            "variants": [("input", string), ("id", string), ("seq_region_name", string), ("start", integer), ("end", integer), ("strand", integer),
+                         ("allele_string", string), ("assembly_name", string), ("most_severe_consequence", string)],
+            "transcript_consequences": [("input", string), ("transcript_id", string), ("gene_id", string), ("gene_symbol", string),
+                                        ("biotype", string), ("consequence_terms", strings), ("impact", string), ("variant_allele", string),
+                                        ("cdna_start", integer), ("cdna_end", integer), ("cds_start", integer), ("cds_end", integer),
+                                        ("protein_start", integer), ("protein_end", integer), ("amino_acids", string), ("codons", string),
+                                        ("strand", integer), ("canonical", integer), ("sift_prediction", string), ("sift_score", number),
+                                        ("polyphen_prediction", string), ("polyphen_score", number)],
+            "colocated_variants": [("input", string), ("id", string), ("seq_region_name", string), ("start", integer), ("end", integer),
+                                   ("strand", integer), ("allele_string", string), ("minor_allele", string), ("minor_allele_freq", number),
+                                   ("clin_sig", strings), ("somatic", integer)],
+        },
+        "lookup": {
+            "entities": [("id", string), ("object_type", string), ("species", string), ("db_type", string), ("biotype", string),
+                         ("display_name", string), ("description", string), ("seq_region_name", string), ("start", integer), ("end", integer),
+                         ("strand", integer), ("assembly_name", string), ("version", integer), ("logic_name", string), ("source", string),
+                         ("canonical_transcript", string), ("Parent", string)],
+            "transcripts": [("Parent", string), ("id", string), ("display_name", string), ("biotype", string), ("seq_region_name", string),
+                            ("start", integer), ("end", integer), ("strand", integer), ("version", integer), ("is_canonical", integer)],
+            "exons": [("Parent", string), ("id", string), ("seq_region_name", string), ("start", integer), ("end", integer), ("strand", integer),
+                      ("version", integer)],
+        },
+        "variation": {
+            "variants": [("name", string), ("var_class", string), ("most_severe_consequence", string), ("source", string),
+                         ("ambiguity", string), ("MAF", number), ("minor_allele", string), ("evidence", strings), ("synonyms", strings)],
+            "mappings": [("name", string), ("seq_region_name", string), ("start", integer), ("end", integer), ("strand", integer),
+                         ("allele_string", string), ("assembly_name", string), ("coord_system", string), ("location", string)],
+        },
+        "overlap": {
+            "features": [("id", string), ("feature_type", string), ("seq_region_name", string), ("start", integer), ("end", integer),
+                         ("strand", integer), ("biotype", string), ("external_name", string), ("description", string), ("source", string),
+                         ("version", integer), ("assembly_name", string), ("logic_name", string), ("Parent", string),
+                         ("gene_id", string), ("transcript_id", string), ("consequence_type", string), ("alleles", strings)],
+        },
+    }
+
+
+def schemas(kind):
+    """Arrow schemas of the tables a response of kind ("vep", "lookup", "variation" or "overlap") is flattened into"""
+    if pa is None:
+        raise ImportError("ensembl.arrow requires pyarrow")
+    return {table: pa.schema(fields) for table, fields in _schemas()[kind].items()}
+
+
+def _rows(kind, response):
+    """Yield (table, row) for every record of a response, flattening nested records into child tables keyed on their parent"""
+    match kind:
+        case "vep":
+            for record in response:
+                yield "variants", record
+                for consequence in record.get("transcript_consequences", []):
+                    yield "transcript_consequences", {**consequence, "input": record.get("input")}
+                for variant in record.get("colocated_variants", []):
+                    yield "colocated_variants", {**variant, "input": record.get("input")}
+        case "lookup":
+            for record in (response.values() if "id" not in response else [response]):
+                if not record:
+                    continue
+                yield "entities", record
+                for transcript in record.get("Transcript", []):
+                    yield "transcripts", transcript
+                    for exon in transcript.get("Exon", []):
+                        yield "exons", {**exon, "Parent": transcript["id"]}
+                for exon in record.get("Exon", []):
+                    yield "exons", {**exon, "Parent": record["id"]}
+        case "variation":
+            for record in (response.values() if "name" not in response else [response]):
+                if not record:
+                    continue
+                yield "variants", record
+                for mapping in record.get("mappings", []):
+                    yield "mappings", {**mapping, "name": record["name"]}
+        case "overlap":
+            for record in response:
+                yield "features", record
+        case _:
+            raise ValueError(f"No schema for {kind!r}")
+
+
+def to_batches(kind, response):
+    """Flatten a response into {table: pyarrow.RecordBatch} with the schemas of kind"""
+    tables = schemas(kind)
+    rows = {table: [] for table in tables}
+    for table, row in _rows(kind, response):
+        rows[table].append(row)
+    return {table: pa.RecordBatch.from_pylist(rows[table], schema=schema) for table, schema in tables.items()}
+
+
+def to_tables(kind, response):
+    """Flatten a response into {table: pyarrow.Table}"""
+    return {table: pa.Table.from_batches([batch]) for table, batch in to_batches(kind, response).items()}
+
+
+class ParquetExport:
+    """Streams the responses of a batch job into one Parquet file per table, `<prefix>.<table>.parquet`, converting
+    each response as it arrives so the whole result never sits in memory as Python dicts.
+
+        with ParquetExport("annotations", "vep") as export:
+            for chunk in chunks:
+                export.write(ensembl.vep_id(chunk))
+    """
+
+    def __init__(self, prefix, kind, **options):
+        self.prefix = prefix
+        self.kind = kind
+        self.options = options
+        self.schemas = schemas(kind)
+        self._writers = {}
+
+    def path(self, table):
+        return f"{self.prefix}.{table}.parquet"
+
+    def write(self, response):
+        """Convert one response (or chunk of a batch response) and append it to the tables"""
+        for table, batch in to_batches(self.kind, response).items():
+            if table not in self._writers:
+                self._writers[table] = pq.ParquetWriter(self.path(table), self.schemas[table], **self.options)
+            if batch.num_rows:
+                self._writers[table].write_batch(batch)
+
+    def close(self):
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
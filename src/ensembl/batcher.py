@@ -0,0 +1,105 @@
+import threading
+from concurrent.futures import Future
+
+from . import BATCH_ITEM_KEYS, BatchError, ChunkError, checked, failed, max_post_size, merge_batches, split_batch
+
+# Single-item methods the batcher can route through their list overload: method name -> (endpoint prefix, whether the
+# single-item GET answers with one record rather than the list of records the batch response holds for the item)
+BATCHABLE = {
+    "archive": ("archive/id", True),
+    "lookup_id": ("lookup/id", False),
+    "lookup_symbol": ("lookup/symbol", False),
+    "sequence_id": ("sequence/id", True),
+    "variant_recoder": ("variant_recoder", False),
+    "variation": ("variation", False),
+    "vep_hgvs": ("vep", False),
+    "vep_id": ("vep", False),
+}
+
+
+class MicroBatcher:
+    """Collects single-item calls made from many threads within `window` seconds (or until `max_items`, by default the
+    endpoint's POST limit) and sends them as one request through the matching list overload of `client`.
+    If the server rejects the whole request, its items are sent again one by one, so only the callers of rejected items get
+    a ChunkError.
+
+        batcher = ensembl.micro_batcher(window=0.005)
+        gene = batcher.lookup_id("ENSG00000157764")  # from any number of threads
+    """
+
+    def __init__(self, client, window=0.005, max_items=None):
+        self.client = client
+        self.window = window
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def submit(self, method, item, **kwargs):
+        """Queue one item for `method` and return a Future resolved with the item's own part of the batch response"""
+        if method not in BATCHABLE:
+            raise ValueError(f"{method} has no batch overload")
+        if kwargs.get("format", "json") != "json":
+            raise ValueError("Only JSON responses can be split back into items")
+        prefix, _ = BATCHABLE[method]
+        group = (method, tuple(sorted(kwargs.items())))
+        future = Future()
+        with self._lock:
+            batch = self._pending.setdefault(group, [])
+            batch.append((item, future))
+            if len(batch) >= (self.max_items or max_post_size(prefix) or 1):
+                del self._pending[group]
+                threading.Thread(target=self._flush, args=(group, batch), daemon=True).start()
+            elif len(batch) == 1:
+                timer = threading.Timer(self.window, self._flush_pending, args=(group, batch))
+                timer.daemon = True
+                timer.start()
+        return future
+
+    def _flush_pending(self, group, batch):
+        with self._lock:
+            if self._pending.get(group) is not batch:
+                return  # already sent because it filled up
+            del self._pending[group]
+        self._flush(group, batch)
+
+    def _flush(self, group, batch):
+        try:
+            self._resolve(group, batch)
+        except BaseException as error:
+            # whatever went wrong, no caller may be left waiting on its future
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+    def _resolve(self, group, batch):
+        method, kwargs = group
+        prefix, single = BATCHABLE[method]
+        items = list(dict.fromkeys(item for item, _ in batch))
+        call = getattr(self.client, method)
+        errors = {}
+        try:
+            result = call(items, **dict(kwargs))
+        except BatchError as error:
+            result = error.results
+            errors = {item: exception for chunk, exception in error.errors for item in chunk}
+        if failed(result):
+            if len(items) == 1:
+                result, errors = {}, {items[0]: ChunkError(result)}
+            else:
+                # the server rejects the whole body for one bad item, so send the items one by one to answer the others
+                results, rejected = self.client._map(lambda item: checked(call([item], **dict(kwargs))), items)
+                result, errors = merge_batches([result for result in results if result is not None]), dict(rejected)
+        parts, _ = split_batch(prefix, result)
+        for item, future in batch:
+            if item in errors:
+                future.set_exception(errors[item])
+                continue
+            part = parts.get(item, None if BATCH_ITEM_KEYS[prefix] is None else [])
+            if single and isinstance(part, list) and len(part) == 1:
+                part = part[0]
+            future.set_result(part)
+
+    def __getattr__(self, method):
+        if method not in BATCHABLE:
+            raise AttributeError(method)
+        return lambda item, **kwargs: self.submit(method, item, **kwargs).result()
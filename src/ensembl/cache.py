@@ -0,0 +1,193 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+
+MISSING = object()
+
+# Endpoints whose answers change too often to be worth caching, keyed by endpoint prefix like the ttls argument.
+DEFAULT_TTLS = {
+    "info/ping": 0,
+}
+
+# Most keys looked up per SELECT, below SQLite's default limit on the variables of one statement
+SQL_VARIABLES = 500
+
+# Seconds an entry's access time may lag behind before a hit rewrites it
+ACCESS_RESOLUTION = 60
+
+
+class ResponseCache:
+    """Persistent SQLite cache of decoded responses, keyed on (server, method, endpoint, sorted params, body, format).
+    Entries expire after `ttl` seconds, or the `ttls` value of the longest matching endpoint prefix (0 disables caching).
+    Beyond `max_entries` entries or `max_bytes` bytes of stored values, least recently used entries are evicted in one
+    batch down to `low_water` of the limits, so a full cache does not evict on every write.
+    The cache is dropped for a server whenever it reports a new data release."""
+
+    def __init__(self, path, ttl=7 * 24 * 3600, ttls=None, max_entries=None, max_bytes=None, low_water=0.9):
+        self.path = path
+        self.ttl = ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        with self._transaction():
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, server TEXT, endpoint TEXT, value TEXT, "
+                             "size INTEGER, expires REAL, accessed REAL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS releases (server TEXT PRIMARY KEY, release TEXT)")
+            # Entry and byte totals kept up to date by triggers, so checking the limits does not scan the table
+            self._db.execute("CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER, bytes INTEGER)")
+            self._db.execute("INSERT OR IGNORE INTO totals SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            self._db.execute("CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN "
+                             "UPDATE totals SET entries = entries + 1, bytes = bytes + new.size; END")
+            self._db.execute("CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN "
+                             "UPDATE totals SET entries = entries - 1, bytes = bytes - old.size; END")
+            self._db.execute("CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN "
+                             "UPDATE totals SET bytes = bytes + new.size - old.size; END")
+
+    @contextmanager
+    def _transaction(self):
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    @staticmethod
+    def key(server, method, endpoint, params, body, format):
+        params = {name: value for name, value in (params or {}).items() if value is not None}
+        raw = json.dumps([server, method, endpoint, params, body, format], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def ttl_for(self, endpoint):
+        for prefix in sorted(self.ttls, key=len, reverse=True):
+            if endpoint == prefix or endpoint.startswith(prefix + "/"):
+                return self.ttls[prefix]
+        return self.ttl
+
+    def get(self, key):
+        """Return the cached value or MISSING"""
+        return self.get_many([key]).get(key, MISSING)
+
+    def get_many(self, keys):
+        """Return {key: cached value} of the keys found. Expired entries are deleted and stale access times updated in one
+        transaction; access times less than ACCESS_RESOLUTION seconds old are left alone, so repeated hits do not write."""
+        keys, now, rows = list(dict.fromkeys(keys)), time.time(), []
+        with self._lock:
+            for i in range(0, len(keys), SQL_VARIABLES):
+                chunk = keys[i:i + SQL_VARIABLES]
+                rows += self._db.execute(f"SELECT key, value, expires, accessed FROM responses WHERE key IN ({', '.join('?' * len(chunk))})",
+                                         chunk).fetchall()
+            expired = [(key,) for key, _, expires, _ in rows if expires < now]
+            touched = [(now, key) for key, _, expires, accessed in rows if expires >= now and accessed < now - ACCESS_RESOLUTION]
+            if expired or touched:
+                with self._transaction():
+                    self._db.executemany("DELETE FROM responses WHERE key = ?", expired)
+                    self._db.executemany("UPDATE responses SET accessed = ? WHERE key = ?", touched)
+        return {key: json.loads(value) for key, value, expires, _ in rows if expires >= now}
+
+    def set(self, key, server, endpoint, value):
+        self.set_many([(key, server, endpoint, value)])
+
+    def set_many(self, entries):
+        """Store (key, server, endpoint, value) entries in one transaction"""
+        now, rows = time.time(), []
+        for key, server, endpoint, value in entries:
+            ttl = self.ttl_for(endpoint)
+            if ttl:
+                raw = json.dumps(value)
+                rows.append((key, server, endpoint, raw, len(raw), now + ttl, now))
+        if not rows:
+            return
+        with self._lock, self._transaction():
+            self._db.executemany("INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET server = excluded.server, "
+                                 "endpoint = excluded.endpoint, value = excluded.value, size = excluded.size, expires = excluded.expires, "
+                                 "accessed = excluded.accessed", rows)
+            self._evict()
+
+    def _evict(self):
+        """Once a limit is exceeded, delete the least recently used entries until both totals are under low_water of the limits"""
+        entries, size = self._db.execute("SELECT entries, bytes FROM totals").fetchone()
+        if (self.max_entries is None or entries <= self.max_entries) and (self.max_bytes is None or size <= self.max_bytes):
+            return
+        max_entries = entries if self.max_entries is None else int(self.max_entries * self.low_water)
+        max_bytes = size if self.max_bytes is None else int(self.max_bytes * self.low_water)
+        doomed = []
+        for key, value_size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if entries <= max_entries and size <= max_bytes:
+                break
+            doomed.append((key,))
+            entries, size = entries - 1, size - value_size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def clear(self, server=None):
+        with self._lock:
+            if server is None:
+                self._db.execute("DELETE FROM responses")
+            else:
+                self._db.execute("DELETE FROM responses WHERE server = ?", (server,))
+
+    def set_release(self, server, release):
+        """Record the data release a server reports; its cached responses are dropped if the release changed"""
+        release = json.dumps(release, sort_keys=True)
+        with self._lock:
+            row = self._db.execute("SELECT release FROM releases WHERE server = ?", (server,)).fetchone()
+            if row is not None and row[0] == release:
+                return False
+            self._db.execute("INSERT OR REPLACE INTO releases VALUES (?, ?)", (server, release))
+            if row is not None:
+                self._db.execute("DELETE FROM responses WHERE server = ?", (server,))
+            return row is not None
+
+    def close(self):
+        self._db.close()
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUMemo:
+    """Bounded, thread-safe in-memory LRU map with hit/miss counters"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the memoized value or MISSING"""
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+            return MISSING
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
@@ -0,0 +1,55 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls: the first caller runs the call and the others wait for and share its result.
+    Works across threads with do() and across the tasks of one event loop with do_async()."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+
+    @staticmethod
+    def key(method, endpoint, params, body, format, headers=None):
+        params = {name: value for name, value in (params or {}).items() if value is not None}
+        return (method, endpoint, json.dumps(params, sort_keys=True, default=str), json.dumps(body, sort_keys=True, default=str), format,
+                tuple(sorted((headers or {}).items())))
+
+    def do(self, key, call):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = call()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key, call):
+        # the call runs in a task of its own that every caller only awaits through a shield, so cancelling one caller
+        # (a timeout, say) neither cancels the request nor the other callers waiting for it
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(call())
+            task.add_done_callback(lambda task: self._done(key, task))
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved in case every caller was cancelled
@@ -0,0 +1,58 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _backend():
+    return "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+
+class Decoder:
+    """Decodes JSON response bodies with `backend`: "orjson", "msgspec" or "json" (default: the first one installed).
+    With msgspec installed, `types` ({endpoint prefix: type}) decodes and validates the responses of matching endpoints
+    straight into that type, e.g. {"vep": list[VEPResult]} for a msgspec.Struct VEPResult. Typed responses are not
+    cached, since the cache stores plain JSON.
+
+        ensembl = Ensembl(decoder=Decoder("msgspec", types={"vep": list[VEPResult]}))
+    """
+
+    def __init__(self, backend=None, types=None):
+        self.backend = backend or _backend()
+        match self.backend:
+            case "orjson" if orjson is not None:
+                self._loads = orjson.loads
+            case "msgspec" if msgspec is not None:
+                self._loads = msgspec.json.Decoder().decode
+            case "json":
+                self._loads = json.loads
+            case "orjson" | "msgspec":
+                raise ImportError(f"JSON backend {self.backend!r} is not installed")
+            case _:
+                raise ValueError(f"Unknown JSON backend: {self.backend!r}")
+        if types and msgspec is None:
+            raise ImportError("Typed decoding requires msgspec")
+        self.types = dict(types or {})
+        self._typed = {prefix: msgspec.json.Decoder(type) for prefix, type in self.types.items()}
+
+    def _prefix(self, endpoint):
+        for prefix in sorted(self._typed, key=len, reverse=True):
+            if endpoint == prefix or endpoint.startswith(prefix + "/"):
+                return prefix
+        return None
+
+    def typed(self, endpoint):
+        """Whether responses of endpoint are decoded into a type"""
+        return bool(self._typed) and self._prefix(endpoint) is not None
+
+    def decode(self, content, endpoint=""):
+        """Decode a response body (bytes) of endpoint"""
+        prefix = self._prefix(endpoint) if self._typed else None
+        return self._typed[prefix].decode(content) if prefix is not None else self._loads(content)
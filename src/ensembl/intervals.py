@@ -0,0 +1,151 @@
+import hashlib
+import json
+
+import numpy as np
+
+from .tiling import feature_identity, parse_region
+
+
+def _digest(feature):
+    return hashlib.blake2b(feature_identity(feature).encode(), digest_size=16).digest()
+
+
+class _Layer:
+    """Features of one seq_region whose lengths fall in one power-of-4 class, sorted by start.
+    Any feature overlapping [start, end] starts within [start - max_span, end], so a query only scans a slice found by
+    binary search; bucketing by length keeps long features from widening that slice for every other feature."""
+
+    def __init__(self, starts, ends, indices):
+        order = np.argsort(starts, kind="stable")
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.indices = indices[order]
+        self.max_span = int((self.ends - self.starts).max()) if len(self.starts) else 0
+
+    def pairs(self, starts, ends):
+        low = np.searchsorted(self.starts, starts - self.max_span, "left")
+        high = np.searchsorted(self.starts, ends, "right")
+        counts = high - low
+        queries = np.repeat(np.arange(len(starts)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(low, counts)
+        hits = self.ends[offsets] >= starts[queries]
+        return queries[hits], self.indices[offsets[hits]]
+
+
+class IntervalIndex:
+    """In-memory overlap index over features fetched with overlap_region / overlap_id (1-based, inclusive coordinates).
+    Queries are vectorised over NumPy arrays of positions; features can be added incrementally, and only the seq_regions
+    they touch are re-indexed. The index can be saved to and loaded from a .npz file.
+
+        index = IntervalIndex.from_region(ensembl, "human", "7:140000000-141000000", feature="gene")
+        genes = index.overlapping("7", 140700000)
+        counts = index.count("7", starts, ends)
+    """
+
+    def __init__(self, features=()):
+        self.features = []
+        self._seen = {}  # digest of each feature -> its number
+        self._positions = {}  # seq_region -> (starts, ends, indices) arrays of all its features
+        self._layers = {}
+        self._stale = set()
+        self.add(features)
+
+    @classmethod
+    def from_region(cls, client, species, region, **kwargs):
+        """Index the features overlapping a region of any size, fetched in tiles"""
+        index = cls()
+        index.load_region(client, species, region, **kwargs)
+        return index
+
+    @classmethod
+    def from_id(cls, client, id, **kwargs):
+        """Index the features overlapping the region of a stable identifier"""
+        return cls(client.overlap_id(id, **kwargs))
+
+    def load_region(self, client, species, region, **kwargs):
+        """Fetch the features of another region and add them to the index"""
+        self.add(client.overlap_region_tiled(species, region, **kwargs))
+        return self
+
+    def add(self, features):
+        """Add features, ignoring ones already indexed"""
+        added = {}
+        for feature in features:
+            identity = _digest(feature)
+            if identity in self._seen:
+                continue
+            self._seen[identity] = len(self.features)
+            self.features.append(feature)
+            added.setdefault(str(feature["seq_region_name"]), []).append(len(self.features) - 1)
+        for seq_region, indices in added.items():
+            indices = np.array(indices, dtype=np.int64)
+            starts = np.array([self.features[i]["start"] for i in indices], dtype=np.int64)
+            ends = np.array([self.features[i]["end"] for i in indices], dtype=np.int64)
+            if seq_region in self._positions:
+                old = self._positions[seq_region]
+                starts, ends, indices = np.concatenate([old[0], starts]), np.concatenate([old[1], ends]), np.concatenate([old[2], indices])
+            self._positions[seq_region] = (starts, ends, indices)
+            self._stale.add(seq_region)
+        return self
+
+    def __len__(self):
+        return len(self.features)
+
+    def _layers_of(self, seq_region):
+        seq_region = str(seq_region)
+        if seq_region in self._stale:
+            starts, ends, indices = self._positions[seq_region]
+            # insertions end one base before they start, so their length is taken as 1
+            classes = np.log2(np.maximum(ends - starts + 1, 1)).astype(np.int64) // 2
+            self._layers[seq_region] = [_Layer(starts[classes == c], ends[classes == c], indices[classes == c]) for c in np.unique(classes)]
+            self._stale.discard(seq_region)
+        return self._layers.get(seq_region, [])
+
+    def pairs(self, seq_region, starts, ends=None):
+        """Vectorised overlap join: arrays (query number, feature number) of every query interval and feature that overlap"""
+        starts = np.atleast_1d(np.asarray(starts, dtype=np.int64))
+        ends = starts if ends is None else np.atleast_1d(np.asarray(ends, dtype=np.int64))
+        found = [layer.pairs(starts, ends) for layer in self._layers_of(seq_region)]
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        queries, features = np.concatenate([q for q, _ in found]), np.concatenate([f for _, f in found])
+        order = np.lexsort((features, queries))
+        return queries[order], features[order]
+
+    def count(self, seq_region, starts, ends=None):
+        """Number of features overlapping each query interval (or position, without ends)"""
+        starts = np.atleast_1d(np.asarray(starts, dtype=np.int64))
+        queries, _ = self.pairs(seq_region, starts, ends)
+        return np.bincount(queries, minlength=len(starts))
+
+    def overlapping(self, seq_region, start, end=None):
+        """Features overlapping one interval, or one position without end"""
+        _, features = self.pairs(seq_region, [start], None if end is None else [end])
+        return [self.features[i] for i in features]
+
+    def region(self, region):
+        """Features overlapping a region string such as "7:140700000-140800000" """
+        name, start, end, _ = parse_region(region)
+        return self.overlapping(name, start, end)
+
+    def save(self, path):
+        """Write the position arrays, the feature digests and the features as UTF-8 JSON, so loading needs no re-indexing"""
+        arrays = {"seq_regions": np.array(list(self._positions), dtype=str),
+                  "digests": np.frombuffer(b"".join(self._seen), dtype=np.uint8).reshape(-1, 16),
+                  "features_json": np.frombuffer(json.dumps(self.features).encode(), dtype=np.uint8)}
+        for i, (starts, ends, indices) in enumerate(self._positions.values()):
+            arrays[f"starts_{i}"], arrays[f"ends_{i}"], arrays[f"indices_{i}"] = starts, ends, indices
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if "features_json" not in data:
+                return cls(json.loads(data["features"].item()))
+            index = cls()
+            index.features = json.loads(data["features_json"].tobytes())
+            index._seen = {digest.tobytes(): i for i, digest in enumerate(data["digests"])}
+            index._positions = {str(seq_region): (data[f"starts_{i}"], data[f"ends_{i}"], data[f"indices_{i}"])
+                                for i, seq_region in enumerate(data["seq_regions"])}
+            index._stale = set(index._positions)
+            return index
@@ -0,0 +1,155 @@
+import numpy as np
+
+from .tiling import format_region, parse_region, tile_region
+
+
+class Liftover:
+    """Local coordinate conversion between two assemblies from the mapping blocks map_assembly reports for whole
+    chromosomes. Blocks are kept per source seq_region as start-sorted arrays, so millions of positions are mapped with
+    one binary search, flipping positions on blocks that map to the reverse strand and reporting unmapped positions.
+
+        liftover = Liftover.from_server(Ensembl(assembly="GRCh37"), "human", "GRCh37", "GRCh38")
+        names, positions, strands, mapped = liftover.map_positions("7", [140453136, 140624564])
+    """
+
+    def __init__(self, asm_one, asm_two, mappings=()):
+        self.asm_one = asm_one
+        self.asm_two = asm_two
+        self._blocks = {}  # source seq_region -> dict of arrays sorted by source start
+        self.add(mappings)
+
+    @classmethod
+    def from_server(cls, client, species, asm_one, asm_two, lengths=None, tile_size=None, concurrency=None):
+        """Fetch the mapping blocks of every chromosome of asm_one, given as {name: length} or else read from the
+        info_assembly of client, which should then be a client of asm_one's server"""
+        if lengths is None:
+            return client._then(client.info_assembly(species), lambda info: cls.from_server(
+                client, species, asm_one, asm_two, {region["name"]: region["length"] for region in info["top_level_region"]
+                                                    if region.get("coord_system") == "chromosome"}, tile_size, concurrency))
+        regions = [format_region(name, 1, length) for name, length in lengths.items()]
+        if tile_size is not None:
+            regions = [tile for region in regions for tile in tile_region(region, tile_size)]
+        return client._then(client._gather(lambda region: client.map_assembly(species, asm_one, region, asm_two), regions, concurrency),
+                            lambda responses: cls(asm_one, asm_two, [mapping for response in responses for mapping in response["mappings"]]))
+
+    def add(self, mappings):
+        """Add mapping blocks in the form of the "mappings" of a map_assembly response"""
+        grouped = {}
+        for mapping in mappings:
+            grouped.setdefault(str(mapping["original"]["seq_region_name"]), []).append(mapping)
+        for name, group in grouped.items():
+            old = self._blocks.get(name)
+            if old is not None:
+                group = self._mappings(name, old) + group
+            self._blocks[name] = self._arrays(group)
+        return self
+
+    @staticmethod
+    def _arrays(mappings):
+        mappings = sorted({(m["original"]["start"], m["original"]["end"], m["original"].get("strand", 1), str(m["mapped"]["seq_region_name"]),
+                            m["mapped"]["start"], m["mapped"]["end"], m["mapped"].get("strand", 1), m["mapped"].get("coord_system", "chromosome"))
+                           for m in mappings})
+        merged = []
+        for block in mappings:
+            # join the pieces of one block that was cut at a tile boundary
+            if merged and merged[-1][3] == block[3] and merged[-1][2] * merged[-1][6] == block[2] * block[6] and merged[-1][7] == block[7] \
+                    and merged[-1][1] + 1 == block[0] and (merged[-1][5] + 1 == block[4] if block[2] * block[6] == 1 else merged[-1][4] - 1 == block[5]):
+                previous = merged.pop()
+                block = (previous[0], block[1], *block[2:4], min(previous[4], block[4]), max(previous[5], block[5]), *block[6:])
+            merged.append(block)
+        columns = list(zip(*merged))
+        return {
+            "start": np.array(columns[0], dtype=np.int64),
+            "end": np.array(columns[1], dtype=np.int64),
+            "name": np.array(columns[3], dtype=object),
+            "mapped_start": np.array(columns[4], dtype=np.int64),
+            "mapped_end": np.array(columns[5], dtype=np.int64),
+            "strand": np.array(columns[2], dtype=np.int64) * np.array(columns[6], dtype=np.int64),
+            "coord_system": np.array(columns[7], dtype=object),
+        }
+
+    def _mappings(self, name, blocks):
+        return [{"original": {"seq_region_name": name, "start": int(start), "end": int(end), "strand": 1},
+                 "mapped": {"seq_region_name": mapped, "start": int(mapped_start), "end": int(mapped_end), "strand": int(strand),
+                            "coord_system": coord_system}}
+                for start, end, mapped, mapped_start, mapped_end, strand, coord_system
+                in zip(*(blocks[column] for column in ("start", "end", "name", "mapped_start", "mapped_end", "strand", "coord_system")))]
+
+    def _locate(self, seq_region, positions):
+        blocks = self._blocks.get(str(seq_region))
+        if blocks is None:
+            return None, np.zeros(len(positions), dtype=np.int64), np.zeros(len(positions), dtype=bool)
+        block = np.searchsorted(blocks["start"], positions, "right") - 1
+        found = block >= 0
+        block = np.maximum(block, 0)
+        return blocks, block, found & (positions <= blocks["end"][block])
+
+    def map_positions(self, seq_region, positions, strand=1):
+        """Map positions of one asm_one seq_region; returns arrays of asm_two seq_region names, positions, strands and
+        whether each position mapped (names are None, and positions and strands 0, where it did not)"""
+        positions = np.atleast_1d(np.asarray(positions, dtype=np.int64))
+        blocks, block, mapped = self._locate(seq_region, positions)
+        if blocks is None:
+            return np.full(len(positions), None, dtype=object), np.zeros(len(positions), dtype=np.int64), np.zeros(len(positions), dtype=np.int64), mapped
+        offsets = positions - blocks["start"][block]
+        forward = blocks["strand"][block] == 1
+        lifted = np.where(forward, blocks["mapped_start"][block] + offsets, blocks["mapped_end"][block] - offsets)
+        return (np.where(mapped, blocks["name"][block], None), np.where(mapped, lifted, 0),
+                np.where(mapped, blocks["strand"][block] * strand, 0), mapped)
+
+    def map_region(self, region):
+        """Map a region such as "X:1000000..1000100:1" into the list of mappings map_assembly would return for it"""
+        name, start, end, strand = parse_region(region)
+        strand = strand or 1
+        blocks = self._blocks.get(name)
+        if blocks is None:
+            return {"mappings": []}
+        first = np.searchsorted(blocks["end"], start, "left")
+        last = np.searchsorted(blocks["start"], end, "right")
+        mappings = []
+        for i in range(first, last):
+            piece_start, piece_end = max(start, int(blocks["start"][i])), min(end, int(blocks["end"][i]))
+            if blocks["strand"][i] == 1:
+                mapped_start = int(blocks["mapped_start"][i]) + piece_start - int(blocks["start"][i])
+                mapped_end = int(blocks["mapped_start"][i]) + piece_end - int(blocks["start"][i])
+            else:
+                mapped_start = int(blocks["mapped_end"][i]) - (piece_end - int(blocks["start"][i]))
+                mapped_end = int(blocks["mapped_end"][i]) - (piece_start - int(blocks["start"][i]))
+            mappings.append({
+                "original": {"seq_region_name": name, "start": piece_start, "end": piece_end, "strand": strand,
+                             "coord_system": "chromosome", "assembly": self.asm_one},
+                "mapped": {"seq_region_name": blocks["name"][i], "start": mapped_start, "end": mapped_end, "strand": int(blocks["strand"][i]) * strand,
+                           "coord_system": blocks["coord_system"][i], "assembly": self.asm_two},
+            })
+        return {"mappings": mappings}
+
+    def verify(self, client, species, seq_region, positions, concurrency=None):
+        """Map positions both locally and with map_assembly; returns the (position, local, server) triples that disagree,
+        each mapping given as (seq_region, position, strand) or None when unmapped"""
+        positions = [int(position) for position in positions]
+        names, lifted, strands, mapped = self.map_positions(seq_region, positions)
+        local = [(names[i], int(lifted[i]), int(strands[i])) if mapped[i] else None for i in range(len(positions))]
+
+        def compare(responses):
+            remote = [(str(r["mappings"][0]["mapped"]["seq_region_name"]), r["mappings"][0]["mapped"]["start"], r["mappings"][0]["mapped"]["strand"])
+                      if r["mappings"] else None for r in responses]
+            return [(position, mine, theirs) for position, mine, theirs in zip(positions, local, remote) if mine != theirs]
+
+        return client._then(client._gather(lambda position: client.map_assembly(species, self.asm_one, format_region(seq_region, position, position),
+                                                                               self.asm_two), positions, concurrency), compare)
+
+    def save(self, path):
+        np.savez_compressed(path, assemblies=np.array([self.asm_one, self.asm_two]),
+                            **{f"{name}/{column}": values.astype(str) if values.dtype == object else values
+                               for name, blocks in self._blocks.items() for column, values in blocks.items()})
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            liftover = cls(*(str(assembly) for assembly in data["assemblies"]))
+            for key in data.files:
+                if key != "assemblies":
+                    name, column = key.rsplit("/", 1)
+                    values = data[key]
+                    liftover._blocks.setdefault(name, {})[column] = values.astype(object) if values.dtype.kind == "U" else values
+        return liftover
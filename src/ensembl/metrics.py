@@ -0,0 +1,143 @@
+import bisect
+import math
+import threading
+import time
+
+# Literal path segments of the REST endpoints; any other segment is a parameter and is masked in endpoint templates.
+PATH_WORDS = frozenset({
+    "accession", "alignment", "analysis", "ancestors", "archive", "assembly", "beacon", "binding_matrix", "biotypes", "cafe", "callsets",
+    "cdna", "cds", "chart", "classification", "compara", "comparas", "consequence_types", "data", "datasets", "descendants", "division",
+    "divisions", "eg_version", "epigenome", "external_dbs", "features", "featuresets", "ga4gh", "ga4gh_featuresets", "gene", "genetree",
+    "genomes", "groups", "hgvs", "homology", "id", "info", "input", "ld", "lookup", "map", "member", "methods", "microarray", "name",
+    "ontology", "overlap", "pairwise", "phenotype", "ping", "pmcid", "pmid", "populations", "probe", "query", "references",
+    "referencesets", "region", "regulatory", "rest", "search", "sequence", "software", "species", "species_sets", "symbol", "taxonomy",
+    "term", "transcript_haplotypes", "translation", "variant_recoder", "variantannotations", "variantannotationsets", "variants",
+    "variantsets", "variation", "vendor", "vep", "xrefs",
+})
+
+# Timings of a request span, in seconds. dns and connect are only measured by AsyncEnsembl; requests reports them as
+# part of ttfb. Streamed responses are parsed while they download, so they have no separate download or decode time.
+TIMINGS = ("duration", "dns", "connect", "ttfb", "download", "decode", "rate_limit_wait", "retry_wait")
+
+# Upper bounds, in seconds, of the histogram buckets
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+
+
+def endpoint_template(endpoint):
+    """Endpoint with its parameter segments masked, e.g. "lookup/id/ENSG00000157764" -> "lookup/id/{}", to group requests by"""
+    return "/".join(segment if segment in PATH_WORDS else "{}" for segment in endpoint.strip("/").split("/"))
+
+
+def new_span(method, endpoint):
+    """Record of one request, filled in as it is sent, downloaded and decoded, and passed to the client's hooks"""
+    return {"method": method, "endpoint": endpoint, "template": endpoint_template(endpoint), "status": None, "bytes": None, "attempts": 0,
+            "error": None, "started": time.perf_counter(), **{timing: None for timing in TIMINGS}, "rate_limit_wait": 0.0, "retry_wait": 0.0}
+
+
+class Histogram:
+    """Counts of observations in fixed buckets, with their sum"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Estimate of the q quantile, interpolated linearly within its bucket"""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i] if self.buckets[i] != math.inf else lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-2]
+
+    def summary(self):
+        return {"count": self.count, "sum": self.sum, "mean": self.sum / self.count if self.count else None,
+                "p50": self.quantile(0.5), "p90": self.quantile(0.9), "p99": self.quantile(0.99)}
+
+
+class Metrics:
+    """Per-endpoint-template request statistics of one or more clients: request, error, status, byte and retry counters
+    and a histogram of every timing of TIMINGS. A client records each finished request span into its `metrics`.
+
+        ensembl = Ensembl()
+        ...
+        ensembl.metrics.stats()["vep/{}/id"]["ttfb"]["p99"]
+        print(ensembl.metrics.prometheus())
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, span):
+        with self._lock:
+            endpoint = self._endpoints.get(span["template"])
+            if endpoint is None:
+                endpoint = self._endpoints[span["template"]] = {"requests": 0, "errors": 0, "statuses": {}, "bytes": 0, "retries": 0,
+                                                                **{timing: Histogram(self.buckets) for timing in TIMINGS}}
+            endpoint["requests"] += 1
+            status = span["status"] if span["status"] is not None else "error"
+            endpoint["statuses"][status] = endpoint["statuses"].get(status, 0) + 1
+            if span["error"] is not None or (span["status"] or 0) >= 400:
+                endpoint["errors"] += 1
+            endpoint["bytes"] += span["bytes"] or 0
+            endpoint["retries"] += max(span["attempts"] - 1, 0)
+            for timing in TIMINGS:
+                if span[timing] is not None:
+                    endpoint[timing].observe(span[timing])
+
+    def __call__(self, span):
+        self.record(span)
+
+    def stats(self):
+        """{endpoint template: counters and a summary (count, sum, mean, p50, p90, p99) of each timing}"""
+        with self._lock:
+            return {template: {name: value.summary() if isinstance(value, Histogram) else dict(value) if isinstance(value, dict) else value
+                               for name, value in endpoint.items()}
+                    for template, endpoint in self._endpoints.items()}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+
+    def prometheus(self, prefix="ensembl"):
+        """The statistics in the Prometheus text exposition format"""
+        def label(value):
+            return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        lines = []
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            for name, description, field in (("requests_total", "Requests sent, by endpoint template and status", "statuses"),
+                                             ("errors_total", "Requests that failed or got an error status", "errors"),
+                                             ("response_bytes_total", "Bytes of response bodies received", "bytes"),
+                                             ("retries_total", "Requests sent again after a retryable failure", "retries")):
+                lines += [f"# HELP {prefix}_{name} {description}", f"# TYPE {prefix}_{name} counter"]
+                for template, endpoint in endpoints:
+                    if field == "statuses":
+                        lines += [f'{prefix}_{name}{{endpoint="{label(template)}",status="{status}"}} {count}'
+                                  for status, count in sorted(endpoint[field].items(), key=str)]
+                    else:
+                        lines.append(f'{prefix}_{name}{{endpoint="{label(template)}"}} {endpoint[field]}')
+            for timing in TIMINGS:
+                name = f"{prefix}_request_{timing}_seconds"
+                lines += [f"# HELP {name} Request {timing.replace('_', ' ')} time", f"# TYPE {name} histogram"]
+                for template, endpoint in endpoints:
+                    histogram, cumulative = endpoint[timing], 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{endpoint="{label(template)}",le="{"+Inf" if bound == math.inf else bound}"}} {cumulative}')
+                    lines += [f'{name}_sum{{endpoint="{label(template)}"}} {histogram.sum}', f'{name}_count{{endpoint="{label(template)}"}} {histogram.count}']
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,174 @@
+from sys import intern
+
+
+class _Children:
+    """Slot holding nested records that are only turned into models the first time they are read"""
+
+    def __init__(self, model):
+        self.model = model
+
+    def __set_name__(self, owner, name):
+        self.slot = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        children = getattr(instance, self.slot)
+        if children and isinstance(children[0], dict):
+            children = [self.model(child) for child in children]
+            setattr(instance, self.slot, children)
+        return children or []
+
+
+class Model:
+    """Base of the slotted result models: the fields of a response record are copied into slots, string values of
+    low-cardinality fields are interned so all records share them, and nested records are converted on first access.
+    Fields missing from a record are None."""
+
+    __slots__ = ()
+    _fields = ()  # attribute names, read from the record key of the same name unless _keys says otherwise
+    _keys = {}
+    _interned = frozenset({"object_type", "feature_type", "biotype", "species", "seq_region_name", "assembly_name", "source", "logic_name",
+                           "db_type", "impact", "strand", "type", "method_link_type", "taxonomy_level", "var_class",
+                           "most_severe_consequence", "variant_allele", "sift_prediction", "polyphen_prediction"})
+    _children = {}  # attribute name -> record key of nested records
+
+    def __init__(self, record):
+        for field in self._fields:
+            value = record.get(self._keys.get(field, field))
+            if type(value) is str and field in self._interned:
+                value = intern(value)
+            setattr(self, field, value)
+        for name, key in self._children.items():
+            setattr(self, "_" + name, record.get(key))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({getattr(self, 'id', None)!r})"
+
+
+class Exon(Model):
+    _fields = ("id", "version", "object_type", "species", "assembly_name", "seq_region_name", "start", "end", "strand", "parent")
+    _keys = {"parent": "Parent"}
+    __slots__ = _fields
+
+
+class Transcript(Model):
+    _fields = ("id", "version", "object_type", "feature_type", "display_name", "external_name", "biotype", "species", "assembly_name",
+               "seq_region_name", "start", "end", "strand", "is_canonical", "logic_name", "source", "parent", "translation")
+    _keys = {"parent": "Parent", "translation": "Translation"}
+    _children = {"exons": "Exon"}
+    __slots__ = (*_fields, "_exons")
+    exons = _Children(Exon)
+
+
+class Gene(Model):
+    _fields = ("id", "version", "object_type", "feature_type", "display_name", "external_name", "description", "biotype", "species",
+               "assembly_name", "seq_region_name", "start", "end", "strand", "canonical_transcript", "logic_name", "source", "db_type")
+    _children = {"transcripts": "Transcript"}
+    __slots__ = (*_fields, "_transcripts")
+    transcripts = _Children(Transcript)
+
+
+class Consequence(Model):
+    """One transcript consequence of a VEP result"""
+    _fields = ("transcript_id", "gene_id", "gene_symbol", "biotype", "consequence_terms", "impact", "variant_allele", "strand", "canonical",
+               "cdna_start", "cdna_end", "cds_start", "cds_end", "protein_start", "protein_end", "amino_acids", "codons",
+               "sift_prediction", "sift_score", "polyphen_prediction", "polyphen_score")
+    __slots__ = _fields
+
+    def __init__(self, record):
+        super().__init__(record)
+        if self.consequence_terms is not None:
+            self.consequence_terms = tuple(intern(term) for term in self.consequence_terms)
+
+    def __repr__(self):
+        return f"Consequence({self.transcript_id!r}, {self.consequence_terms!r})"
+
+
+class Variant(Model):
+    """One VEP result"""
+    _fields = ("input", "id", "seq_region_name", "start", "end", "strand", "allele_string", "assembly_name", "most_severe_consequence",
+               "colocated_variants")
+    _children = {"transcript_consequences": "transcript_consequences"}
+    __slots__ = (*_fields, "_transcript_consequences")
+    transcript_consequences = _Children(Consequence)
+
+
+class Homology(Model):
+    """One homology of a homology_* response, with the fields of its source and target genes prefixed source_ / target_"""
+    _fields = ("type", "method_link_type", "taxonomy_level", "dn_ds",
+               "source_id", "source_species", "source_protein_id", "source_perc_id", "source_perc_pos",
+               "target_id", "target_species", "target_protein_id", "target_perc_id", "target_perc_pos")
+    __slots__ = _fields
+
+    def __init__(self, record):
+        flat = {key: value for key, value in record.items() if not isinstance(value, dict)}
+        for side in ("source", "target"):
+            flat.update({f"{side}_{key}": value for key, value in record.get(side, {}).items()})
+        if "source" not in record:  # the condensed format describes the other gene only
+            flat.update({"target_id": record.get("id"), "target_species": record.get("species"), "target_protein_id": record.get("protein_id")})
+        super().__init__(flat)
+
+    def __repr__(self):
+        return f"Homology({self.source_id!r}, {self.target_id!r}, {self.type!r})"
+
+
+# Model of an entity record, by its object_type (lookup) or feature_type (overlap)
+ENTITIES = {
+    "Gene": Gene, "gene": Gene,
+    "Transcript": Transcript, "transcript": Transcript,
+    "Exon": Exon, "exon": Exon,
+}
+
+
+def to_model(record):
+    """Model of one lookup, overlap or VEP record; records of other kinds are returned unchanged"""
+    if not isinstance(record, dict):
+        return record
+    model = ENTITIES.get(record.get("object_type") or record.get("feature_type"))
+    if model is not None:
+        return model(record)
+    if "most_severe_consequence" in record or "transcript_consequences" in record:
+        return Variant(record)
+    return record
+
+
+def to_models(response):
+    """Convert a whole response: lists and dicts keyed by ID are converted item by item, and homology responses become
+    {gene ID: [Homology]}"""
+    if isinstance(response, list):
+        return [to_model(record) for record in response]
+    if isinstance(response, dict):
+        if "data" in response and all("homologies" in gene for gene in response["data"]):
+            return {gene["id"]: [Homology(homology) for homology in gene["homologies"]] for gene in response["data"]}
+        if "object_type" in response or "feature_type" in response:
+            return to_model(response)
+        return {key: to_model(record) for key, record in response.items()}
+    return response
+
+
+class TypedClient:
+    """View of a client whose entity endpoints return slotted models rather than dicts; other methods pass through.
+
+        typed = ensembl.typed()
+        gene = typed.lookup_id("ENSG00000157764", expand=1)
+        biotypes = {transcript.biotype for transcript in gene.transcripts}
+    """
+
+    TYPED = frozenset({"homology_id", "homology_symbol", "lookup_id", "lookup_symbol", "overlap_id", "overlap_region", "overlap_region_tiled",
+                       "overlap_translation", "vep_hgvs", "vep_id", "vep_region"})
+
+    def __init__(self, client):
+        self.client = client
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        if name not in self.TYPED:
+            return method
+        return lambda *args, **kwargs: self.client._then(method(*args, **kwargs), to_models)
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+
+def retry_after_seconds(value):
+    """Seconds a Retry-After header value asks to wait, given as delay-seconds or as an HTTP-date; None if it is neither"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)  # HTTP-dates are always in GMT
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RateLimiter:
+    """Token bucket that paces requests below the REST server's rate limit.
+    The rate adapts to the X-RateLimit-* headers of every response and Retry-After pauses all callers.
+    One instance can be shared by several clients, threads and asyncio tasks."""
+
+    def __init__(self, rate=15, burst=None):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how many seconds the caller has to wait before sending its request"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate, self.paused_until - now)
+
+    def acquire(self):
+        """Block the calling thread until a request may be sent; returns the seconds it waited"""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self):
+        """Suspend the calling task until a request may be sent; returns the seconds it waited"""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    def update(self, status, headers):
+        """Adapt to the rate limit headers of a response. Returns True if the request was throttled (429) and must be sent again."""
+        retry_after = headers.get("Retry-After")
+        retry_after = None if retry_after is None else retry_after_seconds(retry_after)
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        with self._lock:
+            now = time.monotonic()
+            if remaining is not None and reset is not None:
+                remaining, reset = int(remaining), float(reset)
+                if remaining <= 0:
+                    self.paused_until = max(self.paused_until, now + reset)
+                else:
+                    # spread the remaining budget over the rest of the period, never above the configured rate
+                    self.rate = min(self.max_rate, remaining / max(reset, 1.0))
+            if retry_after is not None:
+                self.paused_until = max(self.paused_until, now + retry_after)
+                self.tokens = min(self.tokens, 0.0)
+        return status == 429
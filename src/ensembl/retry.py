@@ -0,0 +1,31 @@
+import random
+import time
+
+
+class RetryPolicy:
+    """When and how long to wait before sending a failed request again.
+    Retries responses with a status in `statuses` and requests raising one of `exceptions` (the client's connection and
+    timeout errors by default), with exponential backoff and full jitter, up to `max_attempts` tries in total and, if
+    `deadline` is set, only while the request has taken less than that many seconds."""
+
+    def __init__(self, max_attempts=5, backoff=0.5, max_backoff=30.0, jitter=True, statuses=(429, 500, 502, 503, 504),
+                 exceptions=None, deadline=None):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.exceptions = exceptions
+        self.deadline = deadline
+
+    def delay(self, attempt):
+        """Seconds to sleep before the given retry (1 for the first retry)"""
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def allows(self, attempt, started, delay=0.0):
+        """Whether another try may follow `attempt` tries of a request started at time.monotonic() `started`"""
+        if attempt >= self.max_attempts:
+            return False
+        return self.deadline is None or time.monotonic() - started + delay < self.deadline
+
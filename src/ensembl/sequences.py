@@ -0,0 +1,116 @@
+import bisect
+import mmap
+import os
+
+from .tiling import format_region, parse_region
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_COMPLEMENT = bytes.maketrans(b"ACGTRYKMBDHVNacgtrykmbdhvn", b"TGCAYRMKVHDBNtgcayrmkvhdbn")
+
+
+class SequenceStore:
+    """Local store of genomic sequence filled from sequence_region and read through mmap.
+    Sequence is kept as an unwrapped FASTA file with a samtools-style .fai index, one record per downloaded region, so a
+    slice is a plain offset into the mapped file: view() returns a zero-copy memoryview and array() a NumPy uint8 view.
+
+        store = SequenceStore("grch38.fa")
+        store.fill(ensembl, "human", "7:140000000-141000000")
+        flank = store.view("7", 140753316, 140753356)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".fai"
+        self._segments = {}  # seq_region -> sorted [(start, end, offset)]
+        self._records = []
+        self._map = None
+        if not os.path.exists(path):
+            open(path, "wb").close()
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as index:
+                for line in index:
+                    record, length, offset, *_ = line.split("\t")
+                    self._add(record, int(length), int(offset))
+
+    def _add(self, record, length, offset):
+        name, start, end, _ = parse_region(record)
+        bisect.insort(self._segments.setdefault(name, []), (start, end, offset))
+        self._records.append((record, length, offset))
+
+    def _mapped(self):
+        if self._map is None:
+            with open(self.path, "rb") as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def covers(self, name, start, end):
+        return self._find(str(name), start, end) is not None
+
+    def _find(self, name, start, end):
+        segments = self._segments.get(name, [])
+        i = bisect.bisect_right(segments, (start, float("inf"), 0)) - 1
+        while i >= 0:
+            segment = segments[i]
+            if segment[1] >= end:
+                return segment
+            i -= 1
+        return None
+
+    def add(self, region, sequence):
+        """Store the forward-strand sequence of a region such as "7:140000000-141000000" """
+        name, start, end, _ = parse_region(region)
+        if isinstance(sequence, str):
+            sequence = sequence.encode("ascii")
+        if len(sequence) != end - start + 1:
+            raise ValueError(f"{region} is {end - start + 1} bases long, got {len(sequence)}")
+        record = format_region(name, start, end)
+        with open(self.path, "ab") as file:
+            file.write(f">{record}\n".encode())
+            offset = file.tell()
+            file.write(sequence + b"\n")
+        with open(self.index_path, "a") as index:
+            index.write(f"{record}\t{len(sequence)}\t{offset}\t{len(sequence)}\t{len(sequence) + 1}\n")
+        self._add(record, len(sequence), offset)
+        self._map = None  # remapped on the next read; views handed out keep the old mapping alive
+
+    def fill(self, client, species, region, tile_size=None, concurrency=None):
+        """Download a region with sequence_region_tiled unless the store already holds it"""
+        name, start, end, _ = parse_region(region)
+        if self.covers(name, start, end):
+            return self
+        region = format_region(name, start, end)
+        return client._then(client.sequence_region_tiled(region, species, tile_size=tile_size, concurrency=concurrency),
+                            lambda response: self.add(region, response["seq"]) or self)
+
+    def view(self, name, start, end):
+        """Zero-copy memoryview of the forward-strand bases start..end (1-based, inclusive)"""
+        segment = self._find(str(name), start, end)
+        if segment is None:
+            raise KeyError(f"{format_region(name, start, end)} is not in the store")
+        offset = segment[2] + start - segment[0]
+        return memoryview(self._mapped())[offset:offset + end - start + 1]
+
+    def array(self, name, start, end):
+        """Zero-copy NumPy uint8 array of the forward-strand bases start..end"""
+        if np is None:
+            raise ImportError("SequenceStore.array requires numpy")
+        return np.frombuffer(self.view(name, start, end), dtype=np.uint8)
+
+    def sequence(self, region):
+        """Sequence of a region such as "7:140753316-140753356:-1" as a str, reverse complemented on the reverse strand"""
+        name, start, end, strand = parse_region(region)
+        bases = bytes(self.view(name, start, end))
+        if strand == -1:
+            bases = bases.translate(_COMPLEMENT)[::-1]
+        return bases.decode("ascii")
+
+    def regions(self):
+        """Stored regions in the order they were added"""
+        return [record for record, _, _ in self._records]
+
+    def close(self):
+        self._map = None
@@ -0,0 +1,124 @@
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r"\s*")
+_MORE = object()
+
+
+class JSONItemStream:
+    """Incremental JSON parser yielding the records of a response while its body is still arriving.
+    It yields the elements of a top-level array, or with `key` the elements of the array held by that member of a
+    top-level object (e.g. "species" for info/species), or without `key` the (name, value) members of a top-level object.
+    Only one record at a time is held in memory, however large the whole document is.
+
+        stream = JSONItemStream()
+        for chunk in chunks:
+            for record in stream.feed(chunk):
+                ...
+        for record in stream.close():
+            ...
+    """
+
+    def __init__(self, key=None):
+        self.key = key
+        self._decoder = json.JSONDecoder()
+        self._bytes = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._state = "start"
+        self._name = None
+
+    def feed(self, data):
+        """Add bytes of the document and return the records they complete"""
+        self._text = self._text[self._pos:] + self._bytes.decode(data)
+        self._pos = 0
+        return list(self._parse(final=False))
+
+    def close(self):
+        """Signal the end of the document and return its last records"""
+        self._text = self._text[self._pos:] + self._bytes.decode(b"", final=True)
+        self._pos = 0
+        records = list(self._parse(final=True))
+        if self._state != "done":
+            raise json.JSONDecodeError("Truncated JSON document", self._text, self._pos)
+        return records
+
+    def _peek(self):
+        self._pos = _WHITESPACE.match(self._text, self._pos).end()
+        return self._text[self._pos:self._pos + 1]
+
+    def _value(self, final):
+        try:
+            value, end = self._decoder.raw_decode(self._text, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _MORE
+        if not final and (end == len(self._text) or self._text[end] in ".eE+-"):
+            return _MORE  # a number might continue in the next chunk
+        self._pos = end
+        return value
+
+    def _expect(self, chars):
+        char = self._text[self._pos]
+        if char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self._text, self._pos)
+        self._pos += 1
+        return char
+
+    def _parse(self, final):
+        while True:
+            if self._state == "done":
+                self._pos = len(self._text)
+                return
+            char = self._peek()
+            if not char:
+                return
+            match self._state:
+                case "start":
+                    self._state = "first item" if self._expect("[{" if self.key is None else "{") == "[" else "first name"
+                case "first item" | "first name" if char in "]}":
+                    self._expect("]" if self._state == "first item" else "}")
+                    self._state = "done"
+                case "first item" | "item":
+                    value = self._value(final)
+                    if value is _MORE:
+                        return
+                    yield value
+                    self._state = "after item"
+                case "after item":
+                    self._state = "item" if self._expect(",]") == "," else "done"
+                case "first name" | "name":
+                    value = self._value(final)
+                    if value is _MORE:
+                        return
+                    self._name = value
+                    self._state = "colon"
+                case "colon":
+                    self._expect(":")
+                    self._state = "member"
+                case "member" if self.key is not None and self._name == self.key and char == "[":
+                    self._expect("[")
+                    self._state = "first item"
+                case "member":
+                    value = self._value(final)
+                    if value is _MORE:
+                        return
+                    if self.key is None:
+                        yield self._name, value
+                    elif self._name == self.key:
+                        yield value
+                        self._state = "done"
+                        continue
+                    self._state = "after member"
+                case "after member":
+                    self._state = "name" if self._expect(",}") == "," else "done"
+
+
+def iter_items(chunks, key=None):
+    """Yield the records of a JSON document given as an iterable of byte chunks; see JSONItemStream"""
+    stream = JSONItemStream(key)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
@@ -0,0 +1,82 @@
+import json
+import re
+
+# Largest region, in bases, each region endpoint accepts in one request.
+MAX_REGION_SIZE = {
+    "overlap": 5_000_000,
+    "sequence": 10_000_000,
+    "ld": 500_000,
+}
+
+_REGION = re.compile(r"^(?P<name>[^:]+):(?P<start>[\d,_]+)(?:-|\.\.)(?P<end>[\d,_]+)(?::(?P<strand>-?1))?$")
+
+
+def parse_region(region):
+    """Split a region such as "7:140424943-140624564" or "X:1000000..1000100:-1" into (name, start, end, strand)"""
+    match = _REGION.match(region)
+    if match is None:
+        raise ValueError(f"Region needs explicit coordinates, e.g. 7:140424943-140624564: {region!r}")
+    strand = match["strand"]
+    return (match["name"], int(re.sub(r"[,_]", "", match["start"])), int(re.sub(r"[,_]", "", match["end"])),
+            int(strand) if strand else None)
+
+
+def format_region(name, start, end, strand=None):
+    return f"{name}:{start}..{end}" + (f":{strand}" if strand is not None else "")
+
+
+def tile_region(region, size, overlap=0):
+    """Cut a region into consecutive windows of at most `size` bases, each overlapping the previous one by `overlap` bases"""
+    name, start, end, strand = parse_region(region)
+    if overlap >= size:
+        raise ValueError("overlap must be smaller than the tile size")
+    tiles, tile_start = [], start
+    while True:
+        tile_end = min(tile_start + size - 1, end)
+        tiles.append(format_region(name, tile_start, tile_end, strand))
+        if tile_end >= end:
+            return tiles
+        tile_start = tile_end + 1 - overlap
+
+
+def feature_identity(record):
+    """Key telling repeats of one feature record apart from distinct records. Stable IDs are not enough: every CDS piece of a
+    transcript carries its protein's ID and an exon is listed once per parent transcript, so the whole record is compared."""
+    return json.dumps(record, sort_keys=True)
+
+
+def merge_features(tiles):
+    """Concatenate the features of overlapping tiles, keeping the records of features that span a tile boundary once"""
+    seen, features = set(), []
+    for tile in tiles:
+        for feature in tile:
+            identity = feature_identity(feature)
+            if identity not in seen:
+                seen.add(identity)
+                features.append(feature)
+    return features
+
+
+def merge_ld(tiles):
+    """Concatenate the LD pairs of overlapping tiles, keeping each pair of variants once per population"""
+    seen, pairs = set(), []
+    for tile in tiles:
+        for pair in tile:
+            identity = (*sorted([pair.get("variation1"), pair.get("variation2")]), pair.get("population_name"))
+            if identity not in seen:
+                seen.add(identity)
+                pairs.append(pair)
+    return pairs
+
+
+def stitch_sequences(region, tiles):
+    """Join the sequence_region responses of the consecutive tiles of region into one response for the whole region"""
+    name, start, end, strand = parse_region(region)
+    # tiles of the reverse strand are each reverse complemented, so the last tile holds the start of the sequence
+    ordered = tiles[::-1] if strand == -1 else tiles
+    stitched = dict(tiles[0])
+    stitched["seq"] = "".join(tile["seq"] for tile in ordered)
+    stitched["query"] = region
+    if "id" in stitched:
+        stitched["id"] = ":".join([*stitched["id"].split(":")[:-3], str(start), str(end), str(strand or 1)])
+    return stitched
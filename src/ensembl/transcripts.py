@@ -0,0 +1,139 @@
+import numpy as np
+
+# Coordinate systems a TranscriptMapper converts from, with the server endpoint each one mirrors.
+COORDINATES = {
+    "cdna": "map_cdna",
+    "cds": "map_cds",
+    "translation": "map_translation",
+}
+
+
+class _Structure:
+    """Exons of one transcript in transcript order with their cumulative cDNA lengths, and where its CDS lies in cDNA"""
+
+    def __init__(self, record):
+        self.id = record["id"]
+        self.seq_region_name = str(record["seq_region_name"])
+        self.strand = record["strand"]
+        exons = sorted(record["Exon"], key=lambda exon: exon["start"] * self.strand)
+        self.starts = np.array([exon["start"] for exon in exons], dtype=np.int64)
+        self.ends = np.array([exon["end"] for exon in exons], dtype=np.int64)
+        self.cdna_ends = np.cumsum(self.ends - self.starts + 1)
+        self.length = int(self.cdna_ends[-1])
+        translation = record.get("Translation")
+        if translation:
+            first, last = (translation["start"], translation["end"]) if self.strand == 1 else (translation["end"], translation["start"])
+            self.coding_start, self.coding_end = self._cdna(first), self._cdna(last)
+        else:
+            self.coding_start = self.coding_end = None
+
+    def _cdna(self, position):
+        for i, (start, end) in enumerate(zip(self.starts, self.ends)):
+            if start <= position <= end:
+                return int(self.cdna_ends[i] - (end - start + 1)) + (position - start if self.strand == 1 else end - position) + 1
+        raise ValueError(f"{self.id}: CDS boundary {position} is not within an exon")
+
+    def to_cdna(self, coordinates, positions):
+        if coordinates == "cdna":
+            return positions
+        if self.coding_start is None:
+            raise ValueError(f"{self.id} is not protein coding")
+        if coordinates == "translation":
+            positions = positions * 3 - 2
+        return positions + self.coding_start - 1
+
+    def genomic(self, cdna):
+        """Genomic positions of cDNA positions, and whether each lies within the transcript"""
+        inside = (cdna >= 1) & (cdna <= self.length)
+        exon = np.minimum(np.searchsorted(self.cdna_ends, cdna, "left"), len(self.cdna_ends) - 1)
+        offset = cdna - (self.cdna_ends[exon] - (self.ends[exon] - self.starts[exon] + 1)) - 1
+        genomic = self.starts[exon] + offset if self.strand == 1 else self.ends[exon] - offset
+        return np.where(inside, genomic, 0), inside
+
+    def pieces(self, first, last):
+        """Genomic (start, end) pieces, in transcript order, of the cDNA range first..last clipped to the transcript"""
+        first, last = max(first, 1), min(last, self.length)
+        pieces = []
+        for exon in range(int(np.searchsorted(self.cdna_ends, first, "left")), len(self.cdna_ends)):
+            exon_first = int(self.cdna_ends[exon] - (self.ends[exon] - self.starts[exon]))
+            if exon_first > last:
+                break
+            (start, end), _ = self.genomic(np.array([max(first, exon_first), min(last, int(self.cdna_ends[exon]))]))
+            pieces.append((int(min(start, end)), int(max(start, end))))
+        return pieces
+
+
+class TranscriptMapper:
+    """Local conversion of cDNA, CDS and protein positions to genomic coordinates from transcript structures fetched once
+    with lookup_id(expand=1), instead of one map_cdna / map_cds / map_translation request per position.
+
+        mapper = TranscriptMapper.from_server(ensembl, ["ENST00000288602", "ENST00000269305"])
+        positions, mapped = mapper.to_genomic("translation", ids, residues)
+    """
+
+    def __init__(self, records=()):
+        self._structures = {}
+        self.add(records)
+
+    @classmethod
+    def from_server(cls, client, ids, concurrency=None):
+        """Fetch the structure of transcripts, or of every transcript of genes, by stable ID"""
+        return client._then(client.lookup_id(list(ids), expand=1, concurrency=concurrency), lambda records: cls(records.values()))
+
+    def add(self, records):
+        """Add lookup_id(expand=1) records of transcripts or of genes"""
+        for record in records:
+            if not record:
+                continue  # an ID the server did not find
+            for transcript in record.get("Transcript", [record]):
+                if transcript.get("Exon"):
+                    self._structures[transcript["id"]] = _Structure(transcript)
+        return self
+
+    def __contains__(self, id):
+        return id in self._structures
+
+    def __len__(self):
+        return len(self._structures)
+
+    def to_genomic(self, coordinates, ids, positions):
+        """Genomic positions of "cdna", "cds" or "translation" positions, given for one transcript ID or an array of IDs
+        parallel to positions; protein positions map to the first base of their codon. Returns the positions and whether
+        each one lies within its transcript."""
+        positions = np.atleast_1d(np.asarray(positions, dtype=np.int64))
+        if isinstance(ids, str):
+            structure = self._structures[ids]
+            return structure.genomic(structure.to_cdna(coordinates, positions))
+        ids = np.asarray(ids, dtype=object)
+        genomic, inside = np.zeros(len(positions), dtype=np.int64), np.zeros(len(positions), dtype=bool)
+        for id in np.unique(ids):
+            rows = ids == id
+            structure = self._structures[id]
+            genomic[rows], inside[rows] = structure.genomic(structure.to_cdna(coordinates, positions[rows]))
+        return genomic, inside
+
+    def map_region(self, coordinates, id, start, end=None):
+        """The mapped pieces of a "cdna", "cds" or "translation" range, in the form of the mappings of the server's answer"""
+        structure = self._structures[id]
+        end = start if end is None else end
+        first, last = structure.to_cdna(coordinates, np.array([start, end]))
+        if coordinates == "translation":
+            last += 2
+        return {"mappings": [{"seq_region_name": structure.seq_region_name, "start": piece_start, "end": piece_end, "strand": structure.strand,
+                              "coordinate_system": "chromosome", "gap": 0, "rank": 0}
+                             for piece_start, piece_end in structure.pieces(int(first), int(last))]}
+
+    def verify(self, client, coordinates, id, ranges, concurrency=None):
+        """Map (start, end) ranges of one transcript both locally and with the server; returns the (range, local, server)
+        triples whose mapped pieces disagree"""
+        ranges = [(start, end) for start, end in ranges]
+        method = getattr(client, COORDINATES[coordinates])
+
+        def pieces(response):
+            return [(mapping["start"], mapping["end"], mapping["strand"]) for mapping in response["mappings"] if not mapping.get("gap")]
+
+        def compare(responses):
+            local = [pieces(self.map_region(coordinates, id, start, end)) for start, end in ranges]
+            return [(r, mine, theirs) for r, mine, theirs in zip(ranges, local, map(pieces, responses)) if mine != theirs]
+
+        return client._then(client._gather(lambda r: method(id, f"{r[0]}..{r[1]}"), ranges, concurrency), compare)
@@ -0,0 +1,91 @@
+import gzip
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from . import checked, max_post_size, split_batch
+
+
+def _open(path):
+    with open(path, "rb") as file:
+        compressed = file.read(2) == b"\x1f\x8b"
+    return gzip.open(path, "rt") if compressed else open(path)
+
+
+def read_vcf(path):
+    """Lazily yield the (line number, fields) of the data lines of a VCF or (b)gzipped VCF file"""
+    with _open(path) as file:
+        for number, line in enumerate(file, 1):
+            if line.startswith("#") or not line.strip():
+                continue
+            yield number, line.rstrip("\n").split("\t")
+
+
+def vep_input(fields):
+    """The variant string vep_region's list overload expects for the fields of a VCF data line"""
+    return " ".join([*fields[:5], ".", ".", "."])
+
+
+def _chunks(records, size):
+    records = iter(records)
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+def _write_checkpoint(path, records, offset):
+    with open(path + ".tmp", "w") as file:
+        json.dump({"records": records, "offset": offset}, file)
+    os.replace(path + ".tmp", path)
+
+
+def annotate_vcf(client, path, output, species="human", batch_size=None, concurrency=None, max_pending=None, **kwargs):
+    """Annotate every record of a VCF with vep_region and write one JSON line per record, in input order, to output:
+    {"line": VCF line number, "input": variant string, "annotations": VEP results for it}.
+    Chunks of batch_size records (default: the server maximum) are sent over `concurrency` (default: max_workers)
+    threads with at most max_pending chunks (default: twice that) in flight, so memory stays bounded however large the
+    file is. Progress is checkpointed in output + ".checkpoint" after every chunk; running again after an interruption
+    resumes from there, and the checkpoint is removed once the whole file is written. A chunk the server rejects stops
+    the run with ChunkError before it is checkpointed, so it is sent again on resume. Extra keyword arguments are VEP
+    options. Returns the number of records written."""
+    batch_size = batch_size or max_post_size("vep")
+    workers = concurrency or client.max_workers
+    max_pending = max_pending or 2 * workers
+    checkpoint = output + ".checkpoint"
+    done, offset = 0, 0
+    if os.path.exists(checkpoint):
+        with open(checkpoint) as file:
+            state = json.load(file)
+        done, offset = state["records"], state["offset"]
+
+    def annotate(chunk):
+        variants = [vep_input(fields) for _, fields in chunk]
+        parts, _ = split_batch("vep", checked(client.vep_region(list(dict.fromkeys(variants)), species, concurrency=1, **kwargs)))
+        return [{"line": number, "input": variant, "annotations": parts.get(variant, [])} for (number, _), variant in zip(chunk, variants)]
+
+    with open(output, "r+b" if done else "wb") as out, ThreadPoolExecutor(workers) as executor:
+        out.truncate(offset)
+        out.seek(offset)
+        pending = deque()
+
+        def write(results):
+            nonlocal done
+            out.write(b"".join(json.dumps(result).encode() + b"\n" for result in results))
+            out.flush()
+            done += len(results)
+            _write_checkpoint(checkpoint, done, out.tell())
+
+        try:
+            for chunk in _chunks(islice(read_vcf(path), done, None), batch_size):
+                if len(pending) >= max_pending:
+                    write(pending.popleft().result())
+                pending.append(executor.submit(annotate, chunk))
+            while pending:
+                write(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    return done
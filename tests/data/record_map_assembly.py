@@ -0,0 +1,37 @@
+"""Re-record map_assembly.json from a live server: the map_assembly responses of the tiles Liftover.from_server fetches
+for the given chromosome lengths, and of the query regions the liftover tests compare map_region against.
+The checked-in fixture is synthetic until this has been run; its "source" says which it is.
+
+    python tests/data/record_map_assembly.py
+"""
+import datetime
+import json
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "..", "src"))
+
+from ensembl import Ensembl  # noqa: E402
+from ensembl.tiling import format_region, tile_region  # noqa: E402
+
+
+def main():
+    path = os.path.join(HERE, "map_assembly.json")
+    with open(path) as file:
+        fixture = json.load(file)
+    ensembl = Ensembl(assembly=fixture["asm_one"])
+
+    def record(region):
+        return ensembl.map_assembly(fixture["species"], fixture["asm_one"], region, fixture["asm_two"])
+
+    fixture["tiles"] = {tile: record(tile) for name, length in fixture["lengths"].items()
+                        for tile in tile_region(format_region(name, 1, length), fixture["tile_size"])}
+    fixture["queries"] = {region: record(region) for region in fixture["queries"]}
+    fixture["source"] = f"recorded from {ensembl.server} on {datetime.date.today()}"
+    with open(path, "w") as file:
+        json.dump(fixture, file, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+from ensembl import BatchError, ChunkError, Ensembl
+from ensembl.cache import ResponseCache
+from mock_server import MockServer
+
+VARIANTS = [f"rs{i}" for i in range(450)]
+IDS = [f"ENSG{i:011d}" for i in range(2500)]
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockServer() as server:
+        yield server
+
+
+@pytest.fixture
+def ensembl(server):
+    ensembl = Ensembl()
+    ensembl.server = server.url
+    yield ensembl
+    ensembl.close()
+
+
+def test_list_chunks_are_merged(ensembl, server):
+    server.reset()
+    result = ensembl.vep_id(VARIANTS)
+    assert server.requests == 3
+    assert [record["input"] for record in result] == VARIANTS
+
+
+def test_dict_chunks_are_merged(ensembl, server):
+    server.reset()
+    result = ensembl.lookup_id(IDS)
+    assert server.requests == 3
+    assert list(result) == IDS and all(result[id]["id"] == id for id in IDS)
+
+
+def test_rejected_chunk_raises(ensembl):
+    variants = [*VARIANTS[:300], "bad", *VARIANTS[301:]]
+    with pytest.raises(BatchError) as info:
+        ensembl.vep_id(variants)
+    [(chunk, error)] = info.value.errors
+    assert chunk == variants[200:400]
+    assert isinstance(error, ChunkError) and error.body == {"error": "No variant found with ID 'bad'"}
+    assert [record["input"] for record in info.value.results] == variants[:200] + variants[400:]
+
+
+def test_concurrent_chunks_keep_input_order(server):
+    ensembl = Ensembl(max_workers=4)
+    ensembl.server = server.url
+    server.latency, server.jitter = 0.0, 0.02
+    try:
+        variants = VARIANTS * 2
+        assert [record["input"] for record in ensembl.vep_id(variants, concurrency=5)] == variants
+        assert [record["input"] for record in ensembl.vep_id(variants)] == variants
+    finally:
+        server.jitter = 0.0
+        ensembl.close()
+
+
+def test_concurrent_failure_keeps_other_chunks(server):
+    ensembl = Ensembl(max_workers=4)
+    ensembl.server = server.url
+    variants = [*VARIANTS, *VARIANTS[:150]]
+    variants[450] = "bad"
+    try:
+        with pytest.raises(BatchError) as info:
+            ensembl.vep_id(variants)
+    finally:
+        ensembl.close()
+    assert [chunk for chunk, _ in info.value.errors] == [variants[400:600]]
+    assert [record["input"] for record in info.value.results] == variants[:400]
+
+
+def test_threads_share_one_worker_pool(server):
+    ensembl = Ensembl(max_workers=4)
+    ensembl.server = server.url
+    executors = set()
+    barrier = threading.Barrier(8)
+    original = ensembl._map
+
+    def map(*args, **kwargs):
+        barrier.wait()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            executors.add(ensembl._executor)
+
+    ensembl._map = map
+    threads = [threading.Thread(target=ensembl.vep_id, args=(VARIANTS,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ensembl.close()
+    assert len(executors) == 1 and ensembl._executor is None
+
+
+@pytest.fixture
+def cached(server, tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    ensembl = Ensembl(cache=cache)
+    ensembl.server = server.url
+    yield ensembl
+    ensembl.close()
+    cache.close()
+
+
+def test_rerun_only_posts_missing_items(cached, server):
+    cached.vep_id(VARIANTS[:300])
+    server.reset()
+    posted = []
+    original = cached._post_chunks
+    cached._post_chunks = lambda endpoint, key, items, *args, **kwargs: posted.append(items) or original(endpoint, key, items, *args, **kwargs)
+    result = cached.vep_id(VARIANTS)
+    assert posted == [VARIANTS[300:]] and server.requests == 1
+    assert [record["input"] for record in result] == VARIANTS
+    server.reset()
+    assert cached.vep_id(VARIANTS) == result and server.requests == 0
+
+
+def test_error_body_is_returned_and_not_cached(cached, server):
+    assert cached.vep_id(["rs1", "bad"]) == {"error": "No variant found with ID 'bad'"}
+    server.reset()
+    assert [record["input"] for record in cached.vep_id(["rs1"])] == ["rs1"]
+    assert server.requests == 1
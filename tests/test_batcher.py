@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from ensembl import ChunkError, Ensembl
+from mock_server import MockServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockServer() as server:
+        yield server
+
+
+@pytest.fixture
+def ensembl(server):
+    ensembl = Ensembl(max_workers=4)
+    ensembl.server = server.url
+    yield ensembl
+    ensembl.close()
+
+
+def call_from_threads(fn, items):
+    outcomes = {}
+
+    def call(item):
+        try:
+            outcomes[item] = fn(item)
+        except Exception as error:
+            outcomes[item] = error
+
+    threads = [threading.Thread(target=call, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_calls_in_one_window_share_a_request(ensembl, server):
+    batcher = ensembl.micro_batcher(window=0.2)
+    server.reset()
+    outcomes = call_from_threads(batcher.vep_id, ["rs1", "rs2", "rs3"])
+    assert {item: [record["input"] for record in records] for item, records in outcomes.items()} == {item: [item] for item in outcomes}
+    assert server.requests == 1
+
+
+def test_batch_is_sent_when_max_items_is_reached(ensembl, server):
+    batcher = ensembl.micro_batcher(window=30, max_items=2)
+    server.reset()
+    started = time.monotonic()
+    outcomes = call_from_threads(batcher.lookup_id, ["ENSG00000000001", "ENSG00000000002"])
+    assert time.monotonic() - started < 5
+    assert {item: gene["id"] for item, gene in outcomes.items()} == {item: item for item in outcomes}
+    assert server.requests == 1
+
+
+def test_rejected_batch_only_fails_the_bad_item(ensembl):
+    batcher = ensembl.micro_batcher(window=0.2)
+    outcomes = call_from_threads(batcher.vep_id, ["rs1", "rs2", "bad"])
+    assert [record["input"] for record in outcomes["rs1"]] == ["rs1"]
+    assert [record["input"] for record in outcomes["rs2"]] == ["rs2"]
+    assert isinstance(outcomes["bad"], ChunkError) and outcomes["bad"].body == {"error": "No variant found with ID 'bad'"}
+
+
+def test_rejected_single_item(ensembl):
+    with pytest.raises(ChunkError):
+        ensembl.micro_batcher().vep_id("bad")
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+
+import pytest
+
+from ensembl.coalesce import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    flight, started, release, calls = SingleFlight(), threading.Event(), threading.Event(), []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"release": 110}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", call)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do("key", call))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+    assert calls == [1] and results == [{"release": 110}] * 4
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_error_reaches_every_caller():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+
+    def call():
+        started.set()
+        release.wait()
+        raise ConnectionError("reset")
+
+    errors = []
+
+    def caller():
+        try:
+            flight.do("key", call)
+        except ConnectionError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=caller)]
+    threads[0].start()
+    started.wait()
+    threads.append(threading.Thread(target=caller))
+    threads[1].start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 2
+
+
+def test_async_calls_share_one_run():
+    async def main():
+        flight, calls = SingleFlight(), []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"release": 110}
+
+        results = await asyncio.gather(*(flight.do_async("key", call) for _ in range(4)))
+        return calls, results, flight._tasks
+
+    calls, results, tasks = asyncio.run(main())
+    assert calls == [1] and results == [{"release": 110}] * 4 and tasks == {}
+
+
+def test_cancelling_the_first_async_caller_spares_the_others():
+    async def main():
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.05)
+            return {"release": 110}
+
+        first = asyncio.ensure_future(asyncio.wait_for(flight.do_async("key", call), 0.01))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_async("key", call))
+        with pytest.raises(asyncio.TimeoutError):
+            await first
+        return await follower
+
+    assert asyncio.run(main()) == {"release": 110}
+
+
+def test_async_error_reaches_every_caller():
+    async def main():
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("reset")
+
+        return await asyncio.gather(*(flight.do_async("key", call) for _ in range(2)), return_exceptions=True)
+
+    assert [type(outcome) for outcome in asyncio.run(main())] == [ConnectionError, ConnectionError]
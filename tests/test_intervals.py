@@ -0,0 +1,67 @@
+import random
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ensembl.intervals import IntervalIndex  # noqa: E402
+
+
+def features(count, seed=0):
+    rng = random.Random(seed)
+    found = []
+    for i in range(count):
+        start = rng.randint(1, 1_000_000)
+        # a mix of insertions (end == start - 1), SNVs, exons and long genes
+        end = start + rng.choice([-1, 0, rng.randint(1, 500), rng.randint(1000, 200_000)])
+        found.append({"feature_type": "variation", "id": f"rs{i}", "seq_region_name": rng.choice(["7", "X"]), "start": start, "end": end})
+    return found
+
+
+def brute_force(features, seq_region, start, end):
+    return [feature for feature in features if feature["seq_region_name"] == seq_region and feature["start"] <= end and feature["end"] >= start]
+
+
+@pytest.fixture(scope="module")
+def indexed():
+    found = features(3000)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        index = IntervalIndex(found)
+        index.count("7", [1])
+        index.count("X", [1])
+    return found, index
+
+
+def test_queries_match_a_scan(indexed):
+    found, index = indexed
+    rng = random.Random(1)
+    for _ in range(200):
+        seq_region, start = rng.choice(["7", "X"]), rng.randint(1, 1_000_000)
+        end = start + rng.randint(0, 5000)
+        assert index.overlapping(seq_region, start, end) == brute_force(found, seq_region, start, end)
+    starts = np.array([rng.randint(1, 1_000_000) for _ in range(500)])
+    assert list(index.count("7", starts)) == [len(brute_force(found, "7", start, start)) for start in starts]
+
+
+def test_insertions_are_found_between_their_flanking_bases():
+    index = IntervalIndex([{"id": "ins", "seq_region_name": "1", "start": 101, "end": 100}])
+    assert [feature["id"] for feature in index.overlapping("1", 100, 101)] == ["ins"]
+
+
+def test_features_are_added_once(indexed):
+    found, _ = indexed
+    index = IntervalIndex(found[:100]).add(found[50:150]).add([dict(reversed(found[0].items()))])
+    assert index.features == found[:150]
+
+
+def test_save_and_load(indexed, tmp_path):
+    found, index = indexed
+    index.save(tmp_path / "index.npz")
+    loaded = IntervalIndex.load(tmp_path / "index.npz")
+    assert loaded.features == index.features
+    assert loaded.region("7:400000-500000") == index.region("7:400000-500000")
+    extra = {"feature_type": "variation", "id": "rs_new", "seq_region_name": "Y", "start": 10, "end": 10}
+    assert len(loaded.add([found[0], extra])) == len(found) + 1
+    assert loaded.overlapping("Y", 10) == [extra]
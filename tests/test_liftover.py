@@ -0,0 +1,82 @@
+import json
+import os
+
+import pytest
+
+from ensembl import Ensembl
+
+pytest.importorskip("numpy")
+
+from ensembl.liftover import Liftover  # noqa: E402
+
+# Unless FIXTURE["source"] says it was recorded, the expected answers are synthetic and these tests do not show parity with the server
+with open(os.path.join(os.path.dirname(__file__), "data", "map_assembly.json")) as file:
+    FIXTURE = json.load(file)
+
+FIELDS = ("seq_region_name", "start", "end", "strand", "coord_system")
+
+
+@pytest.fixture(scope="module")
+def liftover():
+    ensembl = Ensembl(assembly=FIXTURE["asm_one"])
+    ensembl.map_assembly = lambda species, asm_one, region, asm_two: FIXTURE["tiles"][region]
+    return Liftover.from_server(ensembl, FIXTURE["species"], FIXTURE["asm_one"], FIXTURE["asm_two"], FIXTURE["lengths"], FIXTURE["tile_size"])
+
+
+def blocks(response):
+    return [tuple(mapping[side][field] for side in ("original", "mapped") for field in FIELDS) for mapping in response["mappings"]]
+
+
+@pytest.mark.parametrize("region", list(FIXTURE["queries"]))
+def test_map_region_matches_fixture(liftover, region):
+    assert blocks(liftover.map_region(region)) == blocks(FIXTURE["queries"][region])
+
+
+def test_blocks_cut_at_tile_boundaries_are_merged(liftover):
+    response = liftover.map_region("X:1000000..1000100:1")
+    assert blocks(response) == [("X", 1000000, 1000100, 1, "chromosome", "X", 1039265, 1039365, 1, "chromosome")]
+    assert len(liftover.map_region("X:1499900..1500100:1")["mappings"]) == 1
+
+
+@pytest.mark.parametrize("region", list(FIXTURE["queries"]))
+def test_map_positions_matches_fixture(liftover, region):
+    name, span, strand = region.split(":")
+    start, end = map(int, span.split(".."))
+    positions = range(start, end + 1)
+    names, lifted, strands, mapped = liftover.map_positions(name, positions, int(strand))
+    expected = {}
+    for mapping in FIXTURE["queries"][region]["mappings"]:
+        original, target = mapping["original"], mapping["mapped"]
+        for position in range(original["start"], original["end"] + 1):
+            offset = position - original["start"]
+            expected[position] = (target["seq_region_name"], target["start"] + offset if target["strand"] * original["strand"] == 1
+                                  else target["end"] - offset, target["strand"])
+    assert {position: (names[i], int(lifted[i]), int(strands[i])) for i, position in enumerate(positions) if mapped[i]} == expected
+    assert all(names[i] is None and lifted[i] == 0 and strands[i] == 0 for i, position in enumerate(positions) if not mapped[i])
+
+
+def test_reverse_strand(liftover):
+    names, lifted, strands, mapped = liftover.map_positions("X", [1500000, 1500001], strand=1)
+    assert list(names) == ["X", "X"] and list(lifted) == [1439766, 1439765] and list(strands) == [-1, -1]
+    names, lifted, strands, mapped = liftover.map_positions("X", [1500000, 1500001], strand=-1)
+    assert list(lifted) == [1439766, 1439765] and list(strands) == [1, 1]
+
+
+def test_unmapped(liftover):
+    names, lifted, strands, mapped = liftover.map_positions("X", [1, 60000, 60001, 1200250, 2000000, 2000001])
+    assert list(mapped) == [False, False, True, False, True, False]
+    assert list(names) == [None, None, "X", None, "X", None] and list(lifted) == [0, 0, 99266, 0, 2039265, 0]
+    assert not liftover.map_positions("Y", [100])[3].any()
+    assert liftover.map_region("X:1..100") == {"mappings": []}
+
+
+def test_other_seq_region(liftover):
+    names, lifted, strands, mapped = liftover.map_positions("X", [1700005])
+    assert (names[0], lifted[0], strands[0]) == ("KI270880.1", 5, 1)
+
+
+def test_save_and_load(liftover, tmp_path):
+    liftover.save(tmp_path / "liftover.npz")
+    loaded = Liftover.load(tmp_path / "liftover.npz")
+    for region in FIXTURE["queries"]:
+        assert blocks(loaded.map_region(region)) == blocks(liftover.map_region(region))
@@ -0,0 +1,57 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from ensembl.ratelimit import RateLimiter, retry_after_seconds
+
+
+def test_burst_then_paced_at_rate():
+    limiter = RateLimiter(rate=10, burst=3)
+    delays = [limiter.reserve() for _ in range(6)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
+def test_acquire_waits_for_a_token():
+    limiter = RateLimiter(rate=20, burst=1)
+    limiter.acquire()
+    started = time.monotonic()
+    assert limiter.acquire() == pytest.approx(0.05, abs=0.01)
+    assert time.monotonic() - started >= 0.04
+
+
+def test_remaining_budget_lowers_the_rate():
+    limiter = RateLimiter(rate=15)
+    assert not limiter.update(200, {"X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "10"})
+    assert limiter.rate == 3
+    limiter.update(200, {"X-RateLimit-Remaining": "5000", "X-RateLimit-Reset": "10"})
+    assert limiter.rate == 15
+
+
+def test_exhausted_budget_pauses_until_reset():
+    limiter = RateLimiter(rate=15)
+    limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2.5"})
+    assert limiter.reserve() == pytest.approx(2.5, abs=0.05)
+
+
+@pytest.mark.parametrize("retry_after", [lambda: "3", lambda: "3.0", lambda: formatdate(time.time() + 3, usegmt=True),
+                                         lambda: formatdate(time.time() + 3)])
+def test_retry_after_pauses_every_caller(retry_after):
+    limiter = RateLimiter(rate=15)
+    assert limiter.update(429, {"Retry-After": retry_after()})
+    assert [limiter.reserve() for _ in range(2)] == pytest.approx([3, 3], abs=1.05)
+
+
+def test_retry_after_forms():
+    assert retry_after_seconds("120") == 120
+    assert retry_after_seconds(formatdate(time.time() + 60, usegmt=True)) == pytest.approx(60, abs=1.5)
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert retry_after_seconds("-5") == 0
+    assert retry_after_seconds("soon") is None
+
+
+def test_unparseable_retry_after_is_ignored():
+    limiter = RateLimiter(rate=15)
+    assert limiter.update(429, {"Retry-After": "soon"})
+    assert limiter.reserve() == 0
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+import requests
+
+from ensembl import Ensembl
+from ensembl.ratelimit import RateLimiter
+from ensembl.retry import RetryPolicy
+from mock_server import MockServer
+
+FAST = dict(backoff=0.001, max_backoff=0.005)
+
+
+def client(server, **kwargs):
+    spans = []
+    ensembl = Ensembl(rate_limiter=RateLimiter(rate=1000), hooks={"response": [spans.append]}, **kwargs)
+    ensembl.server = server.url
+    return ensembl, spans
+
+
+def test_delay_doubles_up_to_max_backoff():
+    policy = RetryPolicy(backoff=0.5, max_backoff=3, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(1, 6)] == [0.5, 1, 2, 3, 3]
+    jittered = RetryPolicy(backoff=0.5, max_backoff=3)
+    assert all(0 <= jittered.delay(attempt) <= min(3, 0.5 * 2 ** (attempt - 1)) for attempt in range(1, 6) for _ in range(50))
+
+
+def test_allows_up_to_max_attempts_and_deadline():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.allows(2, time.monotonic()) and not policy.allows(3, time.monotonic())
+    policy = RetryPolicy(max_attempts=100, deadline=1.0)
+    assert policy.allows(1, time.monotonic(), delay=0.5)
+    assert not policy.allows(1, time.monotonic(), delay=1.5) and not policy.allows(1, time.monotonic() - 2)
+
+
+def test_transient_errors_are_retried():
+    with MockServer(error_rate=0.5, retry_after=0.01, seed=1) as server:
+        ensembl, spans = client(server, retry=RetryPolicy(max_attempts=30, **FAST))
+        ids = [f"ENSG{i:011d}" for i in range(20)]
+        assert [ensembl.lookup_id(id)["id"] for id in ids] == ids
+    assert server.requests == sum(span["attempts"] for span in spans) > len(ids)
+    assert all(span["status"] == 200 for span in spans)
+
+
+def test_gives_up_after_max_attempts():
+    with MockServer(error_rate=1.0, retry_after=0.01) as server:
+        ensembl, spans = client(server, retry=RetryPolicy(max_attempts=3, **FAST))
+        with pytest.raises(requests.HTTPError):
+            ensembl.lookup_id("ENSG00000157764")
+    assert server.requests == 3 and spans[0]["attempts"] == 3
+
+
+def test_gives_up_at_the_deadline():
+    with MockServer(error_rate=1.0, retry_after=0.05) as server:
+        ensembl, _ = client(server, retry=RetryPolicy(max_attempts=1000, backoff=0.05, jitter=False, deadline=0.3))
+        started = time.monotonic()
+        with pytest.raises(requests.HTTPError):
+            ensembl.lookup_id("ENSG00000157764")
+    assert time.monotonic() - started < 1.0 and 2 <= server.requests < 20
+
+
+def test_retry_after_pauses_instead_of_backing_off():
+    with MockServer(retry_after=0.2) as server:
+        server.failures.extend([503, 429])
+        ensembl, spans = client(server, retry=RetryPolicy(backoff=0.01, jitter=False))
+        assert ensembl.lookup_id("ENSG00000157764")["id"] == "ENSG00000157764"
+    [span] = spans
+    assert span["attempts"] == 3 and span["status"] == 200
+    assert span["retry_wait"] == pytest.approx(0.01) and span["rate_limit_wait"] >= 0.15
+
+
+def test_non_retryable_status_is_returned_at_once():
+    with MockServer() as server:
+        ensembl, spans = client(server, retry=RetryPolicy(**FAST))
+        assert ensembl.vep_id(["bad"]) == {"error": "No variant found with ID 'bad'"}
+    assert server.requests == 1 and spans[0]["status"] == 400
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+import requests
+
+from ensembl import Ensembl
+from ensembl.stream import JSONItemStream, iter_items
+from mock_server import MockServer
+
+RECORDS = [{"id": "ENSG00000157764", "start": 140719327, "end": 140924929, "strand": -1, "score": 1.5e-3, "name": "BRAF é☃"},
+           [], {}, -12, 0.25, 3e10, True, False, None, "a \"quoted\" string, with [brackets] and {braces}", [1, [2, [3]]]]
+DOCUMENT = json.dumps(RECORDS).encode()
+
+
+def split_at(data, *cuts):
+    bounds = [0, *cuts, len(data)]
+    return [data[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def parse(chunks, key=None):
+    return list(iter_items(chunks, key))
+
+
+@pytest.mark.parametrize("cut", range(len(DOCUMENT) + 1))
+def test_split_at_every_byte(cut):
+    assert parse(split_at(DOCUMENT, cut)) == RECORDS
+
+
+def test_one_byte_chunks():
+    assert parse(DOCUMENT[i:i + 1] for i in range(len(DOCUMENT))) == RECORDS
+
+
+def test_whitespace_between_tokens():
+    document = json.dumps(RECORDS, indent=4).encode()
+    assert parse(document[i:i + 3] for i in range(0, len(document), 3)) == RECORDS
+
+
+@pytest.mark.parametrize("number", [b"12345", b"-12345", b"1.25", b"1e10", b"-1.5E-7", b"0"])
+def test_numbers_cut_mid_token(number):
+    document = b"[" + number + b"," + number + b"]"
+    expected = [json.loads(number)] * 2
+    for cut in range(len(document) + 1):
+        assert parse(split_at(document, cut)) == expected
+    assert parse(document[i:i + 1] for i in range(len(document))) == expected
+
+
+@pytest.mark.parametrize("literal", [b"true", b"false", b"null"])
+def test_literals_cut_mid_token(literal):
+    document = b"[" + literal + b"," + literal + b"]"
+    for cut in range(len(document) + 1):
+        assert parse(split_at(document, cut)) == [json.loads(literal)] * 2
+
+
+def test_multibyte_characters_cut_mid_sequence():
+    document = json.dumps(["é☃\U0001f9ec"], ensure_ascii=False).encode()
+    for cut in range(len(document) + 1):
+        assert parse(split_at(document, cut)) == ["é☃\U0001f9ec"]
+
+
+def test_records_are_yielded_as_they_complete():
+    stream = JSONItemStream()
+    assert stream.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert stream.feed(b': 2}, 3') == [{"b": 2}]
+    assert stream.feed(b"]") == [3]
+    assert stream.close() == []
+
+
+@pytest.mark.parametrize("document", [b"[]", b"  [ ]  ", b"{}"])
+def test_empty_documents(document):
+    assert parse([document]) == []
+
+
+def test_object_members():
+    document = json.dumps({"homo_sapiens": {"release": 110}, "mus_musculus": [1, 2], "count": 2}).encode()
+    for cut in range(len(document) + 1):
+        assert parse(split_at(document, cut)) == [("homo_sapiens", {"release": 110}), ("mus_musculus", [1, 2]), ("count", 2)]
+
+
+KEYED = json.dumps({"count": 3, "meta": {"species": ["not", "these"]}, "species": [{"name": "human"}, {"name": "mouse"}, 7], "after": 1}).encode()
+
+
+@pytest.mark.parametrize("cut", range(len(KEYED) + 1))
+def test_keyed_split_at_every_byte(cut):
+    assert parse(split_at(KEYED, cut), "species") == [{"name": "human"}, {"name": "mouse"}, 7]
+
+
+def test_keyed_member_that_is_not_an_array():
+    assert parse([b'{"other": 1, "species": {"name": "human"}}'], "species") == [{"name": "human"}]
+
+
+def test_keyed_member_missing():
+    assert parse([b'{"other": [1, 2]}'], "species") == []
+
+
+def test_keyed_needs_an_object():
+    with pytest.raises(json.JSONDecodeError):
+        parse([b"[1, 2]"], "species")
+
+
+@pytest.mark.parametrize("cut", range(1, len(DOCUMENT)))
+def test_truncated_document(cut):
+    with pytest.raises(json.JSONDecodeError):
+        parse([DOCUMENT[:cut]])
+
+
+@pytest.mark.parametrize("document", [b"", b"[1, 2", b"[1, 2,", b'[{"a": 1}', b'{"species": [1', b"[tru", b"[1.", b"[-"])
+def test_truncated_documents(document):
+    with pytest.raises(json.JSONDecodeError):
+        parse([document])
+
+
+def test_truncated_keyed_document():
+    for cut in range(1, KEYED.index(b"7]") + 1):
+        with pytest.raises(json.JSONDecodeError):
+            parse([KEYED[:cut]], "species")
+
+
+@pytest.mark.parametrize("document", [b"[1 2]", b"[1,, 2]", b'{"a" 1}', b"1"])
+def test_malformed_documents(document):
+    with pytest.raises(json.JSONDecodeError):
+        parse([document])
+
+
+def test_iter_get_raises_for_error_status():
+    with MockServer() as server:
+        ensembl = Ensembl()
+        ensembl.server = server.url
+        assert list(ensembl.iter_get("overlap/region/human/7:1-1000", {}))
+        with pytest.raises(requests.HTTPError):
+            list(ensembl.iter_get("no/such/endpoint", {}))
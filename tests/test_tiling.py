@@ -0,0 +1,61 @@
+import pytest
+
+from ensembl import BatchError, ChunkError, Ensembl
+from ensembl.tiling import merge_features
+from mock_server import LENGTHS, MockServer
+
+GENE = {"feature_type": "gene", "id": "ENSG00000157764", "seq_region_name": "7", "start": 140719327, "end": 140924929}
+CDS = [{"feature_type": "cds", "id": "ENSP00000493543", "Parent": "ENST00000646891", "seq_region_name": "7", "start": start, "end": end}
+       for start, end in [(140734597, 140734770), (140739812, 140739946), (140749318, 140749418)]]
+EXONS = [{"feature_type": "exon", "id": "ENSE00001920308", "Parent": parent, "seq_region_name": "7", "start": 140924566, "end": 140924929}
+         for parent in ("ENST00000646891", "ENST00000288602")]
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockServer() as server:
+        yield server
+
+
+def test_records_sharing_an_id_are_kept():
+    assert merge_features([[GENE, *CDS, *EXONS]]) == [GENE, *CDS, *EXONS]
+
+
+def test_features_spanning_tiles_are_kept_once():
+    assert merge_features([[GENE, CDS[0]], [dict(reversed(GENE.items())), *CDS[1:], *EXONS]]) == [GENE, *CDS, *EXONS]
+
+
+def test_bare_sequence_name_covers_the_whole_sequence(server):
+    ensembl = Ensembl()
+    ensembl.server = server.url
+    tiled = []
+    ensembl.overlap_region = lambda species, region, **kwargs: tiled.append(region) or [GENE]
+    assert ensembl.overlap_region_tiled("human", "7") == [GENE]
+    assert tiled == [f"7:{start}..{min(start + 4_999_999, LENGTHS['7'])}" for start in range(1, LENGTHS["7"] + 1, 5_000_000)]
+    with pytest.raises(ValueError, match="Unknown sequence region 'Z'"):
+        ensembl.overlap_region_tiled("human", "Z")
+
+
+REJECTED = {"error": "Something went wrong"}
+
+
+def assert_second_tile_rejected(info):
+    [(tile, error)] = info.value.errors
+    assert tile == "7:5000001..10000000" and isinstance(error, ChunkError) and error.body == REJECTED
+
+
+def test_rejected_overlap_tile_raises():
+    ensembl = Ensembl()
+    ensembl.overlap_region = lambda species, region, **kwargs: REJECTED if region == "7:5000001..10000000" else [GENE]
+    with pytest.raises(BatchError) as info:
+        ensembl.overlap_region_tiled("human", "7:1..12000000")
+    assert_second_tile_rejected(info)
+    assert info.value.results == [[GENE], [GENE]]
+
+
+def test_rejected_sequence_tile_raises():
+    ensembl = Ensembl()
+    ensembl.sequence_region = lambda region, species, **kwargs: REJECTED if region == "7:5000001..10000000" else {"seq": "ACGT"}
+    with pytest.raises(BatchError) as info:
+        ensembl.sequence_region_tiled("7:1..12000000", "human", tile_size=5_000_000)
+    assert_second_tile_rejected(info)
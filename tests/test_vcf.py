@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+
+from ensembl import ChunkError, Ensembl
+from ensembl.vcf import annotate_vcf
+from mock_server import MockServer
+
+VCF = "##fileformat=VCFv4.2\n#CHROM\tPOS\tID\tREF\tALT\n" + "".join(f"7\t{140753336 + i}\trs{i}\tA\tT\n" for i in range(5))
+
+
+@pytest.fixture
+def ensembl():
+    with MockServer() as server:
+        ensembl = Ensembl()
+        ensembl.server = server.url
+        yield ensembl
+        ensembl.close()
+
+
+def lines(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+def test_rejected_chunk_stops_before_checkpoint_and_resumes(ensembl, tmp_path):
+    vcf, output = tmp_path / "input.vcf", str(tmp_path / "output.jsonl")
+    vcf.write_text(VCF)
+    vep_region = ensembl.vep_region
+    ensembl.vep_region = lambda variants, *args, **kwargs: ({"error": "Unable to parse"} if any("rs3" in variant for variant in variants) else
+                                                             vep_region(variants, *args, **kwargs))
+    with pytest.raises(ChunkError):
+        annotate_vcf(ensembl, str(vcf), output, batch_size=2)
+    assert [line["line"] for line in lines(output)] == [3, 4]
+    with open(output + ".checkpoint") as file:
+        assert json.load(file) == {"records": 2, "offset": os.path.getsize(output)}
+
+    ensembl.vep_region = vep_region
+    assert annotate_vcf(ensembl, str(vcf), output, batch_size=2) == 5
+    assert not os.path.exists(output + ".checkpoint")
+    results = lines(output)
+    assert [line["line"] for line in results] == [3, 4, 5, 6, 7]
+    assert all([annotation["input"] for annotation in line["annotations"]] == [line["input"]] for line in results)